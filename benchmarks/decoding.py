@@ -0,0 +1,186 @@
+"""Compares the CPU time spent on decoding large list responses.
+
+The baseline decodes the response body into Python objects first and validates them afterwards. The current pipeline
+validates the raw response bytes directly. Deduplication validates nested resources which are included many times only
+once. The lazy result mode only validates the resources that are accessed and the trusted result modes skip validation
+entirely. Run it from the repository root with::
+
+    python benchmarks/decoding.py --size 1000 --repeat 20
+"""
+
+import argparse
+import timeit
+import typing as t
+import uuid
+
+import httpx2 as httpx
+
+from flame_hub._base_client import ResourceList, _parse_resource_list
+from flame_hub.models import Analysis, AnalysisNode, Log
+
+
+def analysis_payload(i: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"analysis-{i}",
+        "displayName": f"Analysis {i}",
+        "description": "An analysis which was created for benchmarking.",
+        "projectId": str(uuid.uuid4()),
+        "masterImageId": str(uuid.uuid4()),
+        "registryId": None,
+        "imageCommandArguments": [{"value": "--verbose", "position": "after"}],
+        "nodes": 3,
+        "nodesApproved": 2,
+        "configurationLocked": True,
+        "configurationEntrypointValid": True,
+        "configurationImageValid": True,
+        "configurationNodeAggregatorValid": True,
+        "configurationNodeDefaultValid": True,
+        "configurationNodesValid": True,
+        "buildStatus": "executed",
+        "buildNodesValid": True,
+        "buildProgress": 100,
+        "buildHash": "sha256:" + "0" * 64,
+        "buildOs": "linux",
+        "buildSize": 123456789,
+        "distributionStatus": "executed",
+        "distributionProgress": 100,
+        "executionStatus": None,
+        "executionProgress": None,
+        "createdAt": "2025-05-12T09:44:08.284Z",
+        "updatedAt": "2025-05-12T09:44:08.284Z",
+        "realmId": str(uuid.uuid4()),
+        "userId": str(uuid.uuid4()),
+        "clientId": None,
+    }
+
+
+def log_payload(i: int) -> dict:
+    return {
+        "time": str(1747043048284000000 + i),
+        "message": f"Processed batch {i} of the analysis.",
+        "service": "hub-server-core",
+        "channel": "system",
+        "level": "info",
+        "labels": {"analysisId": str(uuid.uuid4()), "nodeId": str(uuid.uuid4()), "traceId": None},
+    }
+
+
+def node_payload(i: int) -> dict:
+    return {
+        "id": str(uuid.UUID(int=i)),
+        "name": f"node-{i}",
+        "externalName": None,
+        "hidden": False,
+        "realmId": str(uuid.UUID(int=i)),
+        "registryId": None,
+        "type": "default",
+        "publicKey": None,
+        "online": True,
+        "registryProjectId": None,
+        "clientId": None,
+        "createdAt": "2025-05-12T09:44:08.284Z",
+        "updatedAt": "2025-05-12T09:44:08.284Z",
+    }
+
+
+_shared_analyses = [analysis_payload(i) for i in range(5)]
+
+
+def analysis_node_payload(i: int) -> dict:
+    # A page of analysis nodes only refers to a handful of analyses and nodes which are included over and over again.
+    analysis, node = _shared_analyses[i % len(_shared_analyses)], node_payload(i % 10)
+
+    return {
+        "id": str(uuid.uuid4()),
+        "approvalStatus": "approved",
+        "executionStatus": "executed",
+        "executionProgress": 100,
+        "comment": None,
+        "artifactTag": None,
+        "artifactDigest": None,
+        "analysisId": analysis["id"],
+        "analysis": analysis,
+        "analysisRealmId": analysis["realmId"],
+        "nodeId": node["id"],
+        "node": node,
+        "nodeRealmId": node["realmId"],
+        "createdAt": "2025-05-12T09:44:08.284Z",
+        "updatedAt": "2025-05-12T09:44:08.284Z",
+    }
+
+
+def list_response(payload_fn: t.Callable[[int], dict], size: int) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "data": [payload_fn(i) for i in range(size)],
+            "meta": {"total": size, "limit": size, "offset": 0, "schema": {}},
+        },
+    )
+
+
+def decode_baseline(resource_type: type, r: httpx.Response):
+    return ResourceList[resource_type](**r.json()).data
+
+
+def decode_current(resource_type: type, r: httpx.Response):
+    return _parse_resource_list(resource_type, r, False)
+
+
+def decode_deduplicated(resource_type: type, r: httpx.Response):
+    return _parse_resource_list(resource_type, r, False, deduplicate=True)
+
+
+def decode_construct(resource_type: type, r: httpx.Response):
+    return _parse_resource_list(resource_type, r, False, "construct")
+
+
+def decode_lazy_skim(resource_type: type, r: httpx.Response):
+    # Only the first few resources of the page are accessed.
+    return _parse_resource_list(resource_type, r, False, "lazy")[:5]
+
+
+def decode_raw(resource_type: type, r: httpx.Response):
+    return _parse_resource_list(resource_type, r, False, "raw")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000, help="amount of resources per page")
+    parser.add_argument("--repeat", type=int, default=20, help="amount of decoded pages per measurement")
+    args = parser.parse_args()
+
+    for resource_type, payload_fn in (
+        (Analysis, analysis_payload),
+        (Log, log_payload),
+        (AnalysisNode, analysis_node_payload),
+    ):
+        r = list_response(payload_fn, args.size)
+        assert decode_baseline(resource_type, r) == decode_current(resource_type, r)
+        assert decode_current(resource_type, r) == decode_deduplicated(resource_type, r)
+        assert decode_current(resource_type, r)[:5] == decode_lazy_skim(resource_type, r)
+
+        print(f"{resource_type.__name__} pages with {args.size} resources ({len(r.content) / 1024:.0f} KiB)")
+
+        for name, decode_fn in (
+            ("baseline", decode_baseline),
+            ("current", decode_current),
+            ("deduplicated", decode_deduplicated),
+            ("lazy skim", decode_lazy_skim),
+            ("construct", decode_construct),
+            ("raw", decode_raw),
+        ):
+            # Take the best of several runs to reduce the noise of other processes.
+            secs = min(
+                timeit.repeat(
+                    lambda decode_fn=decode_fn, resource_type=resource_type, r=r: decode_fn(resource_type, r),
+                    number=args.repeat,
+                    repeat=5,
+                )
+            )
+            print(f"  {name:<14}{secs / args.repeat * 1000:8.2f} ms per page")
+
+
+if __name__ == "__main__":
+    main()
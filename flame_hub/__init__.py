@@ -1,26 +1,35 @@
 __all__ = [
     "auth",
+    "cache",
+    "middleware",
     "types",
     "models",
     "AuthClient",
     "CoreClient",
     "HubAPIError",
+    "CircuitOpenError",
     "StorageClient",
+    "AsyncAuthClient",
+    "AsyncCoreClient",
+    "AsyncStorageClient",
     "get_field_names",
     "get_includable_names",
+    "to_columns",
+    "to_dataframe",
     "__version__",
     "__version_info__",
 ]
 
 import warnings
 
-from . import auth, types, models
+from . import auth, cache, middleware, types, models
 
-from ._auth_client import AuthClient
+from ._auth_client import AuthClient, AsyncAuthClient
 from ._base_client import get_field_names, get_includable_names
-from ._exceptions import HubAPIError
-from ._core_client import CoreClient
-from ._storage_client import StorageClient
+from ._columns import to_columns, to_dataframe
+from ._exceptions import HubAPIError, CircuitOpenError
+from ._core_client import CoreClient, AsyncCoreClient
+from ._storage_client import StorageClient, AsyncStorageClient
 from ._version import __version__, __version_info__
 
 
@@ -7,7 +7,10 @@ from pydantic import Field, WrapValidator, EmailStr
 
 from flame_hub._base_client import (
     BaseClient,
+    AsyncBaseClient,
+    AsyncClientKwargs,
     FindAllKwargs,
+    IterKwargs,
     GetKwargs,
     ClientKwargs,
     uuid_validator,
@@ -258,6 +261,9 @@ class AuthClient(BaseClient):
     def find_realms(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Realm]:
         return self._find_all_resources(Realm, "realms", **params)
 
+    def iter_realms(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Realm]:
+        return self._iter_all_resources(Realm, "realms", **params)
+
     def create_realm(
         self,
         name: str,
@@ -277,7 +283,7 @@ class AuthClient(BaseClient):
         )
 
     def delete_realm(self, realm_id: Realm | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("realms", realm_id, **params)
+        return self._delete_resource("realms", realm_id, **params)
 
     def get_realm(
         self,
@@ -335,7 +341,7 @@ class AuthClient(BaseClient):
         )
 
     def delete_permission(self, permission_id: Permission | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("permissions", permission_id, **params)
+        return self._delete_resource("permissions", permission_id, **params)
 
     def update_permission(
         self,
@@ -360,6 +366,9 @@ class AuthClient(BaseClient):
     def find_permissions(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Permission]:
         return self._find_all_resources(Permission, "permissions", include=get_includable_names(Permission), **params)
 
+    def iter_permissions(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Permission]:
+        return self._iter_all_resources(Permission, "permissions", include=get_includable_names(Permission), **params)
+
     def create_role(
         self,
         name: str,
@@ -378,7 +387,7 @@ class AuthClient(BaseClient):
         return self._get_single_resource(Role, "roles", role_id, include=get_includable_names(Role), **params)
 
     def delete_role(self, role_id: Role | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("roles", role_id, **params)
+        return self._delete_resource("roles", role_id, **params)
 
     def update_role(
         self,
@@ -402,6 +411,9 @@ class AuthClient(BaseClient):
     def find_roles(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Role]:
         return self._find_all_resources(Role, "roles", include=get_includable_names(Role), **params)
 
+    def iter_roles(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Role]:
+        return self._iter_all_resources(Role, "roles", include=get_includable_names(Role), **params)
+
     def create_role_permission(
         self,
         role_id: Role | uuid.UUID | str,
@@ -431,7 +443,7 @@ class AuthClient(BaseClient):
         role_permission_id: RolePermission | uuid.UUID | str,
         **params: te.Unpack[BaseKwargs],
     ):
-        self._delete_resource("role-permissions", role_permission_id, **params)
+        return self._delete_resource("role-permissions", role_permission_id, **params)
 
     def get_role_permissions(self, **params: te.Unpack[GetKwargs]) -> ResourceListResult[RolePermission]:
         return self._get_all_resources(
@@ -449,6 +461,14 @@ class AuthClient(BaseClient):
             **params,
         )
 
+    def iter_role_permissions(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[RolePermission]:
+        return self._iter_all_resources(
+            RolePermission,
+            "role-permissions",
+            include=get_includable_names(RolePermission),
+            **params,
+        )
+
     def create_user(
         self,
         name: str,
@@ -479,7 +499,7 @@ class AuthClient(BaseClient):
         return self._get_single_resource(User, "users", user_id, include=get_includable_names(User), **params)
 
     def delete_user(self, user_id: User | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("users", user_id, **params)
+        return self._delete_resource("users", user_id, **params)
 
     def update_user(
         self,
@@ -515,6 +535,9 @@ class AuthClient(BaseClient):
     def find_users(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[User]:
         return self._find_all_resources(User, "users", include=get_includable_names(User), **params)
 
+    def iter_users(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[User]:
+        return self._iter_all_resources(User, "users", include=get_includable_names(User), **params)
+
     def create_user_permission(
         self,
         user_id: User | uuid.UUID | str,
@@ -544,7 +567,7 @@ class AuthClient(BaseClient):
         user_permission_id: UserPermission | uuid.UUID | str,
         **params: te.Unpack[BaseKwargs],
     ):
-        self._delete_resource("user-permissions", user_permission_id, **params)
+        return self._delete_resource("user-permissions", user_permission_id, **params)
 
     def get_user_permissions(self, **params: te.Unpack[GetKwargs]) -> ResourceListResult[UserPermission]:
         return self._get_all_resources(
@@ -562,6 +585,14 @@ class AuthClient(BaseClient):
             **params,
         )
 
+    def iter_user_permissions(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[UserPermission]:
+        return self._iter_all_resources(
+            UserPermission,
+            "user-permissions",
+            include=get_includable_names(UserPermission),
+            **params,
+        )
+
     def create_user_role(
         self,
         user_id: User | uuid.UUID | str,
@@ -583,7 +614,7 @@ class AuthClient(BaseClient):
         )
 
     def delete_user_role(self, user_role_id: UserRole | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("user-roles", user_role_id, **params)
+        return self._delete_resource("user-roles", user_role_id, **params)
 
     def get_user_roles(self, **params: te.Unpack[GetKwargs]) -> ResourceListResult[UserRole]:
         return self._get_all_resources(UserRole, "user-roles", include=get_includable_names(UserRole), **params)
@@ -591,6 +622,9 @@ class AuthClient(BaseClient):
     def find_user_roles(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[UserRole]:
         return self._find_all_resources(UserRole, "user-roles", include=get_includable_names(UserRole), **params)
 
+    def iter_user_roles(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[UserRole]:
+        return self._iter_all_resources(UserRole, "user-roles", include=get_includable_names(UserRole), **params)
+
     def create_client(
         self,
         name: str,
@@ -628,7 +662,7 @@ class AuthClient(BaseClient):
         )
 
     def delete_client(self, client_id: Client | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("clients", client_id, **params)
+        return self._delete_resource("clients", client_id, **params)
 
     def get_client(
         self,
@@ -643,6 +677,9 @@ class AuthClient(BaseClient):
     def find_clients(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Client]:
         return self._find_all_resources(Client, "clients", include=get_includable_names(Client), **params)
 
+    def iter_clients(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Client]:
+        return self._iter_all_resources(Client, "clients", include=get_includable_names(Client), **params)
+
     def update_client(
         self,
         client_id: Client | uuid.UUID | str,
@@ -678,3 +715,24 @@ class AuthClient(BaseClient):
             client_id,
             **params,
         )
+
+
+class AsyncAuthClient(AuthClient, AsyncBaseClient):
+    """The asynchronous client which implements all auth endpoints.
+
+    This class offers the same methods as :py:class:`.AuthClient`, but all of them are coroutines and have to be
+    awaited. Its arguments are passed through to :py:class:`.AsyncBaseClient`. Check the documentation of that class for
+    further information. Note that ``base_url`` defaults :py:const:`~flame_hub._defaults.DEFAULT_AUTH_BASE_URL`.
+
+    See Also
+    --------
+    :py:class:`.AsyncBaseClient`, :py:class:`.AuthClient`
+    """
+
+    def __init__(
+        self,
+        base_url=DEFAULT_AUTH_BASE_URL,
+        auth: AuthParam = None,
+        **kwargs: te.Unpack[AsyncClientKwargs],
+    ):
+        super().__init__(base_url, auth, **kwargs)
@@ -1,11 +1,24 @@
+import asyncio
+import contextlib
+import hashlib
+import logging
+import threading
 import time
 import typing as t
+import weakref
 
 import httpx2 as httpx
 from pydantic import BaseModel
 
 from flame_hub._defaults import DEFAULT_AUTH_BASE_URL
 from flame_hub._exceptions import new_hub_api_error_from_response
+from flame_hub._token_store import FileTokenStore
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of the delay between consecutive failed renewals in the background.
+_MAX_RENEWAL_BACKOFF_SECS = 60.0
 
 
 def secs_to_nanos(seconds: int) -> int:
@@ -23,7 +36,328 @@ class RefreshToken(AccessToken):
     refresh_token: str
 
 
-class ClientAuth(httpx.Auth):
+class _TokenState(object):
+    """Current token of one identity together with the locks that guard its renewal. Instances may be shared by
+    multiple authentication flows."""
+
+    def __init__(self):
+        self.token: AccessToken | None = None
+        self.expires_at_nanos = 0
+        self.lock = threading.Lock()
+        self.async_lock: asyncio.Lock | None = None
+        self.async_lock_loop: asyncio.AbstractEventLoop | None = None
+
+
+# Process-wide registry of token states which are shared by flows with the same identity. Entries are dropped as soon
+# as no flow refers to them anymore.
+_shared_token_states: weakref.WeakValueDictionary[tuple[str, ...], _TokenState] = weakref.WeakValueDictionary()
+_shared_token_states_lock = threading.Lock()
+
+
+def _get_shared_token_state(key: tuple[str, ...]) -> _TokenState:
+    with _shared_token_states_lock:
+        state = _shared_token_states.get(key)
+
+        if state is None:
+            state = _TokenState()
+            _shared_token_states[key] = state
+
+        return state
+
+
+class _TokenAuth(httpx.Auth):
+    """Base class for authentication flows which request bearer tokens from the ``token`` endpoint of the Hub.
+
+    Subclasses define which grant is sent to the Hub and how the response is validated. This class takes care of keeping
+    track of the current token and its expiration and implements the authentication flow for both synchronous and
+    asynchronous clients. If ``async_client`` is not set, an :py:class:`httpx.AsyncClient` is created for every token
+    request of an asynchronous client and closed right after.
+
+    Instances are safe to share between threads and coroutines. When the token expires, exactly one thread or coroutine
+    requests a new token while all others wait for the result.
+
+    By default, a token is renewed once it has expired. With ``renewal_window`` set to a fraction of the token lifetime,
+    e.g. ``0.1``, a new token is requested as soon as only that fraction of ``expires_in`` remains. Together with
+    :py:meth:`start_background_renewal` this keeps token requests off the request path entirely.
+
+    If ``token_store`` is set, tokens are persisted and looked up there before a new token is requested. This allows
+    processes to reuse tokens that were requested by other processes for the same identity.
+
+    If ``share_token`` is set, all instances within this process that share the base URL, grant type and credentials
+    also share one token and renew it only once.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_AUTH_BASE_URL,
+        client: httpx.Client | None = None,
+        async_client: httpx.AsyncClient | None = None,
+        renewal_window: float = 0.0,
+        token_store: FileTokenStore | None = None,
+        share_token: bool = False,
+    ):
+        if not 0 <= renewal_window < 1:
+            raise ValueError(f"renewal window must be a fraction in [0, 1), got {renewal_window}")
+
+        self._renewal_window = renewal_window
+        self._token_store = token_store
+        self._client = client or httpx.Client(base_url=base_url)
+        self._async_client = async_client
+        self._state = _get_shared_token_state(self._shared_token_key()) if share_token else _TokenState()
+        self._renewal_thread: threading.Thread | None = None
+        self._renewal_stop_event = threading.Event()
+
+    def _token_request_body(self) -> dict:
+        """Returns the JSON body which is sent to the ``token`` endpoint to request a new token."""
+        raise NotImplementedError
+
+    def _validate_token(self, body: dict) -> AccessToken:
+        """Validates the response body of the ``token`` endpoint."""
+        raise NotImplementedError
+
+    def _identity(self) -> tuple[str, str]:
+        """Returns the grant type and the principal which identify the tokens requested by this instance."""
+        raise NotImplementedError
+
+    def _secret(self) -> str:
+        """Returns the secret which is used by the principal to request tokens."""
+        raise NotImplementedError
+
+    def _token_store_key(self) -> str:
+        return "|".join(self._shared_token_key())
+
+    def _shared_token_key(self) -> tuple[str, ...]:
+        # Flows with the same principal but a different secret must not share tokens, otherwise a wrong or rotated
+        # secret would go unnoticed as long as a token for the old secret is valid.
+        return str(self._client.base_url), *self._identity(), hashlib.sha256(self._secret().encode()).hexdigest()
+
+    @property
+    def _current_token(self) -> AccessToken | None:
+        return self._state.token
+
+    @_current_token.setter
+    def _current_token(self, token: AccessToken | None):
+        self._state.token = token
+
+    @property
+    def _current_token_expires_at_nanos(self) -> int:
+        return self._state.expires_at_nanos
+
+    @_current_token_expires_at_nanos.setter
+    def _current_token_expires_at_nanos(self, expires_at_nanos: int):
+        self._state.expires_at_nanos = expires_at_nanos
+
+    def _update_token(self, token: AccessToken, request_nanos: int):
+        """Overwrites the current token and calculates the expiring point in time for the new token.
+
+        Parameters
+        ----------
+        token : :py:class:`.AccessToken`
+            A new token which replaces the current token.
+        request_nanos : :py:class:`int`
+            The point in time where the request was sent that had ``token`` as a response. The unit of this argument
+            needs to be nanoseconds.
+        """
+        self._current_token = token
+        self._current_token_expires_at_nanos = request_nanos + secs_to_nanos(token.expires_in)
+
+    def _nanos_until_renewal(self) -> int:
+        """Returns the time in nanoseconds until the current token has to be renewed. This is zero or negative if the
+        token is not set or is due for renewal."""
+        token = self._current_token
+
+        if token is None:
+            return 0
+
+        renewal_nanos = int(secs_to_nanos(token.expires_in) * self._renewal_window)
+        return self._current_token_expires_at_nanos - renewal_nanos - time.monotonic_ns()
+
+    def _is_token_expired(self) -> bool:
+        """Checks if the current token is not set, expired or within the renewal window."""
+        return self._current_token is None or self._nanos_until_renewal() < 0
+
+    def _handle_token_response(self, r: httpx.Response, request_nanos: int):
+        if r.status_code != httpx.codes.OK.value:
+            raise new_hub_api_error_from_response(r)
+
+        self._update_token(self._validate_token(r.json()), request_nanos)
+
+    def _load_stored_token(self) -> bool:
+        """Replaces the current token with the one from the token store if it is not due for renewal. Returns whether
+        the current token was replaced."""
+        if self._token_store is None:
+            return False
+
+        entry = self._token_store.load(self._token_store_key())
+
+        if entry is None:
+            return False
+
+        body, expires_at = entry
+        remaining_nanos = int((expires_at - time.time()) * 10**9)
+        token = self._validate_token(body)
+
+        if remaining_nanos <= int(secs_to_nanos(token.expires_in) * self._renewal_window):
+            return False
+
+        # Translate the wall clock expiry into this process's monotonic clock.
+        self._update_token(token, time.monotonic_ns() + remaining_nanos - secs_to_nanos(token.expires_in))
+        return True
+
+    def _save_token(self, request_time: float):
+        """Persists the current token in the token store if one is set."""
+        if self._token_store is not None:
+            self._token_store.save(
+                self._token_store_key(),
+                self._current_token.model_dump(),
+                request_time + self._current_token.expires_in,
+            )
+
+    def _fetch_token(self):
+        """Requests a new token with the synchronous client and replaces the current token.
+
+        If a token store is set, a valid token from the store is used instead. The store is locked for the identity of
+        this instance while the token is requested so that only one process requests a new token at a time.
+        """
+        with self._token_store.lock(self._token_store_key()) if self._token_store else contextlib.nullcontext():
+            if self._load_stored_token():
+                return
+
+            request_time, request_nanos = time.time(), time.monotonic_ns()
+            r = self._client.post("token", json=self._token_request_body())
+            self._handle_token_response(r, request_nanos)
+            self._save_token(request_time)
+
+    def _renew_in_background(self, retry_secs: float):
+        backoff_secs = retry_secs
+
+        while True:
+            delay_secs = max(self._nanos_until_renewal(), 0) / 10**9
+
+            if self._renewal_stop_event.wait(delay_secs):
+                return
+
+            try:
+                with self._state.lock:
+                    if self._is_token_expired():
+                        self._fetch_token()
+            except Exception:
+                # The next request will run into the same error and raise it. Until then, keep trying but back off
+                # since errors such as rejected credentials are unlikely to go away soon.
+                logger.exception("background token renewal failed, retrying in %.1f seconds", backoff_secs)
+
+                if self._renewal_stop_event.wait(backoff_secs):
+                    return
+
+                backoff_secs = min(backoff_secs * 2, max(retry_secs, _MAX_RENEWAL_BACKOFF_SECS))
+            else:
+                backoff_secs = retry_secs
+
+    def start_background_renewal(self, retry_secs: float = 5.0):
+        """Starts a daemon thread which renews the token ahead of time.
+
+        The thread requests a token immediately if none is set and afterwards whenever the current token enters the
+        renewal window. :py:class:`.PasswordAuth` uses the refresh token for this. Requests never have to wait for a
+        token as long as the thread keeps up. Calling this method while the thread is already running has no effect.
+
+        Parameters
+        ----------
+        retry_secs : :py:class:`float`, default=5.0
+            Seconds to wait before retrying if a token request failed. The delay doubles with every consecutive failure
+            up to one minute unless ``retry_secs`` is longer. Failures are logged.
+
+        Raises
+        ------
+        :py:exc:`ValueError`
+            If this instance has no renewal window. Without it, the token would be renewed at the same time requests
+            find it to be expired.
+
+        See Also
+        --------
+        :py:meth:`stop_background_renewal`
+        """
+        if self._renewal_window == 0:
+            raise ValueError("background renewal requires a renewal window greater than zero")
+
+        if self._renewal_thread is not None and self._renewal_thread.is_alive():
+            return
+
+        self._renewal_stop_event.clear()
+        self._renewal_thread = threading.Thread(
+            target=self._renew_in_background, args=(retry_secs,), name="flame-hub-token-renewal", daemon=True
+        )
+        self._renewal_thread.start()
+
+    def stop_background_renewal(self):
+        """Stops the thread started by :py:meth:`start_background_renewal` and waits for it to finish."""
+        self._renewal_stop_event.set()
+
+        if self._renewal_thread is not None:
+            self._renewal_thread.join()
+            self._renewal_thread = None
+
+    def _get_async_lock(self) -> asyncio.Lock:
+        """Returns the lock which guards token requests of asynchronous clients on the running event loop."""
+        loop = asyncio.get_running_loop()
+
+        state = self._state
+
+        # Locks are bound to the event loop they are used on first, so a new one is needed for every loop.
+        if state.async_lock is None or state.async_lock_loop is not loop:
+            state.async_lock = asyncio.Lock()
+            state.async_lock_loop = loop
+
+        return state.async_lock
+
+    async def _async_fetch_token(self):
+        """Requests a new token with the asynchronous client and replaces the current token. If no asynchronous client
+        was passed, a client is created for this request and closed afterwards. Tokens are loaded from and saved to the
+        token store in a worker thread so that file I/O does not block the event loop."""
+        # The token store is not locked here since waiting for other processes would block the event loop.
+        if self._token_store is not None and await asyncio.to_thread(self._load_stored_token):
+            return
+
+        request_time, request_nanos = time.time(), time.monotonic_ns()
+
+        if self._async_client is not None:
+            r = await self._async_client.post("token", json=self._token_request_body())
+        else:
+            async with httpx.AsyncClient(base_url=self._client.base_url) as async_client:
+                r = await async_client.post("token", json=self._token_request_body())
+
+        self._handle_token_response(r, request_nanos)
+
+        if self._token_store is not None:
+            await asyncio.to_thread(self._save_token, request_time)
+
+    def auth_flow(self, request) -> t.Iterator[httpx.Request]:
+        if self._is_token_expired():
+            with self._state.lock:
+                # Another thread might have already refreshed the token while this one was waiting for the lock.
+                if self._is_token_expired():
+                    self._fetch_token()
+
+        request.headers["Authorization"] = f"Bearer {self._current_token.access_token}"
+        yield request
+
+    async def async_auth_flow(self, request) -> t.AsyncIterator[httpx.Request]:
+        """Executes the authentication flow for asynchronous clients.
+
+        The token is requested with an asynchronous client so that the event loop is never blocked. If many coroutines
+        find the current token to be expired at the same time, only the first one requests a new token while all
+        others wait for it and reuse the result.
+        """
+        if self._is_token_expired():
+            async with self._get_async_lock():
+                # Another coroutine might have already refreshed the token while this one was waiting for the lock.
+                if self._is_token_expired():
+                    await self._async_fetch_token()
+
+        request.headers["Authorization"] = f"Bearer {self._current_token.access_token}"
+        yield request
+
+
+class ClientAuth(_TokenAuth):
     """Client authentication for the FLAME Hub.
 
     This class implements a client authentication flow which is one possible flow that is recognized by the FLAME Hub.
@@ -31,7 +365,7 @@ class ClientAuth(httpx.Auth):
     this base class, click
     `here <https://www.python-httpx.org/advanced/authentication/#custom-authentication-schemes>`_. Note that
     ``base_url`` is ignored if you pass your own client via the ``client`` keyword argument. An instance of this class
-    could be used for authentication to access the Hub endpoints via the clients.
+    could be used for authentication to access the Hub endpoints via the synchronous and asynchronous clients.
 
     Parameters
     ----------
@@ -43,6 +377,19 @@ class ClientAuth(httpx.Auth):
         The base URL for the authentication flow.
     client : :py:class:`httpx.Client`
         Pass your own client to avoid the instantiation of a client while initializing an instance of this class.
+    async_client : :py:class:`httpx.AsyncClient`
+        Pass your own asynchronous client which is used to request tokens if this instance is used by an asynchronous
+        client. Defaults to a client with the same base URL as ``client`` which is created for every token request and
+        closed right after.
+    renewal_window : :py:class:`float`, default=0.0
+        Fraction of the token lifetime before its expiry at which a new token is requested. Defaults to renewing the
+        token only once it has expired.
+    token_store : :py:class:`.FileTokenStore`, optional
+        Persistent store which is used to share tokens with other processes. Defaults to :any:`None` which keeps tokens
+        in memory only.
+    share_token : :py:class:`bool`, default=False
+        Share the token with all other instances in this process which were created with the same base URL,
+        credentials and ``share_token=True``.
 
     See Also
     --------
@@ -55,12 +402,30 @@ class ClientAuth(httpx.Auth):
         client_secret: str,
         base_url: str = DEFAULT_AUTH_BASE_URL,
         client: httpx.Client | None = None,
+        async_client: httpx.AsyncClient | None = None,
+        renewal_window: float = 0.0,
+        token_store: FileTokenStore | None = None,
+        share_token: bool = False,
     ):
         self._client_id = client_id
         self._client_secret = client_secret
-        self._current_token = None
-        self._current_token_expires_at_nanos = 0
-        self._client = client or httpx.Client(base_url=base_url)
+        super().__init__(base_url, client, async_client, renewal_window, token_store, share_token)
+
+    def _token_request_body(self) -> dict:
+        return {
+            "grant_type": "client_credentials",
+            "client_id": self._client_id,
+            "client_secret": self._client_secret,
+        }
+
+    def _validate_token(self, body: dict) -> AccessToken:
+        return AccessToken(**body)
+
+    def _identity(self) -> tuple[str, str]:
+        return "client_credentials", self._client_id
+
+    def _secret(self) -> str:
+        return self._client_secret
 
     def auth_flow(self, request) -> t.Iterator[httpx.Request]:
         """Executes the client authentication flow.
@@ -74,33 +439,10 @@ class ClientAuth(httpx.Auth):
         --------
         :py:class:`.AccessToken`
         """
-
-        # Check if token is not set or current token is expired.
-        if self._current_token is None or time.monotonic_ns() > self._current_token_expires_at_nanos:
-            request_nanos = time.monotonic_ns()
-
-            r = self._client.post(
-                "token",
-                json={
-                    "grant_type": "client_credentials",
-                    "client_id": self._client_id,
-                    "client_secret": self._client_secret,
-                },
-            )
-
-            if r.status_code != httpx.codes.OK.value:
-                raise new_hub_api_error_from_response(r)
-
-            at = AccessToken(**r.json())
-
-            self._current_token = at
-            self._current_token_expires_at_nanos = request_nanos + secs_to_nanos(at.expires_in)
-
-        request.headers["Authorization"] = f"Bearer {self._current_token.access_token}"
-        yield request
+        return super().auth_flow(request)
 
 
-class PasswordAuth(httpx.Auth):
+class PasswordAuth(_TokenAuth):
     """Password authentication for the FLAME Hub.
 
     This class implements a password authentication flow which is one possible flow that is recognized by the FLAME Hub.
@@ -108,7 +450,7 @@ class PasswordAuth(httpx.Auth):
     this base class, click
     `here <https://www.python-httpx.org/advanced/authentication/#custom-authentication-schemes>`_. Note that
     ``base_url`` is ignored if you pass your own client via the ``client`` keyword argument. An instance of this class
-    could be used for authentication to access the Hub endpoints via the clients.
+    could be used for authentication to access the Hub endpoints via the synchronous and asynchronous clients.
 
     Parameters
     ----------
@@ -120,6 +462,19 @@ class PasswordAuth(httpx.Auth):
         The base URL for the authentication flow.
     client : :py:class:`httpx.Client`
         Pass your own client to avoid the instantiation of a client while initializing an instance of this class.
+    async_client : :py:class:`httpx.AsyncClient`
+        Pass your own asynchronous client which is used to request tokens if this instance is used by an asynchronous
+        client. Defaults to a client with the same base URL as ``client`` which is created for every token request and
+        closed right after.
+    renewal_window : :py:class:`float`, default=0.0
+        Fraction of the token lifetime before its expiry at which a new token is requested. Defaults to renewing the
+        token only once it has expired.
+    token_store : :py:class:`.FileTokenStore`, optional
+        Persistent store which is used to share tokens with other processes. Defaults to :any:`None` which keeps tokens
+        in memory only.
+    share_token : :py:class:`bool`, default=False
+        Share the token with all other instances in this process which were created with the same base URL,
+        credentials and ``share_token=True``.
 
     See Also
     --------
@@ -132,12 +487,37 @@ class PasswordAuth(httpx.Auth):
         password: str,
         base_url: str = DEFAULT_AUTH_BASE_URL,
         client: httpx.Client | None = None,
+        async_client: httpx.AsyncClient | None = None,
+        renewal_window: float = 0.0,
+        token_store: FileTokenStore | None = None,
+        share_token: bool = False,
     ):
         self._username = username
         self._password = password
-        self._current_token = None
-        self._current_token_expires_at_nanos = 0
-        self._client = client or httpx.Client(base_url=base_url)
+        super().__init__(base_url, client, async_client, renewal_window, token_store, share_token)
+
+    def _token_request_body(self) -> dict:
+        # flow is handled using refresh token if a token was already issued
+        if self._current_token is None:
+            return {
+                "grant_type": "password",
+                "username": self._username,
+                "password": self._password,
+            }
+
+        return {
+            "grant_type": "refresh_token",
+            "refresh_token": self._current_token.refresh_token,
+        }
+
+    def _validate_token(self, body: dict) -> RefreshToken:
+        return RefreshToken(**body)
+
+    def _identity(self) -> tuple[str, str]:
+        return "password", self._username
+
+    def _secret(self) -> str:
+        return self._password
 
     def _update_token(self, token: RefreshToken, request_nanos: int):
         """Overwrites the current token and calculates the expiring point in time for the new token.
@@ -154,8 +534,7 @@ class PasswordAuth(httpx.Auth):
         --------
         :py:class:`.RefreshToken`
         """
-        self._current_token = token
-        self._current_token_expires_at_nanos = request_nanos + secs_to_nanos(token.expires_in)
+        super()._update_token(token, request_nanos)
 
     def auth_flow(self, request) -> t.Iterator[httpx.Request]:
         """Executes the password authentication flow.
@@ -170,42 +549,7 @@ class PasswordAuth(httpx.Auth):
         --------
         :py:class:`.RefreshToken`
         """
-        if self._current_token is None:
-            request_nanos = time.monotonic_ns()
-
-            r = self._client.post(
-                "token",
-                json={
-                    "grant_type": "password",
-                    "username": self._username,
-                    "password": self._password,
-                },
-            )
-
-            if r.status_code != httpx.codes.OK.value:
-                raise new_hub_api_error_from_response(r)
-
-            self._update_token(RefreshToken(**r.json()), request_nanos)
-
-        # flow is handled using refresh token if a token was already issued
-        if time.monotonic_ns() > self._current_token_expires_at_nanos:
-            request_nanos = time.monotonic_ns()
-
-            r = self._client.post(
-                "token",
-                json={
-                    "grant_type": "refresh_token",
-                    "refresh_token": self._current_token.refresh_token,
-                },
-            )
-
-            if r.status_code != httpx.codes.OK.value:
-                raise new_hub_api_error_from_response(r)
-
-            self._update_token(RefreshToken(**r.json()), request_nanos)
-
-        request.headers["Authorization"] = f"Bearer {self._current_token.access_token}"
-        yield request
+        return super().auth_flow(request)
 
 
 class StaticAuth(httpx.Auth):
@@ -229,3 +573,19 @@ class StaticAuth(httpx.Auth):
 
         request.headers["Authorization"] = f"Bearer {self._access_token}"
         yield request
+
+
+def auth_identity(auth: httpx.Auth | None) -> str | None:
+    """Returns a hash which identifies the principal that ``auth`` authenticates as. Requests without authentication
+    share one identity. If the principal of ``auth`` is unknown, e.g. since it is a custom authentication flow,
+    :any:`None` is returned."""
+    if auth is None:
+        key = ("anonymous",)
+    elif isinstance(auth, _TokenAuth):
+        key = auth._shared_token_key()
+    elif isinstance(auth, StaticAuth):
+        key = "static", hashlib.sha256(auth._access_token.encode()).hexdigest()
+    else:
+        return None
+
+    return hashlib.sha256("|".join(key).encode()).hexdigest()
@@ -1,16 +1,32 @@
 from __future__ import annotations
+import asyncio
+import copy
+import functools
+import itertools
+import queue
+import threading
 import typing as t
 import uuid
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Iterable, MutableSequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from enum import Enum
 
 import httpx2 as httpx
+import pydantic_core
 import typing_extensions as te
-from pydantic import BaseModel, ValidatorFunctionWrapHandler, ValidationError, ConfigDict, Field
+from pydantic import BaseModel, ValidatorFunctionWrapHandler, ValidationError, ConfigDict, Field, TypeAdapter
+from pydantic import create_model
 from pydantic.alias_generators import to_camel
+from pydantic.fields import FieldInfo
 
+from flame_hub._coalescing import CoalescingMiddleware
+from flame_hub._entity_cache import EntityCache
 from flame_hub._exceptions import new_hub_api_error_from_response, HubAPIError
-from flame_hub._auth_flows import PasswordAuth, ClientAuth, StaticAuth
+from flame_hub._middleware import Middleware, Operation, _parse_through, _send_through, _send_through_async
+from flame_hub._response_cache import ResponseCache
+from flame_hub._auth_flows import PasswordAuth, ClientAuth, StaticAuth, auth_identity
 
 
 class UNSET(BaseModel):
@@ -163,6 +179,103 @@ class WrappedResource(BaseModel, t.Generic[ResourceT]):
     """Attribute which holds meta information about the requested resource."""
 
 
+class DataEnvelope(BaseModel, t.Generic[ResourceT]):
+    """Model for enveloped responses of create, update, command and upload requests whose meta information is empty
+    and thus discarded.
+
+    See Also
+    --------
+    :py:meth:`._create_resource`, :py:meth:`._update_resource`
+    """
+
+    data: ResourceT
+    """Attribute which holds the created or updated resources."""
+    meta: dict | None = None
+    """Attribute which holds meta information if the Hub provides it."""
+
+
+class LazyResourceList(MutableSequence[ResourceT]):
+    """List of resources which are validated the first time they are accessed.
+
+    Instances are returned by list responses if the result mode is ``"lazy"``. They hold the decoded JSON objects of a
+    page and validate each of them with ``resource_type`` once it is accessed. Validated resources replace their JSON
+    objects, so every resource is validated at most once. Pages which are only skimmed therefore cost little more than
+    decoding the response. Apart from that, instances behave like a :py:class:`list` of resources.
+
+    Parameters
+    ----------
+    resource_type : :py:class:`type`\\[:py:type:`~flame_hub._base_client.ResourceT`]
+        Model which is used to validate resources.
+    data : :py:class:`list`\\[:py:class:`dict`]
+        Decoded JSON objects of all resources.
+    meta : :py:class:`.ResourceListMeta`, optional
+        Meta information of the list response.
+
+    See Also
+    --------
+    :py:type:`~flame_hub.types.ResultMode`, :py:meth:`._find_all_resources`
+    """
+
+    def __init__(self, resource_type: type[ResourceT], data: list[dict], meta: ResourceListMeta | None = None):
+        self._resource_type = resource_type
+        self._items: list[ResourceT | dict] = list(data)
+        # Nested resources are shared by all resources of the list, see ModelMetadata.validate_shared.
+        self._identity_map = {}
+        self.meta = meta
+        """Meta information of the list response."""
+
+    def _validate(self, index: int) -> ResourceT:
+        item = self._items[index]
+
+        if isinstance(item, dict):
+            item = get_model_metadata(self._resource_type).validate_shared([item], self._identity_map)[0]
+            self._items[index] = item
+
+        return item
+
+    @t.overload
+    def __getitem__(self, index: int) -> ResourceT: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> list[ResourceT]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._validate(i) for i in range(len(self._items))[index]]
+
+        return self._validate(index)
+
+    def __setitem__(self, index, value):
+        self._items[index] = value
+
+    def __delitem__(self, index):
+        del self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> t.Iterator[ResourceT]:
+        for i in range(len(self._items)):
+            yield self._validate(i)
+
+    def insert(self, index: int, value: ResourceT):
+        self._items.insert(index, value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyResourceList)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    @property
+    def validated_count(self) -> int:
+        """Amount of resources which were validated so far."""
+        return sum(1 for item in self._items if not isinstance(item, dict))
+
+
 # Generic type alias for all list get and find methods.
 ResourceListResult: t.TypeAlias = list[ResourceT] | tuple[list[ResourceT], ResourceListMeta]
 # Generic type alias for all get methods.
@@ -269,30 +382,48 @@ def _get_annotated_property_names(model: type[ResourceT], sentinel: object) -> t
 
 
 def get_field_names(model: type[ResourceT]) -> tuple[str, ...]:
-    """This function is a wrapper which calls :py:func:`._get_annotated_property_names` with ``sentinel`` set to
-    :py:class:`.IsOptionalField`.
+    """Returns the names of all properties of ``model`` that are annotated with :py:class:`.IsOptionalField`. They are
+    computed once per model with :py:func:`._get_annotated_property_names` and looked up afterwards.
 
     See Also
     --------
-    :py:func:`_get_annotated_property_names`, :py:class:`.IsOptionalField`
+    :py:func:`_get_annotated_property_names`, :py:class:`.IsOptionalField`, :py:func:`.get_model_metadata`
     """
-    return _get_annotated_property_names(model, IsOptionalField)
+    return get_model_metadata(model).field_names
 
 
 def get_includable_names(model: type[ResourceT]) -> tuple[str, ...]:
-    """This function is a wrapper which calls :py:func:`._get_annotated_property_names` with ``sentinel`` set to
-    :py:class:`.IsIncludable`.
+    """Returns the names of all properties of ``model`` that are annotated with :py:class:`.IsIncludable`. They are
+    computed once per model with :py:func:`._get_annotated_property_names` and looked up afterwards.
 
     See Also
     --------
-    :py:func:`_get_annotated_property_names`, :py:class:`.IsIncludable`
+    :py:func:`_get_annotated_property_names`, :py:class:`.IsIncludable`, :py:func:`.get_model_metadata`
     """
-    return _get_annotated_property_names(model, IsIncludable)
+    return get_model_metadata(model).includable_names
+
+
+# Query parameters repeat the same few names, so their camelCase versions are cached.
+_camel_case = functools.cache(to_camel)
 
 
 AuthParam: t.TypeAlias = ClientAuth | PasswordAuth | StaticAuth | str | None
 
 
+IncludePolicy = t.Literal["all", "none"] | IncludeParams
+"""Defines which nested resources are requested. ``"all"`` includes every nested resource that is available for a
+resource type, ``"none"`` includes none of them and a name or a collection of names includes only the named nested
+resources, e.g. ``("node",)``."""
+
+
+ResultMode = t.Literal["validate", "lazy", "construct", "raw", "columns"]
+"""Defines how resources in responses are decoded. ``"validate"`` validates resources with their models. ``"lazy"``
+validates resources of list responses on first access, see :py:class:`.LazyResourceList`. ``"construct"`` builds models
+from trusted responses without any validation and ``"raw"`` returns the plain JSON objects. ``"columns"`` returns list
+responses as a dictionary of NumPy arrays with one array per field, see :py:func:`~flame_hub.to_columns`. Iterators
+yield one such dictionary per page in this mode. Single resources are validated as usual."""
+
+
 class ClientKwargs(te.TypedDict, total=False):
     """Keyword arguments that can be used to instantiate a client.
 
@@ -302,6 +433,54 @@ class ClientKwargs(te.TypedDict, total=False):
     """
 
     client: httpx.Client | None
+    result_mode: ResultMode
+    """Default result mode of all get and find methods. Defaults to ``"validate"``."""
+    include_policy: IncludePolicy
+    """Default include policy of all get and find methods. Defaults to ``"all"``. Names which cannot be included in a
+    resource type are ignored for that type."""
+    entity_cache: EntityCache | None
+    """Cache of single resources which are requested with get methods, see :py:class:`~flame_hub.cache.EntityCache`.
+    Defaults to :any:`None` which disables caching."""
+    response_cache: ResponseCache | None
+    """Revalidating cache of ``GET`` responses, see :py:class:`~flame_hub.cache.ResponseCache`. Defaults to
+    :any:`None` which disables caching."""
+    coalesce_requests: bool
+    """Whether identical ``GET`` requests which are in flight at the same time share a single request and its parsed
+    result, see :py:class:`~flame_hub.middleware.CoalescingMiddleware`. Defaults to :any:`False`."""
+    middleware: t.Sequence[Middleware]
+    """Middleware which wraps all requests of the client, see :py:class:`~flame_hub.middleware.Middleware`. The first
+    middleware is the outermost one. Middleware which is enabled with ``coalesce_requests`` and ``response_cache`` is
+    added after it in this order. Defaults to no middleware."""
+
+
+class AsyncClientKwargs(te.TypedDict, total=False):
+    """Keyword arguments that can be used to instantiate an asynchronous client.
+
+    See Also
+    --------
+    :py:class:`.AsyncBaseClient`, :py:class:`.AsyncAuthClient`, :py:class:`.AsyncCoreClient`,\
+    :py:class:`.AsyncStorageClient`
+    """
+
+    client: httpx.AsyncClient | None
+    result_mode: ResultMode
+    """Default result mode of all get and find methods. Defaults to ``"validate"``."""
+    include_policy: IncludePolicy
+    """Default include policy of all get and find methods. Defaults to ``"all"``. Names which cannot be included in a
+    resource type are ignored for that type."""
+    entity_cache: EntityCache | None
+    """Cache of single resources which are requested with get methods, see :py:class:`~flame_hub.cache.EntityCache`.
+    Defaults to :any:`None` which disables caching."""
+    response_cache: ResponseCache | None
+    """Revalidating cache of ``GET`` responses, see :py:class:`~flame_hub.cache.ResponseCache`. Defaults to
+    :any:`None` which disables caching."""
+    coalesce_requests: bool
+    """Whether identical ``GET`` requests which are in flight at the same time share a single request and its parsed
+    result, see :py:class:`~flame_hub.middleware.CoalescingMiddleware`. Defaults to :any:`False`."""
+    middleware: t.Sequence[Middleware]
+    """Middleware which wraps all requests of the client, see :py:class:`~flame_hub.middleware.Middleware`. The first
+    middleware is the outermost one. Middleware which is enabled with ``coalesce_requests`` and ``response_cache`` is
+    added after it in this order. Defaults to no middleware."""
 
 
 class BaseKwargs(te.TypedDict, total=False):
@@ -325,7 +504,16 @@ class GetKwargs(BaseKwargs, total=False):
     """
 
     fields: FieldParams | None
+    only: FieldParams | None
+    """Restricts resources to the named fields. Resources are returned as instances of a partial model which only has
+    the named fields, the optional fields in ``fields`` and the included nested resources, see
+    :py:meth:`.ModelMetadata.partial_model`."""
     meta: bool
+    result_mode: ResultMode
+    """Overrides the result mode of the client for this call, see :py:type:`~flame_hub.types.ResultMode`."""
+    include_policy: IncludePolicy
+    """Overrides the include policy of the client for this call, see :py:type:`~flame_hub.types.IncludePolicy`. Naming
+    a resource which cannot be included raises a :py:exc:`ValueError`."""
 
 
 class FindAllKwargs(GetKwargs, total=False):
@@ -339,7 +527,34 @@ class FindAllKwargs(GetKwargs, total=False):
 
     filter: FilterParams | None
     page: PageParams | None
-    sort: SortParams | None
+    sort: SortParams | list[SortParams] | None
+    """Sort parameters. Pass a list to sort by multiple attributes where later attributes break ties of earlier ones."""
+
+
+class IterKwargs(FindAllKwargs, total=False):
+    """Keyword arguments that can be used for iterating over resources page by page.
+
+    ``page`` defines the first page of the iteration. The ``meta`` flag is ignored.
+
+    See Also
+    --------
+    :py:class:`.FindAllKwargs`, :py:meth:`._iter_all_resources`
+    """
+
+    page_size: int
+    """Amount of resources which are requested per page. Defaults to the limit of ``page`` or
+    :py:const:`~flame_hub._base_client.DEFAULT_PAGE_PARAMS`."""
+    pagination: t.Literal["offset", "keyset"]
+    """Pagination strategy. ``"offset"`` (default) requests pages by their offset. ``"keyset"`` sorts by creation date
+    and ID and requests each page by filtering for resources that were created after the last resource of the previous
+    page, see :py:meth:`._iter_all_resources` for details."""
+    prefetch: int
+    """Amount of pages which are requested in the background while the caller processes the current page. Defaults to
+    ``0`` which requests the next page only once the current page has been consumed."""
+    max_workers: int
+    """Maximum amount of pages which are requested concurrently. Defaults to ``1`` which requests one page after
+    another. Larger values switch to a concurrent scan of a snapshot of the matching resources, see
+    :py:meth:`._iter_all_resources` for details."""
 
 
 def build_page_params(page_params: PageParams | None = None, default_page_params: PageParams | None = None) -> dict:
@@ -365,7 +580,7 @@ def build_filter_params(filter_params: FilterParams | None = None) -> dict:
     query_params = {}
 
     for property_name, property_filter in filter_params.items():
-        query_param_name = f"filter[{to_camel(property_name)}]"
+        query_param_name = f"filter[{_camel_case(property_name)}]"
 
         if not isinstance(property_filter, tuple):  # t.Any -> (FilterOperator, t.Any)
             property_filter = (FilterOperator.eq, property_filter)
@@ -384,24 +599,33 @@ def build_filter_params(filter_params: FilterParams | None = None) -> dict:
     return query_params
 
 
-def build_sort_params(sort_params: SortParams | None = None) -> dict:
+def build_sort_params(sort_params: SortParams | Iterable[SortParams] | None = None) -> dict:
     if sort_params is None:
-        sort_params = {}
+        sort_params = ()
 
-    query_params = {}
+    if isinstance(sort_params, dict):
+        sort_params = (sort_params,)  # coalesce into tuple
+
+    sort_keys = []
 
-    # check if a property has been specified
-    param_sort_by = sort_params.get("by", None)
+    for sort_param in sort_params:
+        # check if a property has been specified
+        param_sort_by = sort_param.get("by", None)
+
+        if param_sort_by is None:
+            continue
 
-    if param_sort_by is not None:
         # default sort order should be ascending
-        param_sort_order = sort_params.get("order", "ascending")
+        param_sort_order = sort_param.get("order", "ascending")
         # property gets a "-" prepended if sorting in descending order
         param_sort_prefix = "-" if param_sort_order == "descending" else ""
-        # construct the actual query params
-        query_params["sort"] = f"{param_sort_prefix}{to_camel(param_sort_by)}"
+        sort_keys.append(f"{param_sort_prefix}{_camel_case(param_sort_by)}")
 
-    return query_params
+    # construct the actual query params, later properties break ties of earlier ones
+    if len(sort_keys) > 0:
+        return {"sort": ",".join(sort_keys)}
+
+    return {}
 
 
 def build_include_params(include_params: IncludeParams | None = None) -> dict:
@@ -412,7 +636,7 @@ def build_include_params(include_params: IncludeParams | None = None) -> dict:
         include_params = (include_params,)  # coalesce into tuple
 
     # unravel iterable and merge into tuple
-    include_params = tuple(to_camel(p) for p in include_params)
+    include_params = tuple(_camel_case(p) for p in include_params)
 
     if len(include_params) == 0:
         return {}
@@ -420,7 +644,7 @@ def build_include_params(include_params: IncludeParams | None = None) -> dict:
     return {"include": ",".join(include_params)}
 
 
-def build_field_params(field_params: FieldParams | None = None) -> dict:
+def build_field_params(field_params: FieldParams | None = None, only_params: FieldParams | None = None) -> dict:
     if field_params is None:
         field_params = ()  # empty tuple
 
@@ -428,10 +652,17 @@ def build_field_params(field_params: FieldParams | None = None) -> dict:
         field_params = (field_params,)  # coalesce into tuple
 
     # unravel iterable and merge into tuple
-    field_params = tuple(to_camel(p) for p in field_params)
+    field_params = tuple(_camel_case(p) for p in field_params)
 
-    # only allow the addition of fields
-    field_params = tuple(f"+{p}" for p in field_params)
+    if only_params is None:
+        # only allow the addition of fields
+        field_params = tuple(f"+{p}" for p in field_params)
+    else:
+        if isinstance(only_params, str):
+            only_params = (only_params,)  # coalesce into tuple
+
+        # an explicit selection restricts the fields to the selected ones, duplicates are dropped
+        field_params = tuple(dict.fromkeys((*(_camel_case(p) for p in only_params), *field_params)))
 
     if len(field_params) == 0:
         return {}
@@ -446,26 +677,843 @@ def convert_path(path: Iterable[str | UuidIdentifiable]) -> tuple[str, ...]:
         if isinstance(p, str):
             path_parts.append(p)
         else:
-            path_parts.append(str(obtain_uuid_from(p)))
+            path_parts.append(str(obtain_uuid_from(p)))
+
+    return tuple(path_parts)
+
+
+def _resource_id(path: tuple[str | UuidIdentifiable, ...], resource_id: str | UuidIdentifiable | None) -> str:
+    """Returns the ID of the resource which a request to ``path`` reads or modifies. It defaults to the last component of
+    ``path`` which is the ID for all endpoints that are not nested below a resource."""
+    return convert_path((resource_id,) if resource_id is not None else path[-1:])[0]
+
+
+def resolve_auth(auth: AuthParam) -> ClientAuth | PasswordAuth | StaticAuth | None:
+    """Translates strings into :py:class:`.StaticAuth` instances."""
+
+    if isinstance(auth, str):
+        auth = StaticAuth(access_token=auth)
+
+    return auth
+
+
+def _pop_find_all_params(params: dict, include: IncludeParams | None = None) -> tuple[dict, bool]:
+    """Pops all :py:class:`.FindAllKwargs` except for ``auth`` from ``params`` and converts them into query parameters.
+    Returns the query parameters and the meta flag."""
+    page_params = params.pop("page", None)
+    filter_params = params.pop("filter", None)
+    sort_params = params.pop("sort", None)
+    field_params = params.pop("fields", None)
+    only_params = params.pop("only", None)
+    meta_flag = params.pop("meta", False)
+
+    request_params = (
+        build_page_params(page_params)
+        | build_filter_params(filter_params)
+        | build_sort_params(sort_params)
+        | build_include_params(include)
+        | build_field_params(field_params, only_params)
+    )
+
+    return request_params, meta_flag
+
+
+def _pop_get_params(params: dict, include: IncludeParams | None = None) -> tuple[dict, bool]:
+    """Pops all :py:class:`.GetKwargs` except for ``auth`` from ``params`` and converts them into query parameters.
+    Returns the query parameters and the meta flag."""
+    field_params = params.pop("fields", None)
+    only_params = params.pop("only", None)
+    meta_flag = params.pop("meta", False)
+
+    return build_field_params(field_params, only_params) | build_include_params(include), meta_flag
+
+
+def _as_names(names: FieldParams | IncludeParams | None) -> tuple[str, ...]:
+    """Coalesces a single name, an iterable of names or :any:`None` into a tuple of names."""
+    if names is None:
+        return ()
+
+    if isinstance(names, str):
+        return (names,)
+
+    return tuple(names)
+
+
+def _partial_resource_type(
+    resource_type: type[ResourceT], params: dict, include: IncludeParams | None = None
+) -> type[ResourceT]:
+    """Returns the partial model of ``resource_type`` which holds the fields requested by ``params`` and the nested
+    resources ``include``. If ``params`` does not restrict the fields, ``resource_type`` is returned as is."""
+    if params.get("only", None) is None:
+        return resource_type
+
+    names = _as_names(params["only"]) + _as_names(params.get("fields", None)) + _as_names(include)
+
+    return get_model_metadata(resource_type).partial_model(names)
+
+
+def _require_fields(params: dict, *names: str):
+    """Adds fields to the selection of ``params`` which are required to paginate. Does nothing if ``params`` does not
+    restrict the fields."""
+    if params.get("only", None) is not None:
+        params["only"] = _as_names(params["only"]) + names
+
+
+def _pop_iter_params(params: dict) -> tuple[int, int, int, str, int]:
+    """Pops all :py:class:`.IterKwargs` which control the pagination of an iteration from ``params``. Returns the limit
+    and offset of the first page, the maximum amount of concurrent requests, the pagination strategy and the amount of
+    pages which are read ahead."""
+    page_params = {**DEFAULT_PAGE_PARAMS, **(params.pop("page", None) or {})}
+    page_size = params.pop("page_size", None)
+    max_workers = params.pop("max_workers", 1)
+    pagination = params.pop("pagination", "offset")
+    prefetch = params.pop("prefetch", 0)
+    params.pop("meta", None)
+
+    if page_size is not None:
+        page_params["limit"] = page_size
+
+    if page_params["limit"] < 1:
+        raise ValueError(f"page size must be positive, got {page_params['limit']}")
+
+    if max_workers < 1:
+        raise ValueError(f"maximum amount of workers must be positive, got {max_workers}")
+
+    if prefetch < 0:
+        raise ValueError(f"prefetch depth must not be negative, got {prefetch}")
+
+    if pagination not in ("offset", "keyset"):
+        raise ValueError(f"unknown pagination strategy {pagination!r}")
+
+    if pagination == "keyset" and max_workers > 1:
+        raise ValueError("keyset pagination requests pages one after another and cannot be used with multiple workers")
+
+    return page_params["limit"], page_params["offset"], max_workers, pagination, prefetch
+
+
+_END_OF_PAGES = object()
+
+
+def _read_ahead(pages: t.Iterator[list], depth: int) -> t.Iterator[list]:
+    """Consumes ``pages`` in a background thread such that up to ``depth`` pages are requested ahead of the page which
+    is currently processed by the caller. Errors are raised once the caller reaches the page that failed."""
+    buffer = queue.SimpleQueue()
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def produce():
+        try:
+            while not stopped.is_set():
+                if not slots.acquire(timeout=0.1):
+                    continue
+
+                page = next(pages, _END_OF_PAGES)
+
+                if page is _END_OF_PAGES:
+                    return
+
+                buffer.put((page, None))
+        except BaseException as e:
+            # Errors such as KeyboardInterrupt are passed on too, since the caller would wait forever otherwise.
+            buffer.put((None, e))
+        finally:
+            buffer.put((_END_OF_PAGES, None))
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    try:
+        while True:
+            page, error = buffer.get()
+
+            if error is not None:
+                raise error
+
+            if page is _END_OF_PAGES:
+                return
+
+            slots.release()
+            yield page
+    finally:
+        stopped.set()
+
+
+async def _async_read_ahead(pages: t.AsyncIterator[list], depth: int) -> t.AsyncIterator[list]:
+    """Asynchronous counterpart of :py:func:`_read_ahead` which consumes ``pages`` in a background task."""
+    buffer = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def produce():
+        try:
+            while True:
+                await slots.acquire()
+                page = await anext(pages, _END_OF_PAGES)
+
+                if page is _END_OF_PAGES:
+                    return
+
+                buffer.put_nowait((page, None))
+        except BaseException as e:
+            buffer.put_nowait((None, e))
+
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        finally:
+            buffer.put_nowait((_END_OF_PAGES, None))
+
+    producer = asyncio.create_task(produce())
+
+    try:
+        while True:
+            page, error = await buffer.get()
+
+            if error is not None:
+                raise error
+
+            if page is _END_OF_PAGES:
+                return
+
+            slots.release()
+            yield page
+    finally:
+        producer.cancel()
+
+
+def _pin_stable_sort(
+    resource_type: type[BaseModel], sort_params: SortParams | Iterable[SortParams] | None
+) -> list[SortParams]:
+    """Extends sort parameters such that the order of resources is total. Resources are sorted by their creation date if
+    no sort parameters are given and ties are broken by their ID."""
+    if sort_params is None:
+        sort_params = ()
+
+    if isinstance(sort_params, dict):
+        sort_params = (sort_params,)
+
+    metadata = get_model_metadata(resource_type)
+    sort_params = [p for p in sort_params if p.get("by", None) is not None]
+    sort_by = {metadata.alias(p["by"]) for p in sort_params}
+
+    for tie_breaker in ("created_at", "id") if len(sort_params) == 0 else ("id",):
+        if tie_breaker in metadata.aliases and metadata.aliases[tie_breaker] not in sort_by:
+            sort_params.append({"by": tie_breaker})
+
+    return sort_params
+
+
+_datetime_adapter = TypeAdapter(datetime)
+
+
+def _get_created_at(resource: BaseModel | dict) -> datetime:
+    """Returns the creation date of a resource. Resources which were decoded without validation hold the creation date
+    as a string or are plain JSON objects, so both are parsed here."""
+    created_at = resource["createdAt"] if isinstance(resource, dict) else resource.created_at
+    return created_at if isinstance(created_at, datetime) else _datetime_adapter.validate_python(created_at)
+
+
+def _keyset_params(resource_type: type[BaseModel], params: dict) -> FilterParams:
+    """Prepares ``params`` for keyset pagination by pinning the sort order to the creation date and the ID of the
+    resources. Returns the filter parameters of the caller which are extended by the key of each page."""
+    metadata = get_model_metadata(resource_type)
+
+    if "created_at" not in metadata.aliases:
+        raise ValueError(f"keyset pagination requires {resource_type.__name__} to have a creation date")
+
+    if params.get("sort", None) is not None:
+        raise ValueError("keyset pagination defines its own sort order and cannot be combined with sort parameters")
+
+    filter_params = params.pop("filter", None) or {}
+
+    if metadata.aliases["created_at"] in {metadata.alias(k) for k in filter_params}:
+        raise ValueError("keyset pagination filters by creation date and cannot be combined with such a filter")
+
+    params["sort"] = _pin_stable_sort(resource_type, None)
+    _require_fields(params, "created_at")
+
+    return filter_params
+
+
+def _keyset_filter(filter_params: FilterParams, created_after: datetime | None) -> FilterParams:
+    """Extends the filter parameters by the key of the last resource of the previous page."""
+    if created_after is None:
+        return filter_params
+
+    return {**filter_params, "created_at": (FilterOperator.ge, created_after.isoformat())}
+
+
+def _advance_keyset(page: list, created_after: datetime | None, offset: int) -> tuple[datetime, int]:
+    """Returns the key and offset of the page which follows ``page``.
+
+    The Hub cannot filter by a combination of creation date and ID. Hence, pages are filtered for resources which were
+    created at or after the creation date of the last resource of the previous page. The offset skips resources that
+    share this creation date and were already part of previous pages. It only grows with resources that were created
+    at exactly the same time which keeps it small."""
+    last_created_at = _get_created_at(page[-1])
+    ties = sum(1 for resource in page if _get_created_at(resource) == last_created_at)
+
+    if last_created_at == created_after:
+        return last_created_at, offset + ties
+
+    return last_created_at, ties
+
+
+def _can_snapshot(resource_type: type[BaseModel], filter_params: FilterParams | None) -> bool:
+    """Checks if the resources can be capped at an upper bound of their creation date. This requires a ``created_at``
+    field which is not already filtered by the caller."""
+    metadata = get_model_metadata(resource_type)
+
+    if "created_at" not in metadata.aliases:
+        return False
+
+    return metadata.aliases["created_at"] not in {metadata.alias(k) for k in filter_params or {}}
+
+
+def _snapshot_params(resource_type: type[BaseModel], params: dict) -> dict:
+    """Returns the parameters of the request which starts a concurrent scan. The request asks for a single resource
+    only. If possible, this is the newest one since its creation date marks the upper bound of the snapshot."""
+    snapshot_params = {**params, "page": {"limit": 1, "offset": 0}, "meta": True}
+
+    if _can_snapshot(resource_type, params.get("filter", None)):
+        snapshot_params["sort"] = {"by": "created_at", "order": "descending"}
+        _require_fields(snapshot_params, "created_at")
+
+    return snapshot_params
+
+
+def _snapshot_filter(
+    resource_type: type[BaseModel], filter_params: FilterParams | None, newest: list[BaseModel]
+) -> FilterParams | None:
+    """Caps the filter parameters at the creation date of the newest resource so that resources which are created during
+    a concurrent scan do not shift the pages."""
+    if len(newest) == 0 or not _can_snapshot(resource_type, filter_params):
+        return filter_params
+
+    return {**(filter_params or {}), "created_at": (FilterOperator.le, _get_created_at(newest[0]).isoformat())}
+
+
+def _is_last_page(page: list, meta: ResourceListMeta) -> bool:
+    """Checks if ``page`` is the last page of a paginated list response."""
+    return len(page) == 0 or meta.offset + len(page) >= meta.total
+
+
+def _resolve_include(
+    include: IncludeParams | None, include_policy: IncludePolicy, strict: bool = False
+) -> IncludeParams | None:
+    """Narrows the nested resources ``include`` which are available for a request down to the ones selected by
+    ``include_policy``. Selected names which are not available raise an error if ``strict`` is set and are ignored
+    otherwise."""
+    if include_policy == "all":
+        return include
+
+    if include_policy == "none" or include is None:
+        return None
+
+    if isinstance(include, str):
+        include = (include,)
+
+    if isinstance(include_policy, str):
+        include_policy = (include_policy,)
+
+    include, include_policy = tuple(include), set(include_policy)
+
+    if strict and not include_policy.issubset(include):
+        raise ValueError(f"cannot include {sorted(include_policy.difference(include))}, expected a subset of {include}")
+
+    return tuple(name for name in include if name in include_policy)
+
+
+def _check_result_mode(result_mode: str) -> ResultMode:
+    """Raises an error if ``result_mode`` is not a valid :py:type:`~flame_hub.types.ResultMode`."""
+    if result_mode not in t.get_args(ResultMode):
+        raise ValueError(f"unknown result mode {result_mode!r}")
+
+    return result_mode
+
+
+def _resolve_middleware(kwargs: ClientKwargs | AsyncClientKwargs) -> tuple[Middleware, ...]:
+    """Returns the chain of middleware of a client which is configured by ``kwargs``."""
+    middleware = list(kwargs.get("middleware", ()))
+
+    if kwargs.get("coalesce_requests", False):
+        middleware.append(CoalescingMiddleware())
+
+    if kwargs.get("response_cache", None) is not None:
+        middleware.append(kwargs["response_cache"])
+
+    return tuple(middleware)
+
+
+def _is_not_found(e: HubAPIError) -> bool:
+    """Checks if an error was caused by a response with status code 404."""
+    return e.error_response is not None and e.error_response.status_code == httpx.codes.NOT_FOUND.value
+
+
+class ModelMetadata(object):
+    """Metadata of a model class which is required on every request.
+
+    All attributes are computed once per model class by :py:func:`get_model_metadata`. This way, requests look up
+    metadata instead of traversing the model with reflection and parametrizing generic models over and over again.
+    Type adapters are only built on first use since *Create* and *Update* models are never validated from responses.
+
+    Parameters
+    ----------
+    model : :py:class:`type`\\[:py:class:`~pydantic.BaseModel`]
+        Model class to compute metadata for.
+
+    See Also
+    --------
+    :py:func:`.get_model_metadata`, :py:func:`.get_includable_names`, :py:func:`.get_field_names`
+    """
+
+    def __init__(self, model: type[BaseModel]):
+        self.model = model
+        self.includable_names = _get_annotated_property_names(model, IsIncludable)
+        """Names of all properties that are annotated with :py:class:`.IsIncludable`."""
+        self.field_names = _get_annotated_property_names(model, IsOptionalField)
+        """Names of all properties that are annotated with :py:class:`.IsOptionalField`."""
+        self.aliases = {name: field.alias or _camel_case(name) for name, field in model.model_fields.items()}
+        """Maps the names of all fields to their camelCase aliases which are used by the Hub."""
+        self._partial_models: dict[frozenset[str], type[BaseModel]] = {}
+
+    @functools.cached_property
+    def _names_by_alias(self) -> dict[str, str]:
+        return {alias: name for name, alias in self.aliases.items()} | {name: name for name in self.aliases}
+
+    @functools.cached_property
+    def _nested_models(self) -> dict[str, type[BaseModel]]:
+        nested_models = {}
+
+        for name, field in self.model.model_fields.items():
+            annotations = t.get_args(field.annotation) or (field.annotation,)
+            models = [a for a in annotations if isinstance(a, type) and issubclass(a, BaseModel)]
+
+            if len(models) == 1:
+                nested_models[name] = models[0]
+
+        return nested_models
+
+    @functools.cached_property
+    def _defaults(self) -> dict[str, FieldInfo]:
+        return {name: field for name, field in self.model.model_fields.items() if not field.is_required()}
+
+    @functools.cached_property
+    def _shareable_models(self) -> tuple[tuple[str, str, type[BaseModel]], ...]:
+        # Only includable resources with a default can be left out of the validation and attached afterwards.
+        return tuple(
+            (name, self.aliases[name], self._nested_models[name])
+            for name in self.includable_names
+            if name in self._nested_models and name in self._defaults
+        )
+
+    @property
+    def has_shareable_resources(self) -> bool:
+        """Whether the model includes nested resources which can be shared by :py:meth:`validate_shared`."""
+        return len(self._shareable_models) > 0
+
+    @functools.cached_property
+    def _list_adapter(self) -> TypeAdapter[list[BaseModel]]:
+        return TypeAdapter(list[self.model])
+
+    def validate_shared(
+        self, data: list[dict], identity_map: dict[tuple[type[BaseModel], t.Any], BaseModel]
+    ) -> list[BaseModel]:
+        """Validates a list of JSON objects like :py:meth:`~pydantic.BaseModel.model_validate`, but shares included
+        nested resources through ``identity_map``. It maps model classes and IDs to validated instances. Nested
+        resources which are already in ``identity_map`` are not validated again. All others are validated and added to
+        it. This way, a nested resource which is included in many resources of a response is validated and allocated
+        once. The resources themselves are validated in a single pass without their shared nested resources, which are
+        attached afterwards."""
+        stripped_data, shared_resources = [], []
+
+        for item in data:
+            shared = {}
+
+            for name, alias, nested_model in self._shareable_models:
+                value = item.get(alias, None)
+
+                if not isinstance(value, dict) or value.get("id", None) is None:
+                    continue
+
+                key = (nested_model, value["id"])
+
+                if key not in identity_map:
+                    identity_map[key] = get_model_metadata(nested_model).validate_shared([value], identity_map)[0]
+
+                shared[alias] = name, identity_map[key]
+
+            stripped_data.append({k: v for k, v in item.items() if k not in shared} if len(shared) > 0 else item)
+            shared_resources.append(shared)
+
+        instances = self._list_adapter.validate_python(stripped_data)
+
+        for instance, shared in zip(instances, shared_resources):
+            for name, nested_instance in shared.values():
+                instance.__dict__[name] = nested_instance
+                instance.__pydantic_fields_set__.add(name)
+
+        return instances
+
+    def construct(self, data: dict) -> BaseModel:
+        """Builds an instance of the model from a JSON object without validating it. Keys are matched against aliases
+        and names of fields, unknown keys are dropped and nested resources are constructed as well. Other values are
+        kept as they are, e.g. dates remain strings."""
+        names_by_alias = self._names_by_alias
+        values = {names_by_alias[key]: value for key, value in data.items() if key in names_by_alias}
+
+        for name, nested_model in self._nested_models.items():
+            value = values.get(name, None)
+
+            if isinstance(value, dict):
+                values[name] = get_model_metadata(nested_model).construct(value)
+
+        fields_set = set(values)
+
+        for name in self._defaults.keys() - fields_set:
+            values[name] = self._defaults[name].get_default(call_default_factory=True, validated_data=values)
+
+        # This mirrors what BaseModel.model_construct does, but with aliases and nested models resolved up front.
+        instance = object.__new__(self.model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+
+        return instance
+
+    def alias(self, name: str) -> str:
+        """Returns the alias of a field or the camelCase version of ``name`` if the model has no such field."""
+        return self.aliases.get(name, None) or _camel_case(name)
+
+    def partial_model(self, names: Iterable[str]) -> type[BaseModel]:
+        """Returns a model which only has the fields ``names`` of the model. Fields keep their types, defaults and
+        validators while all other fields are absent, so accessing them raises an :py:exc:`AttributeError`. Partial
+        models are created once per selection of fields and looked up afterwards.
+
+        Raises
+        ------
+        :py:exc:`ValueError`
+            If the model has no field with one of the ``names``.
+        """
+        names = frozenset(names)
+
+        try:
+            return self._partial_models[names]
+        except KeyError:
+            pass
+
+        if not names.issubset(self.aliases):
+            raise ValueError(f"{self.model.__name__} has no fields {sorted(names.difference(self.aliases))}")
+
+        partial_model = create_model(
+            f"Partial{self.model.__name__}",
+            __config__=self.model.model_config,
+            __module__=self.model.__module__,
+            **{
+                name: (field.annotation, copy.copy(field))
+                for name, field in self.model.model_fields.items()
+                if name in names
+            },
+        )
+
+        # Concurrent callers might create the same partial model, but all of them get the first one.
+        return self._partial_models.setdefault(names, partial_model)
+
+    @functools.cached_property
+    def resource_list_adapter(self) -> TypeAdapter[ResourceList]:
+        """Type adapter which validates the body of a list response."""
+        return TypeAdapter(ResourceList[self.model])
+
+    @functools.cached_property
+    def single_resource_adapter(self) -> TypeAdapter[WrappedResource | BaseModel]:
+        """Type adapter which validates the body of a single resource response. Enveloped bodies are tried first. Since
+        the union is validated from left to right, envelopes are detected in the same pass that validates the
+        resource."""
+        return TypeAdapter(t.Annotated[WrappedResource[self.model] | self.model, Field(union_mode="left_to_right")])
+
+
+_model_metadata: dict[t.Any, ModelMetadata] = {}
+_model_metadata_lock = threading.Lock()
+
+
+def get_model_metadata(model: type[BaseModel]) -> ModelMetadata:
+    """Returns the :py:class:`.ModelMetadata` of a model class. It is computed on the first call and looked up
+    afterwards.
+
+    See Also
+    --------
+    :py:class:`.ModelMetadata`
+    """
+    try:
+        return _model_metadata[model]
+    except KeyError:
+        pass
+
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        raise TypeError(f"metadata is only available for model classes, got {model!r}")
+
+    with _model_metadata_lock:
+        if model not in _model_metadata:
+            _model_metadata[model] = ModelMetadata(model)
+
+        return _model_metadata[model]
+
+
+@functools.cache
+def _data_envelope_adapter(resource_type: t.Any) -> TypeAdapter[DataEnvelope | t.Any]:
+    """Returns a cached adapter which validates the body of a create, update, command or upload response with
+    ``resource_type``, which may also be a type such as :py:class:`list`\\[:py:class:`~pydantic.BaseModel`] that is
+    not a model class."""
+    return TypeAdapter(t.Annotated[DataEnvelope[resource_type] | resource_type, Field(union_mode="left_to_right")])
+
+
+def _is_enveloped(response_body: t.Any) -> bool:
+    """Checks if a response body is enveloped. In that case resources are available via the 'data' key and further meta
+    information via the 'meta' key."""
+    return isinstance(response_body, dict) and "data" in response_body and "meta" in response_body
+
+
+def _decode_resource(resource_type: type[ResourceT], data: dict, result_mode: ResultMode) -> ResourceT | dict:
+    """Decodes a single JSON object into a resource without validation according to ``result_mode``."""
+    if result_mode == "raw":
+        return data
+
+    return get_model_metadata(resource_type).construct(data)
+
+
+def _parse_resource_list(
+    resource_type: type[ResourceT],
+    r: httpx.Response,
+    meta_flag: bool,
+    result_mode: ResultMode = "validate",
+    deduplicate: bool = False,
+) -> ResourceListResult[ResourceT]:
+    """Validates a list response with ``resource_type`` and attaches the meta information if ``meta_flag`` is set. The
+    raw response body is validated directly without decoding it into Python objects first. If ``deduplicate`` is set
+    and ``resource_type`` includes nested resources, the body is decoded first instead and nested resources with the
+    same ID are validated once and shared, see :py:meth:`.ModelMetadata.validate_shared`. If ``result_mode`` is
+    ``"lazy"``, resources are validated on first access. If it is ``"construct"``, ``"raw"`` or ``"columns"``, only the
+    meta information is validated."""
+    metadata = get_model_metadata(resource_type)
+
+    if result_mode == "validate" and not (deduplicate and metadata.has_shareable_resources):
+        resource_list = metadata.resource_list_adapter.validate_json(r.content)
+        data, meta = resource_list.data, resource_list.meta
+    elif result_mode == "validate":
+        response_body = pydantic_core.from_json(r.content)
+        meta = ResourceListMeta.model_validate(response_body["meta"])
+        data = metadata.validate_shared(response_body["data"], {})
+    else:
+        response_body = pydantic_core.from_json(r.content)
+        meta = ResourceListMeta.model_validate(response_body["meta"])
+
+        if result_mode == "lazy":
+            data = LazyResourceList(resource_type, response_body["data"], meta)
+        elif result_mode == "columns":
+            # Imported here since the columnar helpers depend on this module.
+            from flame_hub._columns import to_columns
+
+            data = to_columns(response_body["data"], resource_type)
+        else:
+            data = [_decode_resource(resource_type, d, result_mode) for d in response_body["data"]]
+
+    if meta_flag:
+        return data, meta
+    else:
+        return data
+
+
+def _parse_single_resource(
+    resource_type: type[ResourceT], r: httpx.Response, meta_flag: bool, result_mode: ResultMode = "validate"
+) -> SingleResourceResult[ResourceT]:
+    """Validates a possibly enveloped response with ``resource_type`` and attaches the meta information if
+    ``meta_flag`` is set. The raw response body is validated directly without decoding it into Python objects first.
+    If ``result_mode`` is ``"construct"`` or ``"raw"``, only the meta information is validated. Single resources are
+    always validated right away if ``result_mode`` is ``"lazy"`` or ``"columns"``."""
+    if result_mode in ("validate", "lazy", "columns"):
+        resource = get_model_metadata(resource_type).single_resource_adapter.validate_json(r.content)
+    else:
+        response_body = pydantic_core.from_json(r.content)
+
+        if _is_enveloped(response_body):
+            resource = WrappedResource[resource_type].model_construct(
+                data=_decode_resource(resource_type, response_body["data"], result_mode),
+                meta=SingleResourceMeta.model_validate(response_body["meta"]),
+            )
+        else:
+            resource = _decode_resource(resource_type, response_body, result_mode)
+
+    if isinstance(resource, WrappedResource):
+        if meta_flag:
+            return resource.data, resource.meta
+        return resource.data
+    else:
+        if meta_flag:
+            raise ValueError(f"Single resources of type {resource_type} do not have meta data.")
+        return resource
+
+
+def _parse_resource(resource_type: type[ResourceT], r: httpx.Response) -> ResourceT:
+    """Validates a possibly enveloped response of a create, update, command or upload request with ``resource_type``.
+    The raw response body is validated directly without decoding it into Python objects first. Besides model classes,
+    ``resource_type`` may be a type such as :py:class:`list`\\[:py:class:`~pydantic.BaseModel`] for uploads."""
+    resource = _data_envelope_adapter(resource_type).validate_json(r.content)
+
+    if isinstance(resource, DataEnvelope):
+        # The meta field is empty for create and update responses so it gets thrown away here.
+        return resource.data
+    return resource
+
+
+class _RequestPlan(object):
+    """Request which a client sends on behalf of a fundamental method together with the handling of its response.
+
+    :py:class:`.BaseClient` builds a plan for every fundamental method. Synchronous and asynchronous clients only send
+    the request of a plan with their ``_send_plan`` method and pass the response back to it, so both share everything
+    but the I/O.
+
+    Parameters
+    ----------
+    method : Literal["GET", "POST", "PUT", "DELETE"]
+        Method of the request.
+    path : :py:class:`tuple`\\[:py:class:`str` | :py:class:`~flame_hub.types.UuidIdentifiable`, ...]
+        Components of the path of the endpoint.
+    expected_code : :py:class:`int`
+        Expected status code of the response.
+    operation : :py:class:`~flame_hub.middleware.Operation`
+        Operation on whose behalf the request is sent.
+    params : :py:class:`dict`
+        Keyword arguments which are passed to the ``_request`` method of the client.
+    parse : :py:class:`~collections.abc.Callable`\\[[:py:class:`httpx2.Response`], :py:class:`~typing.Any`], optional
+        Function which returns the result of the response. If not set, the result is :any:`None`.
+    none_if_not_found : :py:class:`bool`
+        Whether :any:`None` is returned instead of raising an error if the Hub responds with ``404 Not Found``.
+    finish : :py:class:`~collections.abc.Callable`\\[[], :any:`None`], optional
+        Function which is called once the request was sent, no matter if it failed.
+    """
+
+    def __init__(
+        self,
+        method: t.Literal["GET", "POST", "PUT", "DELETE"],
+        path: tuple[str | UuidIdentifiable, ...],
+        expected_code: int,
+        operation: Operation,
+        params: dict,
+        parse: t.Callable[[httpx.Response], t.Any] | None = None,
+        none_if_not_found: bool = False,
+        finish: t.Callable[[], None] | None = None,
+    ):
+        self.method = method
+        self.path = path
+        self.expected_code = expected_code
+        self.operation = operation
+        self.params = params
+        self.parse = parse
+        self.none_if_not_found = none_if_not_found
+        self.finish = finish
+        self.done = False
+        """Whether :py:attr:`result` is known without sending the request, e.g. since it was cached."""
+        self.result: t.Any = None
+        """Result of the plan if :py:attr:`done` is set."""
+
+    def resolve(self, result: t.Any) -> "_RequestPlan":
+        """Marks the plan as done with ``result`` such that no request is sent."""
+        self.done, self.result = True, result
+        return self
+
+
+class _IterPlan(object):
+    """Pagination of an iteration over resources which is shared by synchronous and asynchronous clients.
+
+    The plan holds the keyword arguments of the requests for every page which are passed to the
+    ``_find_all_resources`` method of a client. ``iter_params`` are the parameters which were popped from ``params``
+    with :py:func:`_pop_iter_params`. Sequential pages are requested one after another with
+    :py:meth:`next_page_kwargs` and :py:meth:`advance`. Concurrent scans start with a request built by
+    :py:meth:`snapshot_kwargs` whose response determines all pages, see :py:meth:`concurrent_page_kwargs`.
+    """
+
+    def __init__(
+        self,
+        resource_type: type[ResourceT],
+        path: tuple[str, ...],
+        include: IncludeParams | None,
+        expected_code: int,
+        iter_params: tuple[int, int, int, str, int],
+        result_mode: ResultMode,
+        column_type: type[ResourceT] | None,
+        params: dict,
+    ):
+        self.limit, self.offset, self.max_workers, self.pagination, self.prefetch = iter_params
+        self.resource_type = resource_type
+        self.path = path
+        self._include = include
+        self._expected_code = expected_code
+        self._result_mode = result_mode
+        self._column_type = column_type
+        self._params = params
+        self._created_after: datetime | None = None
+
+        if self.pagination == "keyset":
+            self._filter_params = _keyset_params(resource_type, params)
+        elif self.max_workers > 1:
+            params["sort"] = _pin_stable_sort(resource_type, params.get("sort", None))
+
+    @property
+    def read_ahead(self) -> int:
+        """Amount of pages which are requested ahead in the background. Concurrent scans read ahead on their own."""
+        return self.prefetch if self.max_workers == 1 else 0
+
+    @property
+    def depth(self) -> int:
+        """Amount of pages which are requested ahead of the current page in a concurrent scan."""
+        return self.max_workers + self.prefetch
+
+    def _find_kwargs(self, **kwargs) -> dict:
+        return {"include": self._include, "expected_code": self._expected_code, **self._params, **kwargs}
+
+    def next_page_kwargs(self) -> dict:
+        """Returns the keyword arguments of the request for the next sequential page."""
+        page_kwargs = {"page": {"limit": self.limit, "offset": self.offset}, "meta": True}
+
+        if self.pagination == "keyset":
+            page_kwargs["filter"] = _keyset_filter(self._filter_params, self._created_after)
+
+        return self._find_kwargs(**page_kwargs)
+
+    def advance(self, page: list, meta: ResourceListMeta) -> bool:
+        """Advances to the page which follows ``page``. Returns whether there is another page."""
+        if _is_last_page(page, meta):
+            return False
+
+        if self.pagination == "keyset":
+            self._created_after, self.offset = _advance_keyset(page, self._created_after, self.offset)
+        else:
+            self.offset += len(page)
 
-    return tuple(path_parts)
+        return True
 
+    def snapshot_kwargs(self) -> dict:
+        """Returns the keyword arguments of the request which starts a concurrent scan."""
+        return {"expected_code": self._expected_code, **_snapshot_params(self.resource_type, self._params)}
 
-def resolve_auth(auth: AuthParam) -> ClientAuth | PasswordAuth | StaticAuth | None:
-    """Translates strings into :py:class:`.StaticAuth` instances."""
+    def concurrent_page_kwargs(self, newest: list, meta: ResourceListMeta) -> t.Iterator[dict]:
+        """Returns the keyword arguments of the requests for all pages of a concurrent scan. ``newest`` and ``meta`` are
+        the result of the request built by :py:meth:`snapshot_kwargs`."""
+        self._params["filter"] = _snapshot_filter(self.resource_type, self._params.get("filter", None), newest)
 
-    if isinstance(auth, str):
-        auth = StaticAuth(access_token=auth)
+        return (
+            self._find_kwargs(page={"limit": self.limit, "offset": page_offset})
+            for page_offset in range(self.offset, meta.total, self.limit)
+        )
 
-    return auth
+    def items(self, page: list) -> list:
+        """Returns the items which are yielded for ``page``. These are its resources or a single dictionary of columns
+        if the result mode is ``"columns"``."""
+        if self._result_mode == "columns":
+            # Imported here since the columnar helpers depend on this module.
+            from flame_hub._columns import to_columns
 
+            return [to_columns(page, self._column_type)]
 
-def _is_enveloped(response_body: dict) -> bool:
-    """Checks if a response body is enveloped. In that case resources are available via the 'data' key and further meta
-    information via the 'meta' key."""
-    if "data" in response_body and "meta" in response_body:
-        return True
-    return False
+        return page
 
 
 class BaseClient(object):
@@ -498,23 +1546,140 @@ class BaseClient(object):
     ):
         client = kwargs.get("client", None)
         self._client = client or httpx.Client(auth=resolve_auth(auth), base_url=base_url)
+        self._result_mode = _check_result_mode(kwargs.get("result_mode", "validate"))
+        self._include_policy = kwargs.get("include_policy", "all")
+        self._entity_cache = kwargs.get("entity_cache", None)
+        self._middleware = _resolve_middleware(kwargs)
 
     def close(self):
         """Closes the internally used :py:class:`httpx2.Client` instance."""
         self._client.close()
 
+    def _pop_result_mode(self, params: dict) -> ResultMode:
+        """Pops the result mode from ``params`` and falls back to the default result mode of the client."""
+        result_mode = params.pop("result_mode", None)
+        return self._result_mode if result_mode is None else _check_result_mode(result_mode)
+
+    def _pop_include(self, params: dict, include: IncludeParams | None) -> tuple[str, ...]:
+        """Pops the include policy from ``params`` and applies it to the nested resources ``include`` which are
+        available for a request. Falls back to the default include policy of the client. Returns the names of the
+        nested resources to include."""
+        include_policy = params.pop("include_policy", None)
+
+        if include_policy is None:
+            return _as_names(_resolve_include(include, self._include_policy))
+
+        return _as_names(_resolve_include(include, include_policy, strict=True))
+
+    def _entity_cache_key(
+        self,
+        resource_type: type[BaseModel],
+        path: tuple[str | UuidIdentifiable, ...],
+        request_params: dict,
+        meta_flag: bool,
+        result_mode: ResultMode,
+        params: dict,
+    ) -> tuple | None:
+        """Returns the key under which the entity cache holds the result of a get request or :any:`None` if the result
+        is not cached. Results are kept per base URL and identity of the client, so clients of different Hubs or
+        principals can share a cache. Requests with their own authentication flow and clients whose identity is unknown
+        bypass the cache since they might see different resources."""
+        if self._entity_cache is None or "auth" in params or not self._entity_cache.is_cached(resource_type):
+            return None
+
+        identity = auth_identity(self._client.auth)
+
+        if identity is None:
+            return None
+
+        return (
+            str(self._client.base_url),
+            identity,
+            resource_type,
+            convert_path(path),
+            tuple(sorted(request_params.items())),
+            meta_flag,
+            result_mode,
+        )
+
+    def _parse_response(
+        self,
+        operation: Operation,
+        parse_fn: t.Callable[..., t.Any],
+        resource_type: type[ResourceT],
+        r: httpx.Response,
+        meta_flag: bool,
+        result_mode: ResultMode,
+        **kwargs,
+    ) -> t.Any:
+        """Parses the response ``r`` of ``operation`` with ``parse_fn`` and passes the parsing through the middleware of
+        the client, see :py:meth:`.Middleware.parse`."""
+
+        def parse():
+            return parse_fn(resource_type, r, meta_flag, result_mode, **kwargs)
+
+        if len(self._middleware) == 0:
+            return parse()
+
+        # Other result modes return mutable JSON objects or lazy lists which must not be shared.
+        parse_key = (parse_fn, resource_type, meta_flag, *sorted(kwargs.items())) if result_mode == "validate" else None
+
+        return _parse_through(self._middleware, operation, r, parse_key, parse)
+
+    def _invalidate_entity(self, resource_id: str):
+        """Removes the resource with ID ``resource_id`` from the entity cache."""
+        if self._entity_cache is not None:
+            self._entity_cache.invalidate(resource_id)
+
+    def _build_request(
+        self,
+        method: t.Literal["GET", "POST", "PUT", "DELETE"],
+        *path: str | UuidIdentifiable,
+        **params,
+    ) -> tuple[httpx.Request, t.Any]:
+        """Builds a request with the internally used HTTP client and resolves the authentication flow that overrides the
+        client's default for this request only."""
+        auth = params.pop("auth", httpx.USE_CLIENT_DEFAULT)
+        request = self._client.build_request(method, "/".join(convert_path(path)), **params)
+
+        return request, resolve_auth(auth)
+
+    def _build_operation(
+        self,
+        operation: Operation | None,
+        method: t.Literal["GET", "POST", "PUT", "DELETE"],
+        path: tuple[str | UuidIdentifiable, ...],
+        stream: bool,
+        params: dict,
+    ) -> Operation:
+        """Builds the request of ``operation`` and binds it to the operation. Requests which are not sent on behalf of
+        a high-level operation are described as a generic ``"request"`` operation."""
+        if operation is None:
+            operation = Operation("request")
+
+        operation.request, operation.auth = self._build_request(method, *path, **params)
+        operation.method = method
+        operation.path = tuple(convert_path(path))
+        operation.base_url = self._client.base_url
+        operation.identity = auth_identity(self._client.auth)
+        operation.stream = stream
+
+        return operation
+
     def _request(
         self,
         method: t.Literal["GET", "POST", "PUT", "DELETE"],
         *path: str | UuidIdentifiable,
         expected_code: int,
         stream: bool = False,
+        operation: Operation | None = None,
         **params,
     ) -> httpx.Response:
         """Base method which is used by all other low-level methods that request the Hub.
 
         This method takes care of all :py:class:`.BaseKwargs`. It overrides the authentication flow for only one
-        request and checks if the response's status code matches the expected code.
+        request, passes the request through the middleware of the client and checks if the response's status code
+        matches the expected code.
 
         Parameters
         ----------
@@ -526,6 +1691,9 @@ class BaseClient(object):
             The expected status code of the response from the ``GET`` request. This defaults to ``200``.
         stream : :py:class:`bool`
             Whether the response should be streamed or not.
+        operation : :py:class:`~flame_hub.middleware.Operation`, optional
+            High-level operation on whose behalf the request is sent. It is passed through the middleware of the client
+            together with the request. Defaults to a generic ``"request"`` operation.
         **params
             Further keyword arguments from which all :py:class:`.BaseKwargs` are popped and all remaining arguments are
             then passed into :py:meth:`httpx2.Client.build_request`.
@@ -541,9 +1709,12 @@ class BaseClient(object):
             If the status code of the response does not match `expected_code`.
         """
 
-        auth = params.pop("auth", httpx.USE_CLIENT_DEFAULT)
-        request = self._client.build_request(method, "/".join(convert_path(path)), **params)
-        r = self._client.send(request, stream=stream, auth=resolve_auth(auth))
+        operation = self._build_operation(operation, method, path, stream, params)
+
+        if len(self._middleware) == 0:
+            r = self._send(operation)
+        else:
+            r = _send_through(self._middleware, operation, self._send)
 
         if r.status_code != expected_code:
             if stream:
@@ -552,6 +1723,171 @@ class BaseClient(object):
 
         return r
 
+    def _send(self, operation: Operation) -> httpx.Response:
+        """Sends the request of ``operation`` with the internally used HTTP client."""
+        return self._client.send(operation.request, stream=operation.stream, auth=operation.auth)
+
+    def _send_plan(self, plan: _RequestPlan) -> t.Any:
+        """Sends the request of ``plan`` unless its result is already known and returns the result of the plan."""
+        if plan.done:
+            return plan.result
+
+        try:
+            r = self._request(
+                plan.method, *plan.path, expected_code=plan.expected_code, operation=plan.operation, **plan.params
+            )
+        except HubAPIError as e:
+            if plan.none_if_not_found and _is_not_found(e):
+                return None
+            else:
+                raise
+        finally:
+            if plan.finish is not None:
+                plan.finish()
+
+        return None if plan.parse is None else plan.parse(r)
+
+    def _plan_find_all(
+        self,
+        resource_type: type[ResourceT],
+        path: tuple[str, ...],
+        include: IncludeParams | None,
+        expected_code: int,
+        params: dict,
+    ) -> _RequestPlan:
+        """Plans the request of :py:meth:`_find_all_resources`."""
+        operation = Operation("find", resource_type, params)
+        include = self._pop_include(params, include)
+        resource_type = _partial_resource_type(resource_type, params, include)
+        request_params, meta_flag = _pop_find_all_params(params, include)
+        result_mode = self._pop_result_mode(params)
+
+        def parse(r: httpx.Response) -> ResourceListResult[ResourceT]:
+            # Nested resources repeat across the resources of a page, so they are only validated once.
+            return self._parse_response(
+                operation, _parse_resource_list, resource_type, r, meta_flag, result_mode, deduplicate=len(include) > 0
+            )
+
+        return _RequestPlan("GET", path, expected_code, operation, {"params": request_params, **params}, parse)
+
+    def _plan_iter(
+        self,
+        resource_type: type[ResourceT],
+        path: tuple[str, ...],
+        include: IncludeParams | None,
+        expected_code: int,
+        params: dict,
+    ) -> _IterPlan:
+        """Plans the pagination of :py:meth:`_iter_all_resources`."""
+        iter_params = _pop_iter_params(params)
+        result_mode = self._pop_result_mode(params)
+        column_type = None
+
+        if result_mode == "columns":
+            column_type = _partial_resource_type(resource_type, params, self._pop_include({**params}, include))
+
+        # Pages are requested as plain JSON objects in columnar mode and turned into columns once they arrive.
+        params["result_mode"] = "raw" if result_mode == "columns" else result_mode
+
+        return _IterPlan(resource_type, path, include, expected_code, iter_params, result_mode, column_type, params)
+
+    def _plan_create(
+        self,
+        resource_type: type[ResourceT],
+        resource: BaseModel,
+        path: tuple[str, ...],
+        expected_code: int,
+        params: dict,
+    ) -> _RequestPlan:
+        """Plans the request of :py:meth:`_create_resource`."""
+        return _RequestPlan(
+            "POST",
+            path,
+            expected_code,
+            Operation("create", resource_type, params),
+            {"json": resource.model_dump(mode="json"), **params},
+            functools.partial(_parse_resource, resource_type),
+        )
+
+    def _plan_get(
+        self,
+        resource_type: type[ResourceT],
+        path: tuple[str | UuidIdentifiable, ...],
+        include: IncludeParams | None,
+        expected_code: int,
+        resource_id: str | UuidIdentifiable | None,
+        params: dict,
+    ) -> _RequestPlan:
+        """Plans the request of :py:meth:`_get_single_resource`. The plan is already done if the entity cache holds its
+        result."""
+        model = resource_type
+        operation = Operation("get", resource_type, params)
+        include = self._pop_include(params, include)
+        resource_type = _partial_resource_type(resource_type, params, include)
+        request_params, meta_flag = _pop_get_params(params, include)
+        result_mode = self._pop_result_mode(params)
+        cache_key = self._entity_cache_key(model, path, request_params, meta_flag, result_mode, params)
+
+        def parse(r: httpx.Response) -> SingleResourceResult:
+            result = self._parse_response(operation, _parse_single_resource, resource_type, r, meta_flag, result_mode)
+
+            if cache_key is not None:
+                self._entity_cache.put(cache_key, model, _resource_id(path, resource_id), result)
+
+            return result
+
+        plan = _RequestPlan(
+            "GET", path, expected_code, operation, {"params": request_params, **params}, parse, none_if_not_found=True
+        )
+
+        if cache_key is not None:
+            found, result = self._entity_cache.get(cache_key)
+
+            if found:
+                return plan.resolve(result)
+
+        return plan
+
+    def _plan_update(
+        self,
+        resource_type: type[ResourceT],
+        resource: BaseModel,
+        path: tuple[str | UuidIdentifiable, ...],
+        expected_code: int,
+        resource_id: str | UuidIdentifiable | None,
+        params: dict,
+    ) -> _RequestPlan:
+        """Plans the request of :py:meth:`_update_resource`."""
+        return _RequestPlan(
+            "POST",
+            path,
+            expected_code,
+            Operation("update", resource_type, params),
+            # Exclude defaults so that properties that are set to UNSET are excluded from update models.
+            {"json": resource.model_dump(mode="json", exclude_defaults=True), **params},
+            functools.partial(_parse_resource, resource_type),
+            # The resource might have changed even if the request failed.
+            finish=functools.partial(self._invalidate_entity, _resource_id(path, resource_id)),
+        )
+
+    def _plan_delete(
+        self,
+        path: tuple[str | UuidIdentifiable, ...],
+        expected_code: int,
+        resource_id: str | UuidIdentifiable | None,
+        params: dict,
+    ) -> _RequestPlan:
+        """Plans the request of :py:meth:`_delete_resource`."""
+        return _RequestPlan(
+            "DELETE",
+            path,
+            expected_code,
+            Operation("delete", params=params),
+            params,
+            # The resource might be gone even if the request failed.
+            finish=functools.partial(self._invalidate_entity, _resource_id(path, resource_id)),
+        )
+
     def _get_all_resources(
         self,
         resource_type: type[ResourceT],
@@ -602,7 +1938,9 @@ class BaseClient(object):
             Extend the default resource field selection by explicitly name one or more field names.
         include : :py:type:`~flame_hub.types.IncludeParams`, optional
             Extend the default resource fields by explicitly list resource names to nest in the response. See the
-            :doc:`model specifications <models_api>` which resources can be included in other resources.
+            :doc:`model specifications <models_api>` which resources can be included in other resources. The include
+            policy of the client or of ``**params`` narrows them down further, see
+            :py:type:`~flame_hub.types.IncludePolicy`.
         expected_code : :py:class:`int`
             The expected status code of the response from the ``GET`` request. This defaults to ``200``.
         **params : :py:obj:`~typing.Unpack` [:py:class:`.FindAllKwargs`]
@@ -629,29 +1967,118 @@ class BaseClient(object):
         :py:meth:`_get_all_resources`, :py:meth:`_get_single_resource`
         """
 
-        # merge processed filter and page params
-        page_params = params.pop("page", None)
-        filter_params = params.pop("filter", None)
-        sort_params = params.pop("sort", None)
-        field_params = params.pop("fields", None)
-        meta_flag = params.pop("meta", False)
-
-        request_params = (
-            build_page_params(page_params)
-            | build_filter_params(filter_params)
-            | build_sort_params(sort_params)
-            | build_include_params(include)
-            | build_field_params(field_params)
-        )
+        return self._send_plan(self._plan_find_all(resource_type, path, include, expected_code, params))
 
-        r = self._request("GET", *path, expected_code=expected_code, params=request_params, **params)
+    def _iter_all_resources(
+        self,
+        resource_type: type[ResourceT],
+        *path: str,
+        include: IncludeParams | None = None,
+        expected_code: int = httpx.codes.OK.value,
+        **params: te.Unpack[IterKwargs],
+    ) -> t.Iterator[ResourceT]:
+        """Iterate over all resources at the specified path on the FLAME Hub that match certain criteria.
 
-        resource_list = ResourceList[resource_type](**r.json())
+        This method requests pages of resources with :py:meth:`_find_all_resources` and yields the resources one by one.
+        The next page is only requested once all resources of the current page have been consumed, so at most one page
+        is held in memory at a time. The iteration ends once the total amount of resources reported by the Hub is
+        exhausted or if the consumer stops iterating.
 
-        if meta_flag:
-            return resource_list.data, resource_list.meta
-        else:
-            return resource_list.data
+        Parameters
+        ----------
+        resource_type : :py:class:`type`\\[:py:type:`~flame_hub._base_client.ResourceT`]
+            A Pydantic subclass used to validate the response from the FLAME Hub.
+        *path : :py:class:`str`
+            A string or multiple strings that define the endpoint.
+        include : :py:type:`~flame_hub.types.IncludeParams`, optional
+            Resource names to nest in the response.
+        expected_code : :py:class:`int`
+            The expected status code of the responses to the ``GET`` requests. This defaults to ``200``.
+        **params : :py:obj:`~typing.Unpack` [:py:class:`.IterKwargs`]
+            Further keyword arguments to define filtering, sorting and the page size.
+
+        Returns
+        -------
+        :py:class:`~typing.Iterator`\\[:py:type:`~flame_hub._base_client.ResourceT`]
+            Iterator over all resources of type ``resource_type`` that match the criteria defined in ``**params``.
+
+        Raises
+        ------
+        :py:exc:`.HubAPIError`
+            If the status code of a response does not match `expected_code`.
+        :py:exc:`~pydantic_core._pydantic_core.ValidationError`
+            If the resources returned by the Hub instance do not validate with the given ``resource_type``.
+
+        Notes
+        -----
+        If ``max_workers`` is larger than ``1``, pages are requested concurrently. The first request asks for the
+        newest matching resource. Its creation date caps all following requests and the total amount of resources in
+        its meta information determines the offsets of all pages. These are requested with at most ``max_workers``
+        threads while the resources are still yielded in order. The sort order is made total by sorting by creation date
+        if no sort order is given and by breaking ties with the ID of the resources. Resources which are created during
+        the iteration are therefore skipped and do not shift pages. Resources without a creation date are not capped.
+        In addition to the pages which are requested by the workers, ``prefetch`` further pages are requested ahead.
+
+        If the result mode is ``"columns"``, one dictionary of columns is yielded per page instead of single resources,
+        see :py:func:`~flame_hub.to_columns`.
+
+        If ``prefetch`` is positive, pages are requested in the background while the caller processes the current page
+        such that at most ``prefetch`` pages are read ahead. This way, processing and network time overlap.
+
+        If ``pagination`` is ``"keyset"``, resources are sorted by creation date and ID. Instead of growing offsets,
+        each page is filtered for resources which were created at or after the last resource of the previous page. Ties
+        of the creation date are skipped with a small offset. This way, every page costs the same no matter how far the
+        iteration has progressed and resources which are created during the iteration neither shift nor duplicate
+        resources. Keyset pagination requires resources with a creation date and cannot be combined with ``sort``,
+        ``max_workers`` or a filter on the creation date.
+
+        See Also
+        --------
+        :py:meth:`_find_all_resources`
+        """
+
+        plan = self._plan_iter(resource_type, path, include, expected_code, params)
+        pages = self._iter_pages_concurrently(plan) if plan.max_workers > 1 else self._iter_pages(plan)
+
+        if plan.read_ahead > 0:
+            pages = _read_ahead(pages, plan.read_ahead)
+
+        for page in pages:
+            yield from plan.items(page)
+
+    def _iter_pages(self, plan: _IterPlan) -> t.Iterator[list[ResourceT]]:
+        """Implements the sequential offset and keyset pagination of :py:meth:`_iter_all_resources`."""
+        while True:
+            page, meta = self._find_all_resources(plan.resource_type, *plan.path, **plan.next_page_kwargs())
+
+            yield page
+
+            if not plan.advance(page, meta):
+                return
+
+    def _iter_pages_concurrently(self, plan: _IterPlan) -> t.Iterator[list[ResourceT]]:
+        """Implements the concurrent mode of :py:meth:`_iter_all_resources`. At most ``plan.depth`` pages are requested
+        ahead of the page which is currently consumed."""
+        newest, meta = self._find_all_resources(plan.resource_type, *plan.path, **plan.snapshot_kwargs())
+
+        def find_page(page_kwargs: dict) -> list[ResourceT]:
+            return self._find_all_resources(plan.resource_type, *plan.path, **page_kwargs)
+
+        pages = plan.concurrent_page_kwargs(newest, meta)
+        executor = ThreadPoolExecutor(max_workers=plan.max_workers)
+
+        try:
+            futures = deque(executor.submit(find_page, p) for p in itertools.islice(pages, plan.depth))
+
+            while len(futures) > 0:
+                page = futures.popleft().result()
+
+                for page_kwargs in itertools.islice(pages, 1):
+                    futures.append(executor.submit(find_page, page_kwargs))
+
+                yield page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def _create_resource(
         self,
@@ -694,12 +2121,7 @@ class BaseClient(object):
             If the resource returned by the Hub instance does not validate with the given ``resource_type``.
         """
 
-        r = self._request("POST", *path, expected_code=expected_code, json=resource.model_dump(mode="json"), **params)
-
-        if _is_enveloped(r.json()):
-            # The meta field is empty for create responses so it gets thrown away here.
-            return resource_type(**r.json()["data"])
-        return resource_type(**r.json())
+        return self._send_plan(self._plan_create(resource_type, resource, path, expected_code, params))
 
     def _get_single_resource(
         self,
@@ -707,6 +2129,7 @@ class BaseClient(object):
         *path: str | UuidIdentifiable,
         include: IncludeParams | None = None,
         expected_code: int = httpx.codes.OK.value,
+        resource_id: str | UuidIdentifiable | None = None,
         **params: te.Unpack[GetKwargs],
     ) -> SingleResourceResult:
         """Get a single resource of a certain type at the specified path.
@@ -728,9 +2151,14 @@ class BaseClient(object):
             Extend the default resource field selection by explicitly name one or more field names.
         include : :py:type:`~flame_hub.types.IncludeParams`, optional
             Extend the default resource fields by explicitly list resource names to nest in the response. See the
-            :doc:`model specifications <models_api>` which resources can be included in other resources.
+            :doc:`model specifications <models_api>` which resources can be included in other resources. The include
+            policy of the client or of ``**params`` narrows them down further, see
+            :py:type:`~flame_hub.types.IncludePolicy`.
         expected_code : :py:class:`int`
             The expected status code of the response from the ``GET`` request. This defaults to ``200``.
+        resource_id : :py:class:`str` | :py:class:`~flame_hub.types.UuidIdentifiable`, optional
+            ID of the resource which the entity cache keeps the result under. Defaults to the last component of
+            ``*path``, so it has to be set for endpoints which are nested below a resource.
         **params : :py:obj:`~typing.Unpack` [:py:class:`.GetKwargs`]
             Further keyword arguments for adding optional fields to a response and returning meta information.
 
@@ -755,28 +2183,7 @@ class BaseClient(object):
         :py:meth:`._get_all_resources`, :py:meth:`._find_all_resources`
         """
 
-        field_params = params.pop("fields", None)
-        meta_flag = params.pop("meta", False)
-
-        request_params = build_field_params(field_params) | build_include_params(include)
-
-        try:
-            r = self._request("GET", *path, expected_code=expected_code, params=request_params, **params)
-        except HubAPIError as e:
-            if e.error_response is not None and e.error_response.status_code == httpx.codes.NOT_FOUND.value:
-                return None
-            else:
-                raise
-
-        if _is_enveloped(r.json()):
-            wrapped_resource = WrappedResource[resource_type](**r.json())
-            if meta_flag:
-                return wrapped_resource.data, wrapped_resource.meta
-            return wrapped_resource.data
-        else:
-            if meta_flag:
-                raise ValueError(f"Single resources of type {resource_type} do not have meta data.")
-            return resource_type(**r.json())
+        return self._send_plan(self._plan_get(resource_type, path, include, expected_code, resource_id, params))
 
     def _update_resource(
         self,
@@ -784,6 +2191,7 @@ class BaseClient(object):
         resource: BaseModel,
         *path: str | UuidIdentifiable,
         expected_code: int = httpx.codes.ACCEPTED.value,
+        resource_id: str | UuidIdentifiable | None = None,
         **params: te.Unpack[BaseKwargs],
     ) -> ResourceT:
         """Update a resource of a certain type at the specified path.
@@ -807,6 +2215,9 @@ class BaseClient(object):
             ``id`` attribute.
         expected_code : :py:class:`int`
             The expected status code of the response from the ``POST`` request. This defaults to ``202``.
+        resource_id : :py:class:`str` | :py:class:`~flame_hub.types.UuidIdentifiable`, optional
+            ID of the resource which is removed from the entity cache. Defaults to the last component of ``*path``, so
+            it has to be set for endpoints which are nested below a resource.
 
         Returns
         -------
@@ -821,24 +2232,13 @@ class BaseClient(object):
             If the resource returned by the Hub instance does not validate with the given ``resource_type``.
         """
 
-        r = self._request(
-            "POST",
-            *path,
-            expected_code=expected_code,
-            # Exclude defaults so that properties that are set to UNSET are excluded from update models.
-            json=resource.model_dump(mode="json", exclude_defaults=True),
-            **params,
-        )
-
-        if _is_enveloped(r.json()):
-            # The meta field is empty for update responses so it gets thrown away here.
-            return resource_type(**r.json()["data"])
-        return resource_type(**r.json())
+        return self._send_plan(self._plan_update(resource_type, resource, path, expected_code, resource_id, params))
 
     def _delete_resource(
         self,
         *path: str | UuidIdentifiable,
         expected_code: int = httpx.codes.ACCEPTED.value,
+        resource_id: str | UuidIdentifiable | None = None,
         **params: te.Unpack[BaseKwargs],
     ) -> None:
         """Delete a resource of a certain type at the specified path.
@@ -851,6 +2251,9 @@ class BaseClient(object):
             ``id`` attribute.
         expected_code : :py:class:`int`
             The expected status code of the response from the ``DELETE`` request. This defaults to ``202``.
+        resource_id : :py:class:`str` | :py:class:`~flame_hub.types.UuidIdentifiable`, optional
+            ID of the resource which is removed from the entity cache. Defaults to the last component of ``*path``, so
+            it has to be set for endpoints which are nested below a resource.
 
         Raises
         ------
@@ -858,4 +2261,211 @@ class BaseClient(object):
             If the status code of the response does not match ``expected_code``.
         """
 
-        self._request("DELETE", *path, expected_code=expected_code, **params)
+        self._send_plan(self._plan_delete(path, expected_code, resource_id, params))
+
+
+class AsyncBaseClient(BaseClient):
+    """The base class for other asynchronous client classes.
+
+    This class is the :py:mod:`asyncio` counterpart of :py:class:`.BaseClient`. It is built on top of
+    :py:class:`httpx2.AsyncClient` and implements all fundamental methods as coroutines so that many requests can be
+    in flight at the same time on a single event loop. Query parameters are built and responses are validated exactly
+    like in :py:class:`.BaseClient`. If the default instantiation of the internally used HTTP client should be
+    bypassed, pass your own :py:class:`httpx2.AsyncClient` via ``**kwargs`` to the class.
+
+    Parameters
+    ----------
+    base_url : :py:class:`str`
+        Base URL of the Hub service.
+    auth : :py:class:`.PasswordAuth` | :py:class:`.ClientAuth` | :py:class:`.StaticAuth` | :any:`None`, optional
+        Authenticator which is used to authenticate the client at the FLAME Hub instance. Defaults to :any:`None`.
+    **kwargs : :py:class:`Unpack`\\[:py:class:`~flame_hub._base_client.AsyncClientKwargs`]
+        Currently used to pass an already instantiated HTTP client via the ``client`` keyword argument to bypass the
+        default instantiation. This overrides ``base_url`` and ``auth``.
+
+    See Also
+    --------
+    :py:class:`.BaseClient`, :py:class:`.AsyncAuthClient`, :py:class:`.AsyncCoreClient`,\
+    :py:class:`.AsyncStorageClient`
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        auth: AuthParam = None,
+        **kwargs: te.Unpack[AsyncClientKwargs],
+    ):
+        client = kwargs.get("client", None)
+        self._client = client or httpx.AsyncClient(auth=resolve_auth(auth), base_url=base_url)
+        self._result_mode = _check_result_mode(kwargs.get("result_mode", "validate"))
+        self._include_policy = kwargs.get("include_policy", "all")
+        self._entity_cache = kwargs.get("entity_cache", None)
+        self._middleware = _resolve_middleware(kwargs)
+
+    async def close(self):
+        """Closes the internally used :py:class:`httpx2.AsyncClient` instance."""
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: t.Literal["GET", "POST", "PUT", "DELETE"],
+        *path: str | UuidIdentifiable,
+        expected_code: int,
+        stream: bool = False,
+        operation: Operation | None = None,
+        **params,
+    ) -> httpx.Response:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._request`."""
+
+        operation = self._build_operation(operation, method, path, stream, params)
+
+        if len(self._middleware) == 0:
+            r = await self._send(operation)
+        else:
+            r = await _send_through_async(self._middleware, operation, self._send)
+
+        if r.status_code != expected_code:
+            if stream:
+                await r.aread()
+            raise new_hub_api_error_from_response(r)
+
+        return r
+
+    async def _send(self, operation: Operation) -> httpx.Response:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._send`."""
+        return await self._client.send(operation.request, stream=operation.stream, auth=operation.auth)
+
+    async def _send_plan(self, plan: _RequestPlan) -> t.Any:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._send_plan`."""
+        if plan.done:
+            return plan.result
+
+        try:
+            r = await self._request(
+                plan.method, *plan.path, expected_code=plan.expected_code, operation=plan.operation, **plan.params
+            )
+        except HubAPIError as e:
+            if plan.none_if_not_found and _is_not_found(e):
+                return None
+            else:
+                raise
+        finally:
+            if plan.finish is not None:
+                plan.finish()
+
+        return None if plan.parse is None else plan.parse(r)
+
+    async def _find_all_resources(
+        self,
+        resource_type: type[ResourceT],
+        *path: str,
+        include: IncludeParams | None = None,
+        expected_code: int = httpx.codes.OK.value,
+        **params: te.Unpack[FindAllKwargs],
+    ) -> ResourceListResult[ResourceT]:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._find_all_resources`."""
+        return await self._send_plan(self._plan_find_all(resource_type, path, include, expected_code, params))
+
+    async def _iter_all_resources(
+        self,
+        resource_type: type[ResourceT],
+        *path: str,
+        include: IncludeParams | None = None,
+        expected_code: int = httpx.codes.OK.value,
+        **params: te.Unpack[IterKwargs],
+    ) -> t.AsyncIterator[ResourceT]:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._iter_all_resources`."""
+        plan = self._plan_iter(resource_type, path, include, expected_code, params)
+        pages = self._iter_pages_concurrently(plan) if plan.max_workers > 1 else self._iter_pages(plan)
+
+        if plan.read_ahead > 0:
+            pages = _async_read_ahead(pages, plan.read_ahead)
+
+        async for page in pages:
+            for item in plan.items(page):
+                yield item
+
+    async def _iter_pages(self, plan: _IterPlan) -> t.AsyncIterator[list[ResourceT]]:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._iter_pages`."""
+        while True:
+            page, meta = await self._find_all_resources(plan.resource_type, *plan.path, **plan.next_page_kwargs())
+
+            yield page
+
+            if not plan.advance(page, meta):
+                return
+
+    async def _iter_pages_concurrently(self, plan: _IterPlan) -> t.AsyncIterator[list[ResourceT]]:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._iter_pages_concurrently`. Pages are requested with tasks
+        instead of threads."""
+        newest, meta = await self._find_all_resources(plan.resource_type, *plan.path, **plan.snapshot_kwargs())
+        workers = asyncio.Semaphore(plan.max_workers)
+
+        async def request_page(page_kwargs: dict) -> list[ResourceT]:
+            async with workers:
+                return await self._find_all_resources(plan.resource_type, *plan.path, **page_kwargs)
+
+        def find_page(page_kwargs: dict) -> asyncio.Task:
+            return asyncio.create_task(request_page(page_kwargs))
+
+        pages = plan.concurrent_page_kwargs(newest, meta)
+        tasks = deque(find_page(p) for p in itertools.islice(pages, plan.depth))
+
+        try:
+            while len(tasks) > 0:
+                page = await tasks.popleft()
+
+                for page_kwargs in itertools.islice(pages, 1):
+                    tasks.append(find_page(page_kwargs))
+
+                yield page
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _create_resource(
+        self,
+        resource_type: type[ResourceT],
+        resource: BaseModel,
+        *path: str,
+        expected_code: int = httpx.codes.CREATED.value,
+        **params: te.Unpack[BaseKwargs],
+    ) -> ResourceT:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._create_resource`."""
+        return await self._send_plan(self._plan_create(resource_type, resource, path, expected_code, params))
+
+    async def _get_single_resource(
+        self,
+        resource_type: type[ResourceT],
+        *path: str | UuidIdentifiable,
+        include: IncludeParams | None = None,
+        expected_code: int = httpx.codes.OK.value,
+        resource_id: str | UuidIdentifiable | None = None,
+        **params: te.Unpack[GetKwargs],
+    ) -> SingleResourceResult:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._get_single_resource`."""
+        return await self._send_plan(self._plan_get(resource_type, path, include, expected_code, resource_id, params))
+
+    async def _update_resource(
+        self,
+        resource_type: type[ResourceT],
+        resource: BaseModel,
+        *path: str | UuidIdentifiable,
+        expected_code: int = httpx.codes.ACCEPTED.value,
+        resource_id: str | UuidIdentifiable | None = None,
+        **params: te.Unpack[BaseKwargs],
+    ) -> ResourceT:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._update_resource`."""
+        return await self._send_plan(
+            self._plan_update(resource_type, resource, path, expected_code, resource_id, params)
+        )
+
+    async def _delete_resource(
+        self,
+        *path: str | UuidIdentifiable,
+        expected_code: int = httpx.codes.ACCEPTED.value,
+        resource_id: str | UuidIdentifiable | None = None,
+        **params: te.Unpack[BaseKwargs],
+    ) -> None:
+        """Asynchronous counterpart of :py:meth:`.BaseClient._delete_resource`."""
+        await self._send_plan(self._plan_delete(path, expected_code, resource_id, params))
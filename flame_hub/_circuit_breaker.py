@@ -0,0 +1,221 @@
+import threading
+import time
+import typing as t
+
+import httpx2 as httpx
+
+from flame_hub._exceptions import CircuitOpenError
+from flame_hub._middleware import AsyncSendFn, Middleware, Operation, SendFn
+
+
+CircuitState = t.Literal["closed", "open", "half_open"]
+"""State of a circuit. Requests pass a ``"closed"`` circuit, fail fast while it is ``"open"`` and a limited amount of
+trial requests pass it while it is ``"half_open"``."""
+
+DEFAULT_FAILURE_STATUS_CODES = frozenset({500, 502, 503, 504})
+"""Status codes of responses which count as failures by default."""
+
+
+class _Circuit(object):
+    """Bookkeeping of the circuit of a single base URL."""
+
+    def __init__(self):
+        self.state: CircuitState = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trials = 0
+
+
+class CircuitBreakerMiddleware(Middleware):
+    """Middleware which stops sending requests to a base URL after it failed repeatedly.
+
+    Every base URL has its own circuit, so an instance can be shared by the clients of all services without an outage of
+    one service affecting the others. A request fails if it raises a :py:exc:`httpx2.TransportError`, e.g. due to a
+    timeout or a refused connection, or if the Hub responds with one of ``failure_status_codes``. Other responses count
+    as successes, so errors caused by the request itself such as ``404 Not Found`` do not open a circuit.
+
+    A circuit starts ``"closed"``. Once ``failure_threshold`` requests failed in a row, it opens and every request to
+    its base URL raises a :py:exc:`.CircuitOpenError` right away instead of waiting for a timeout. After
+    ``recovery_timeout`` seconds, the circuit becomes ``"half_open"`` and lets ``half_open_max_calls`` trial requests
+    through. If a trial request succeeds, the circuit closes again. If it fails, the circuit opens for another
+    ``recovery_timeout`` seconds.
+
+    Parameters
+    ----------
+    failure_threshold : :py:class:`int`
+        Amount of consecutive failures which open a circuit. Defaults to ``5``.
+    recovery_timeout : :py:class:`float`
+        Time in seconds for which a circuit stays open. Defaults to ``30``.
+    half_open_max_calls : :py:class:`int`
+        Maximum amount of concurrent trial requests while a circuit is half-open. Defaults to ``1``.
+    failure_status_codes : :py:class:`~collections.abc.Iterable`\\[:py:class:`int`], optional
+        Status codes of responses which count as failures. Defaults to
+        :py:const:`~flame_hub._circuit_breaker.DEFAULT_FAILURE_STATUS_CODES`.
+    on_state_change : :py:class:`~collections.abc.Callable`\\[[:py:class:`str`, :py:type:`.CircuitState`,\
+    :py:type:`.CircuitState`], :py:obj:`None`], optional
+        Function which is called with the base URL, the previous and the new state whenever a circuit changes its
+        state.
+
+    Raises
+    ------
+    :py:exc:`ValueError`
+        If ``failure_threshold`` or ``half_open_max_calls`` is smaller than ``1`` or if ``recovery_timeout`` is not
+        positive.
+
+    See Also
+    --------
+    :py:class:`.Middleware`, :py:class:`.RetryMiddleware`
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_status_codes: t.Iterable[int] | None = None,
+        on_state_change: t.Callable[[str, CircuitState, CircuitState], None] | None = None,
+    ):
+        if failure_threshold < 1:
+            raise ValueError(f"failure threshold must be at least 1, got {failure_threshold}")
+
+        if recovery_timeout <= 0:
+            raise ValueError(f"recovery timeout must be positive, got {recovery_timeout}")
+
+        if half_open_max_calls < 1:
+            raise ValueError(f"maximum amount of trial calls must be at least 1, got {half_open_max_calls}")
+
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._failure_status_codes = (
+            frozenset(failure_status_codes) if failure_status_codes is not None else DEFAULT_FAILURE_STATUS_CODES
+        )
+        self._on_state_change = on_state_change
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+        self.rejected = 0
+        """Amount of requests which failed fast since their circuit was open."""
+
+    def state(self, base_url: str | httpx.URL) -> CircuitState:
+        """Returns the state of the circuit of ``base_url``. Open circuits whose recovery timeout has passed are
+        reported as ``"half_open"``."""
+        with self._lock:
+            circuit = self._circuits.get(str(base_url), None)
+
+            if circuit is None:
+                return "closed"
+
+            if circuit.state == "open" and time.monotonic() - circuit.opened_at >= self._recovery_timeout:
+                return "half_open"
+
+            return circuit.state
+
+    def _set_state(self, circuit: _Circuit, state: CircuitState, changes: list[tuple[CircuitState, CircuitState]]):
+        """Changes the state of ``circuit`` and records the change. Has to be called while holding the lock."""
+        if circuit.state == state:
+            return
+
+        changes.append((circuit.state, state))
+        circuit.state = state
+
+        if state == "open":
+            circuit.opened_at = time.monotonic()
+        elif state == "half_open":
+            circuit.trials = 0
+        else:
+            circuit.failures = 0
+
+    def _notify(self, base_url: str, changes: list[tuple[CircuitState, CircuitState]]):
+        if self._on_state_change is not None:
+            for old_state, new_state in changes:
+                self._on_state_change(base_url, old_state, new_state)
+
+    def _acquire(self, operation: Operation) -> bool:
+        """Admits the request of ``operation`` or raises a :py:exc:`.CircuitOpenError`. Returns whether the request is
+        a trial request of a half-open circuit."""
+        base_url, changes, retry_after = str(operation.base_url), [], None
+
+        with self._lock:
+            circuit = self._circuits.setdefault(base_url, _Circuit())
+
+            if circuit.state == "open":
+                remaining = circuit.opened_at + self._recovery_timeout - time.monotonic()
+
+                if remaining > 0:
+                    retry_after = remaining
+                else:
+                    self._set_state(circuit, "half_open", changes)
+
+            if circuit.state == "half_open":
+                if circuit.trials >= self._half_open_max_calls:
+                    # Trial requests are pending, so their outcome decides when to try again.
+                    retry_after = 0.0
+                else:
+                    circuit.trials += 1
+
+            if retry_after is not None:
+                self.rejected += 1
+
+            trial = circuit.state == "half_open"
+
+        self._notify(base_url, changes)
+
+        if retry_after is not None:
+            raise CircuitOpenError(
+                f"circuit of {base_url} is open, not sending request", operation.request, base_url, retry_after
+            )
+
+        return trial
+
+    def _release(self, operation: Operation, trial: bool, failed: bool | None):
+        """Records the outcome of a request which was admitted by :py:meth:`_acquire`. ``failed`` is :any:`None` if the
+        request was aborted before its outcome was known."""
+        base_url, changes = str(operation.base_url), []
+
+        with self._lock:
+            circuit = self._circuits[base_url]
+
+            if trial and circuit.state == "half_open":
+                circuit.trials -= 1
+
+                if failed is not None:
+                    self._set_state(circuit, "open" if failed else "closed", changes)
+            elif circuit.state == "closed" and failed is not None:
+                circuit.failures = circuit.failures + 1 if failed else 0
+
+                if circuit.failures >= self._failure_threshold:
+                    self._set_state(circuit, "open", changes)
+
+        self._notify(base_url, changes)
+
+    def send(self, operation: Operation, call_next: SendFn) -> httpx.Response:
+        trial = self._acquire(operation)
+
+        try:
+            r = call_next(operation)
+        except httpx.TransportError:
+            self._release(operation, trial, True)
+            raise
+        except BaseException:
+            self._release(operation, trial, None)
+            raise
+
+        self._release(operation, trial, r.status_code in self._failure_status_codes)
+
+        return r
+
+    async def send_async(self, operation: Operation, call_next: AsyncSendFn) -> httpx.Response:
+        trial = self._acquire(operation)
+
+        try:
+            r = await call_next(operation)
+        except httpx.TransportError:
+            self._release(operation, trial, True)
+            raise
+        except BaseException:
+            self._release(operation, trial, None)
+            raise
+
+        self._release(operation, trial, r.status_code in self._failure_status_codes)
+
+        return r
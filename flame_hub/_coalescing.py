@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import typing as t
+
+import httpx2 as httpx
+
+from flame_hub._middleware import AsyncSendFn, Middleware, Operation, SendFn
+from flame_hub._response_cache import _copy_result
+
+
+# Marks coalesced responses with the flight they were requested by.
+_FLIGHT_EXTENSION = "flame_hub.flight"
+
+
+class _Flight(object):
+    """A request which is in flight and shared by all callers that request the same URL in the meantime.
+
+    Synchronous callers wait for :py:meth:`resolve` or :py:meth:`fail` to be called by the caller which sends the
+    request. Asynchronous flights send the request in their own :py:attr:`task` instead, so that cancelling one caller
+    does not cancel the request of the others."""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._response: httpx.Response | None = None
+        self._error: BaseException | None = None
+        self._results: dict[t.Hashable, t.Any] = {}
+        self._lock = threading.Lock()
+        self.task: asyncio.Task | None = None
+        """Task which sends the request of an asynchronous flight."""
+        self.waiters = 0
+        """Amount of asynchronous callers which wait for :py:attr:`task`."""
+
+    def resolve(self, r: httpx.Response):
+        r.extensions[_FLIGHT_EXTENSION] = self
+        self._response = r
+        self._done.set()
+
+    def fail(self, error: BaseException):
+        self._error = error
+        self._done.set()
+
+    def wait(self) -> httpx.Response:
+        self._done.wait()
+
+        if self._error is not None:
+            raise self._error
+
+        return self._response
+
+    def parse(self, parse_key: t.Hashable | None, parse_fn: t.Callable[[], t.Any]) -> t.Any:
+        """Returns the result of ``parse_fn`` which is computed once per ``parse_key`` for all callers of the flight.
+        If ``parse_key`` is :any:`None`, every caller computes its own result."""
+        if parse_key is None:
+            return parse_fn()
+
+        # Holding the lock while parsing makes concurrent callers wait for the result instead of parsing it as well.
+        with self._lock:
+            if parse_key not in self._results:
+                self._results[parse_key] = parse_fn()
+
+            return _copy_result(self._results[parse_key])
+
+
+class CoalescingMiddleware(Middleware):
+    """Middleware which shares a single request between all callers that send the same ``GET`` request at the same time.
+
+    Requests are the same if their method, path and query parameters match. All callers wait for the response of the
+    first caller and share the resources which are validated from it, or the error if the request failed. Requests
+    which modify resources, streamed requests and requests which override ``auth`` are never coalesced. Asynchronous
+    callers are only coalesced with callers on the same event loop. Their shared request is sent by a separate task,
+    so cancelling one caller, e.g. due to a timeout, does not affect the others. The request is only cancelled once
+    all of its callers are cancelled. Shared resources should not be modified.
+
+    Clients which are instantiated with ``coalesce_requests=True`` add an instance to their middleware.
+
+    See Also
+    --------
+    :py:class:`.Middleware`
+    """
+
+    def __init__(self):
+        # Synchronous flights are keyed by the request key and asynchronous flights by their event loop and the request
+        # key, so both kinds of callers never join the same flight.
+        self._flights: dict[t.Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+        """Amount of requests which were answered with the response to a request of another caller."""
+
+    def _join(self, key: t.Hashable) -> tuple[_Flight, bool]:
+        """Returns the flight of ``key`` and whether the caller leads it, i.e. has to send the request."""
+        with self._lock:
+            flight = self._flights.get(key, None)
+
+            if flight is not None:
+                self.coalesced += 1
+                return flight, False
+
+            flight = self._flights[key] = _Flight()
+            return flight, True
+
+    def _leave(self, key: t.Hashable, flight: _Flight):
+        """Removes ``flight`` such that later callers start a new one. Flights which were already replaced are kept."""
+        with self._lock:
+            if self._flights.get(key, None) is flight:
+                del self._flights[key]
+
+    def send(self, operation: Operation, call_next: SendFn) -> httpx.Response:
+        if not operation.is_shareable:
+            return call_next(operation)
+
+        key = operation.request_key
+        flight, leader = self._join(key)
+
+        if not leader:
+            return flight.wait()
+
+        try:
+            r = call_next(operation)
+        except BaseException as e:
+            flight.fail(e)
+            raise
+        finally:
+            self._leave(key, flight)
+
+        flight.resolve(r)
+
+        return r
+
+    async def _fly(self, key: t.Hashable, flight: _Flight, operation: Operation, call_next: AsyncSendFn):
+        """Sends the request of an asynchronous flight."""
+        try:
+            r = await call_next(operation)
+        except BaseException as e:
+            flight.fail(e)
+            raise
+        finally:
+            self._leave(key, flight)
+
+        flight.resolve(r)
+
+        return r
+
+    async def send_async(self, operation: Operation, call_next: AsyncSendFn) -> httpx.Response:
+        if not operation.is_shareable:
+            return await call_next(operation)
+
+        key = asyncio.get_running_loop(), operation.request_key
+        flight, leader = self._join(key)
+
+        if leader:
+            flight.task = asyncio.ensure_future(self._fly(key, flight, operation, call_next))
+
+        flight.waiters += 1
+
+        try:
+            # Shielding the task keeps the request going if one of the waiting callers is cancelled.
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+
+            if flight.waiters == 0 and not flight.task.done():
+                # All callers were cancelled, so the response is not needed anymore. The flight is left right away so
+                # that later callers do not join a cancelled request.
+                self._leave(key, flight)
+                flight.task.cancel()
+
+    def parse(
+        self,
+        operation: Operation,
+        r: httpx.Response,
+        parse_key: t.Hashable | None,
+        call_next: t.Callable[[], t.Any],
+    ) -> t.Any:
+        flight = r.extensions.get(_FLIGHT_EXTENSION, None)
+
+        if flight is None:
+            return call_next()
+
+        return flight.parse(parse_key, call_next)
@@ -0,0 +1,178 @@
+import functools
+import types
+import typing as t
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, TypeAdapter
+
+from flame_hub._base_client import get_model_metadata, ResourceT
+
+if t.TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+ColumnKind = t.Literal["bool", "int", "float", "datetime", "object"]
+
+_datetime_adapter = TypeAdapter(datetime)
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "columnar results require numpy, install it with `pip install flame-hub-client[columns]`"
+        ) from e
+
+    return np
+
+
+def _import_pandas():
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError(
+            "data frames require pandas, install it with `pip install flame-hub-client[dataframe]`"
+        ) from e
+
+    return pd
+
+
+def _get_column_kind(annotation: t.Any) -> tuple[ColumnKind, bool]:
+    """Returns the kind of column which holds values of ``annotation`` and whether the values are nullable."""
+    nullable = False
+
+    if t.get_origin(annotation) in (t.Union, types.UnionType):
+        args = tuple(a for a in t.get_args(annotation) if a is not type(None))
+        nullable = len(args) < len(t.get_args(annotation))
+
+        if len(args) != 1:
+            return "object", nullable
+
+        annotation = args[0]
+
+    # bool is a subclass of int, so it has to be checked first.
+    for kind, annotation_type in (("bool", bool), ("int", int), ("float", float), ("datetime", datetime)):
+        if isinstance(annotation, type) and issubclass(annotation, annotation_type):
+            return kind, nullable
+
+    return "object", nullable
+
+
+@functools.cache
+def _get_columns(model: type[BaseModel]) -> tuple[tuple[str, str, ColumnKind, bool], ...]:
+    """Returns the name, alias, kind and nullability of all columns of a model."""
+    aliases = get_model_metadata(model).aliases
+
+    return tuple(
+        (name, aliases[name], *_get_column_kind(field.annotation)) for name, field in model.model_fields.items()
+    )
+
+
+def _to_datetime64(np, value: datetime | str | None):
+    if value is None:
+        return np.datetime64("NaT", "ms")
+
+    if not isinstance(value, datetime):
+        value = _datetime_adapter.validate_python(value)
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return np.datetime64(value, "ms")
+
+
+def _to_array(np, kind: ColumnKind, nullable: bool, values: list) -> "np.ndarray":
+    has_none = nullable and any(v is None for v in values)
+
+    if kind == "datetime":
+        return np.array([_to_datetime64(np, v) for v in values], dtype="datetime64[ms]")
+
+    if kind in ("int", "float") and has_none:
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+    if kind == "int":
+        return np.array(values, dtype=np.int64)
+
+    if kind == "float":
+        return np.array(values, dtype=np.float64)
+
+    if kind == "bool" and not has_none:
+        return np.array(values, dtype=np.bool_)
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+
+    return array
+
+
+def to_columns(resources: Iterable[ResourceT | dict], resource_type: type[ResourceT]) -> dict[str, "np.ndarray"]:
+    """Converts resources into a dictionary of column arrays.
+
+    Each field of ``resource_type`` becomes a NumPy array under its name. Booleans, integers and floats are stored in
+    arrays of the corresponding type and dates in ``datetime64[ms]`` arrays in UTC. Integers and floats which can be
+    :any:`None` are stored as ``float64`` with ``NaN`` for missing values, dates use ``NaT``. All other fields,
+    including booleans with missing values, are stored in arrays of objects. Resources can either be models or plain
+    JSON objects, e.g. as returned with the result mode ``"raw"``.
+
+    Parameters
+    ----------
+    resources : :py:class:`~collections.abc.Iterable`\\[:py:type:`~flame_hub._base_client.ResourceT` | :py:class:`dict`]
+        Resources to convert.
+    resource_type : :py:class:`type`\\[:py:type:`~flame_hub._base_client.ResourceT`]
+        Model of the resources which defines the columns.
+
+    Returns
+    -------
+    :py:class:`dict`\\[:py:class:`str`, :py:class:`numpy.ndarray`]
+        Dictionary which maps field names to column arrays.
+
+    Raises
+    ------
+    :py:exc:`ImportError`
+        If NumPy is not installed.
+
+    See Also
+    --------
+    :py:func:`.to_dataframe`, :py:type:`~flame_hub.types.ResultMode`
+    """
+    np = _import_numpy()
+    columns = _get_columns(resource_type)
+    values = {name: [] for name, *_ in columns}
+
+    for resource in resources:
+        if isinstance(resource, dict):
+            for name, alias, *_ in columns:
+                values[name].append(resource.get(alias, resource.get(name, None)))
+        else:
+            for name, *_ in columns:
+                values[name].append(getattr(resource, name, None))
+
+    return {name: _to_array(np, kind, nullable, values[name]) for name, _, kind, nullable in columns}
+
+
+def to_dataframe(
+    resources: Iterable[ResourceT | dict] | dict[str, "np.ndarray"], resource_type: type[ResourceT]
+) -> "pd.DataFrame":
+    """Converts resources into a :py:class:`pandas.DataFrame` with one column per field of ``resource_type``.
+
+    ``resources`` can be anything accepted by :py:func:`.to_columns` or a dictionary of columns which was already
+    returned with the result mode ``"columns"``.
+
+    Raises
+    ------
+    :py:exc:`ImportError`
+        If NumPy or pandas is not installed.
+
+    See Also
+    --------
+    :py:func:`.to_columns`
+    """
+    pd = _import_pandas()
+
+    if not isinstance(resources, dict):
+        resources = to_columns(resources, resource_type)
+
+    return pd.DataFrame(resources)
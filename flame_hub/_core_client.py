@@ -10,10 +10,13 @@ from pydantic import WrapValidator, Field, BeforeValidator
 from flame_hub._auth_client import Realm
 from flame_hub._base_client import (
     BaseClient,
+    AsyncBaseClient,
+    AsyncClientKwargs,
     obtain_uuid_from,
     UNSET,
     UNSET_T,
     FindAllKwargs,
+    IterKwargs,
     GetKwargs,
     ClientKwargs,
     uuid_validator,
@@ -26,6 +29,7 @@ from flame_hub._base_client import (
     BaseKwargs,
     ConfigBaseModel,
     SingleResourceResult,
+    _parse_resource,
 )
 from flame_hub._defaults import DEFAULT_CORE_BASE_URL
 from flame_hub._storage_client import Bucket, BucketFile
@@ -433,6 +437,9 @@ class CoreClient(BaseClient):
     def find_nodes(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Node]:
         return self._find_all_resources(Node, "nodes", include=get_includable_names(Node), **params)
 
+    def iter_nodes(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Node]:
+        return self._iter_all_resources(Node, "nodes", include=get_includable_names(Node), **params)
+
     def create_node(
         self,
         name: str,
@@ -465,7 +472,7 @@ class CoreClient(BaseClient):
         node_id: Node | uuid.UUID | str,
         **params: te.Unpack[BaseKwargs],
     ):
-        self._delete_resource("nodes", node_id, **params)
+        return self._delete_resource("nodes", node_id, **params)
 
     def update_node(
         self,
@@ -506,6 +513,7 @@ class CoreClient(BaseClient):
             node_id,
             "registry",
             "credentials",
+            resource_id=node_id,
             **params,
         )
 
@@ -522,6 +530,7 @@ class CoreClient(BaseClient):
             node_id,
             "client",
             "credentials",
+            resource_id=node_id,
             **params,
         )
 
@@ -548,6 +557,7 @@ class CoreClient(BaseClient):
             "client",
             "credentials",
             expected_code=httpx.codes.OK.value,
+            resource_id=node_id,
             **params,
         )
 
@@ -562,6 +572,9 @@ class CoreClient(BaseClient):
     def find_master_image_groups(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[MasterImageGroup]:
         return self._find_all_resources(MasterImageGroup, "master-image-groups", **params)
 
+    def iter_master_image_groups(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[MasterImageGroup]:
+        return self._iter_all_resources(MasterImageGroup, "master-image-groups", **params)
+
     def get_master_images(self, **params: te.Unpack[GetKwargs]) -> ResourceListResult[MasterImage]:
         return self._get_all_resources(MasterImage, "master-images", **params)
 
@@ -573,12 +586,18 @@ class CoreClient(BaseClient):
     def find_master_images(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[MasterImage]:
         return self._find_all_resources(MasterImage, "master-images", **params)
 
+    def iter_master_images(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[MasterImage]:
+        return self._iter_all_resources(MasterImage, "master-images", **params)
+
     def get_projects(self, **params: te.Unpack[GetKwargs]) -> ResourceListResult[Project]:
         return self._get_all_resources(Project, "projects", include=get_includable_names(Project), **params)
 
     def find_projects(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Project]:
         return self._find_all_resources(Project, "projects", include=get_includable_names(Project), **params)
 
+    def iter_projects(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Project]:
+        return self._iter_all_resources(Project, "projects", include=get_includable_names(Project), **params)
+
     def sync_master_images(self, **params: te.Unpack[BaseKwargs]):
         """This method will start to synchronize the master images. Note that an error is raised if you request a
         synchronization while the Hub instance is still synchronizing master images.
@@ -628,7 +647,7 @@ class CoreClient(BaseClient):
         )
 
     def delete_project(self, project_id: Project | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("projects", project_id, **params)
+        return self._delete_resource("projects", project_id, **params)
 
     def get_project(
         self,
@@ -669,7 +688,7 @@ class CoreClient(BaseClient):
         )
 
     def delete_project_node(self, project_node_id: ProjectNode | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("project-nodes", project_node_id, **params)
+        return self._delete_resource("project-nodes", project_node_id, **params)
 
     def get_project_nodes(self, **params: te.Unpack[GetKwargs]) -> ResourceListResult[ProjectNode]:
         return self._get_all_resources(
@@ -681,6 +700,11 @@ class CoreClient(BaseClient):
             ProjectNode, "project-nodes", include=get_includable_names(ProjectNode), **params
         )
 
+    def iter_project_nodes(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[ProjectNode]:
+        return self._iter_all_resources(
+            ProjectNode, "project-nodes", include=get_includable_names(ProjectNode), **params
+        )
+
     def get_project_node(
         self, project_node_id: ProjectNode | uuid.UUID | str, **params: te.Unpack[GetKwargs]
     ) -> SingleResourceResult[ProjectNode]:
@@ -730,7 +754,7 @@ class CoreClient(BaseClient):
         )
 
     def delete_analysis(self, analysis_id: Analysis | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("analyses", analysis_id, **params)
+        return self._delete_resource("analyses", analysis_id, **params)
 
     def get_analyses(self, **params: te.Unpack[GetKwargs]) -> ResourceListResult[Analysis]:
         return self._get_all_resources(Analysis, "analyses", include=get_includable_names(Analysis), **params)
@@ -738,6 +762,9 @@ class CoreClient(BaseClient):
     def find_analyses(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Analysis]:
         return self._find_all_resources(Analysis, "analyses", include=get_includable_names(Analysis), **params)
 
+    def iter_analyses(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Analysis]:
+        return self._iter_all_resources(Analysis, "analyses", include=get_includable_names(Analysis), **params)
+
     def get_analysis(
         self,
         analysis_id: Analysis | uuid.UUID | str,
@@ -787,7 +814,7 @@ class CoreClient(BaseClient):
             **params,
         )
 
-        return Analysis(**r.json()["data"])
+        return _parse_resource(Analysis, r)
 
     def get_analysis_client_credentials(
         self,
@@ -802,6 +829,7 @@ class CoreClient(BaseClient):
             analysis_id,
             "client",
             "credentials",
+            resource_id=analysis_id,
             **params,
         )
 
@@ -828,6 +856,7 @@ class CoreClient(BaseClient):
             "client",
             "credentials",
             expected_code=httpx.codes.OK.value,
+            resource_id=analysis_id,
             **params,
         )
 
@@ -842,7 +871,7 @@ class CoreClient(BaseClient):
         )
 
     def delete_analysis_node(self, analysis_node_id: AnalysisNode | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("analysis-nodes", analysis_node_id, **params)
+        return self._delete_resource("analysis-nodes", analysis_node_id, **params)
 
     def update_analysis_node(
         self,
@@ -883,6 +912,11 @@ class CoreClient(BaseClient):
             AnalysisNode, "analysis-nodes", include=get_includable_names(AnalysisNode), **params
         )
 
+    def iter_analysis_nodes(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[AnalysisNode]:
+        return self._iter_all_resources(
+            AnalysisNode, "analysis-nodes", include=get_includable_names(AnalysisNode), **params
+        )
+
     def create_analysis_node_log(
         self,
         analysis_id: Analysis | uuid.UUID | str,
@@ -930,6 +964,9 @@ class CoreClient(BaseClient):
     def find_analysis_node_logs(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Log]:
         return self._find_all_resources(Log, "analysis-node-logs", **params)
 
+    def iter_analysis_node_logs(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Log]:
+        return self._iter_all_resources(Log, "analysis-node-logs", **params)
+
     def create_analysis_bucket(
         self,
         bucket_type: AnalysisBucketType,
@@ -953,7 +990,7 @@ class CoreClient(BaseClient):
         analysis_bucket_id: AnalysisBucket | uuid.UUID | str,
         **params: te.Unpack[BaseKwargs],
     ):
-        self._delete_resource("analysis-buckets", analysis_bucket_id, **params)
+        return self._delete_resource("analysis-buckets", analysis_bucket_id, **params)
 
     def get_analysis_buckets(self, **params: te.Unpack[GetKwargs]) -> ResourceListResult[AnalysisBucket]:
         return self._get_all_resources(
@@ -965,6 +1002,11 @@ class CoreClient(BaseClient):
             AnalysisBucket, "analysis-buckets", include=get_includable_names(AnalysisBucket), **params
         )
 
+    def iter_analysis_buckets(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[AnalysisBucket]:
+        return self._iter_all_resources(
+            AnalysisBucket, "analysis-buckets", include=get_includable_names(AnalysisBucket), **params
+        )
+
     def get_analysis_bucket(
         self, analysis_bucket_id: AnalysisBucket | uuid.UUID | str, **params: te.Unpack[GetKwargs]
     ) -> SingleResourceResult[AnalysisBucket]:
@@ -986,6 +1028,11 @@ class CoreClient(BaseClient):
             AnalysisBucketFile, "analysis-bucket-files", include=get_includable_names(AnalysisBucketFile), **params
         )
 
+    def iter_analysis_bucket_files(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[AnalysisBucketFile]:
+        return self._iter_all_resources(
+            AnalysisBucketFile, "analysis-bucket-files", include=get_includable_names(AnalysisBucketFile), **params
+        )
+
     def get_analysis_bucket_file(
         self, analysis_bucket_file_id: AnalysisBucketFile | uuid.UUID | str, **params: te.Unpack[GetKwargs]
     ) -> SingleResourceResult[AnalysisBucketFile]:
@@ -1002,7 +1049,7 @@ class CoreClient(BaseClient):
         analysis_bucket_file_id: AnalysisBucketFile | uuid.UUID | str,
         **params: te.Unpack[BaseKwargs],
     ):
-        self._delete_resource("analysis-bucket-files", analysis_bucket_file_id, **params)
+        return self._delete_resource("analysis-bucket-files", analysis_bucket_file_id, **params)
 
     def create_analysis_bucket_file(
         self,
@@ -1067,7 +1114,7 @@ class CoreClient(BaseClient):
         registry_id: Registry | uuid.UUID | str,
         **params: te.Unpack[BaseKwargs],
     ):
-        self._delete_resource("registries", registry_id, **params)
+        return self._delete_resource("registries", registry_id, **params)
 
     def update_registry(
         self,
@@ -1092,6 +1139,9 @@ class CoreClient(BaseClient):
     def find_registries(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Registry]:
         return self._find_all_resources(Registry, "registries", **params)
 
+    def iter_registries(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Registry]:
+        return self._iter_all_resources(Registry, "registries", **params)
+
     def send_registry_command(
         self,
         registry_id: Registry | uuid.UUID | str,
@@ -1148,7 +1198,7 @@ class CoreClient(BaseClient):
         registry_project_id: RegistryProject | uuid.UUID | str,
         **params: te.Unpack[BaseKwargs],
     ):
-        self._delete_resource("registry-projects", registry_project_id, **params)
+        return self._delete_resource("registry-projects", registry_project_id, **params)
 
     def update_registry_project(
         self,
@@ -1192,6 +1242,14 @@ class CoreClient(BaseClient):
             **params,
         )
 
+    def iter_registry_projects(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[RegistryProject]:
+        return self._iter_all_resources(
+            RegistryProject,
+            "registry-projects",
+            include=get_includable_names(RegistryProject),
+            **params,
+        )
+
     def delete_analysis_logs(self, analysis_id: Analysis | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
         self._request(
             "DELETE",
@@ -1203,3 +1261,109 @@ class CoreClient(BaseClient):
 
     def find_analysis_logs(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Log]:
         return self._find_all_resources(Log, "analysis-logs", **params)
+
+    def iter_analysis_logs(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Log]:
+        return self._iter_all_resources(Log, "analysis-logs", **params)
+
+
+class AsyncCoreClient(CoreClient, AsyncBaseClient):
+    """The asynchronous client which implements all core endpoints.
+
+    This class offers the same methods as :py:class:`.CoreClient`, but all of them are coroutines and have to be
+    awaited. Its arguments are passed through to :py:class:`.AsyncBaseClient`. Check the documentation of that class for
+    further information. Note that ``base_url`` defaults :py:const:`~flame_hub._defaults.DEFAULT_CORE_BASE_URL`.
+
+    See Also
+    --------
+    :py:class:`.AsyncBaseClient`, :py:class:`.CoreClient`
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_CORE_BASE_URL,
+        auth: AuthParam = None,
+        **kwargs: te.Unpack[AsyncClientKwargs],
+    ):
+        super().__init__(base_url, auth, **kwargs)
+
+    async def sync_master_images(self, **params: te.Unpack[BaseKwargs]):
+        await self._request(
+            "POST",
+            "master-images",
+            "command",
+            expected_code=httpx.codes.ACCEPTED.value,
+            json={"command": "sync"},
+            **params,
+        )
+
+    async def build_master_image(self, master_image_id: MasterImage | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
+        await self._request(
+            "POST",
+            "master-images",
+            "command",
+            expected_code=httpx.codes.ACCEPTED.value,
+            json={"command": "build", "id": str(obtain_uuid_from(master_image_id))},
+            **params,
+        )
+
+    async def send_analysis_command(
+        self,
+        analysis_id: Analysis | uuid.UUID | str,
+        command: AnalysisCommand,
+        **params: te.Unpack[BaseKwargs],
+    ) -> Analysis:
+        r = await self._request(
+            "POST",
+            "analyses",
+            obtain_uuid_from(analysis_id),
+            "command",
+            expected_code=httpx.codes.ACCEPTED.value,
+            json={"command": command},
+            **params,
+        )
+
+        return _parse_resource(Analysis, r)
+
+    async def delete_analysis_node_logs(
+        self,
+        analysis_id: Analysis | uuid.UUID | str,
+        node_id: Node | uuid.UUID | str,
+        **params: te.Unpack[BaseKwargs],
+    ):
+        await self._request(
+            "DELETE",
+            "analysis-node-logs",
+            expected_code=httpx.codes.ACCEPTED.value,
+            params=build_filter_params(
+                {
+                    "analysis_id": str(obtain_uuid_from(analysis_id)),
+                    "node_id": str(obtain_uuid_from(node_id)),
+                }
+            ),
+            **params,
+        )
+
+    async def send_registry_command(
+        self,
+        registry_id: Registry | uuid.UUID | str,
+        command: RegistryCommand,
+        **params: te.Unpack[BaseKwargs],
+    ):
+        await self._request(
+            "POST",
+            "services",
+            "registry",
+            "command",
+            expected_code=httpx.codes.ACCEPTED.value,
+            json={"command": command, "id": str(obtain_uuid_from(registry_id))},
+            **params,
+        )
+
+    async def delete_analysis_logs(self, analysis_id: Analysis | uuid.UUID | str, **params: te.Unpack[BaseKwargs]):
+        await self._request(
+            "DELETE",
+            "analysis-logs",
+            expected_code=httpx.codes.ACCEPTED.value,
+            params=build_filter_params({"analysis_id": str(obtain_uuid_from(analysis_id))}),
+            **params,
+        )
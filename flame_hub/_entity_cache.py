@@ -0,0 +1,102 @@
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+
+class EntityCache(object):
+    """In-memory cache of single resources which are requested with the *get* methods of a client.
+
+    Resources are cached per resource type for the time to live that is defined for their type in ``ttls``. Types
+    without a time to live are not cached at all, so only slowly changing resources such as realms, registries or master
+    images should be listed there. If the cache holds more than ``max_size`` resources, the least recently used ones are
+    evicted. A client which updates or deletes a resource removes it from its cache right away. Changes which are made
+    by other clients only become visible once the cached resource has expired.
+
+    Pass an instance to a client via the ``entity_cache`` keyword argument. Multiple clients can share an instance.
+    Resources are cached per base URL and identity of a client, so clients of different Hubs or principals never see
+    each other's resources. Clients with a custom authentication flow whose identity is unknown bypass the cache.
+    Cached resources are returned as they are and not copied, so they should not be modified.
+
+    Parameters
+    ----------
+    ttls : :py:class:`dict`\\[:py:class:`type`\\[:py:class:`~pydantic.BaseModel`], :py:class:`float`]
+        Time to live in seconds per resource type, e.g. :python:`{Realm: 300, MasterImage: 60}`.
+    max_size : :py:class:`int`
+        Maximum amount of cached resources. Defaults to ``1024``.
+
+    Raises
+    ------
+    :py:exc:`ValueError`
+        If a time to live is not positive or if ``max_size`` is smaller than ``1``.
+
+    See Also
+    --------
+    :py:meth:`.BaseClient._get_single_resource`
+    """
+
+    def __init__(self, ttls: dict[type[BaseModel], float], max_size: int = 1024):
+        if any(ttl <= 0 for ttl in ttls.values()):
+            raise ValueError("times to live must be positive")
+
+        if max_size < 1:
+            raise ValueError(f"maximum size must be at least 1, got {max_size}")
+
+        self._ttls = dict(ttls)
+        self._max_size = max_size
+        # Maps keys to the resource ID, the time the entry expires at and the cached value. The order of the entries is
+        # the order of their last use, so the least recently used entry comes first.
+        self._entries: OrderedDict[t.Hashable, tuple[str, float, t.Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        """Amount of lookups which were answered from the cache."""
+        self.misses = 0
+        """Amount of lookups of cacheable resources which had to be requested from the Hub."""
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def is_cached(self, resource_type: type[BaseModel]) -> bool:
+        """Checks if resources of ``resource_type`` are cached."""
+        return resource_type in self._ttls
+
+    def get(self, key: t.Hashable) -> tuple[bool, t.Any]:
+        """Looks up ``key`` and counts the lookup as a hit or miss. Returns whether a value which has not expired yet
+        was found and the value itself."""
+        with self._lock:
+            entry = self._entries.get(key, None)
+
+            if entry is not None and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[2]
+
+            if entry is not None:
+                del self._entries[key]
+
+            self.misses += 1
+            return False, None
+
+    def put(self, key: t.Hashable, resource_type: type[BaseModel], resource_id: str, value: t.Any):
+        """Caches ``value`` under ``key`` for the time to live of ``resource_type`` and evicts the least recently used
+        entries if the cache is full. ``resource_id`` is the ID which invalidates the entry."""
+        with self._lock:
+            self._entries[key] = resource_id, time.monotonic() + self._ttls[resource_type], value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, resource_id: str):
+        """Removes all entries of the resource with ID ``resource_id``."""
+        with self._lock:
+            for key in [k for k, (i, _, _) in self._entries.items() if i == resource_id]:
+                del self._entries[key]
+
+    def clear(self):
+        """Removes all entries. The hit and miss counters are kept."""
+        with self._lock:
+            self._entries.clear()
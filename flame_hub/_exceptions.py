@@ -40,6 +40,33 @@ class HubAPIError(httpx.HTTPError):
         self.error_response = error
 
 
+class CircuitOpenError(HubAPIError):
+    """Error which is raised without contacting the Hub since too many requests to the same base URL failed recently.
+
+    Parameters
+    ----------
+    message : :py:class:`str`
+        The error message.
+    request : :py:class:`httpx.Request`
+        The request which was not sent.
+    base_url : :py:class:`str`
+        Base URL whose circuit is open.
+    retry_after : :py:class:`float`
+        Time in seconds after which the circuit lets a trial request through again.
+
+    See Also
+    --------
+    :py:class:`~flame_hub.middleware.CircuitBreakerMiddleware`
+    """
+
+    def __init__(self, message: str, request: httpx.Request, base_url: str, retry_after: float) -> None:
+        super().__init__(message, request)
+        self.base_url = base_url
+        """Base URL whose circuit is open."""
+        self.retry_after = retry_after
+        """Time in seconds after which the circuit lets a trial request through again."""
+
+
 def new_hub_api_error_from_response(r: httpx.Response) -> HubAPIError:
     """Create a new :py:exc:`.HubAPIError` from a response.
 
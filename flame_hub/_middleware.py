@@ -0,0 +1,167 @@
+import typing as t
+
+import httpx2 as httpx
+from pydantic import BaseModel
+
+if t.TYPE_CHECKING:
+    from flame_hub._base_client import FindAllKwargs
+
+
+OperationVerb = t.Literal["find", "get", "create", "update", "delete", "request"]
+"""Kind of operation which a client performs. ``"find"`` covers all methods which return lists of resources, including
+iterators, and ``"request"`` covers all requests which do not handle resources of a specific type such as up- and
+downloads."""
+
+
+class Operation(object):
+    """High-level operation which a client performs with a single request to the Hub.
+
+    Operations are passed through the chain of :py:class:`.Middleware` of a client. The request is built before it is
+    passed to the first middleware, so middleware can inspect or modify :py:attr:`request` before passing the operation
+    on.
+
+    Parameters
+    ----------
+    verb : :py:type:`.OperationVerb`
+        Kind of operation.
+    resource_type : :py:class:`type`\\[:py:class:`~pydantic.BaseModel`], optional
+        Model which the response is validated with.
+    params : :py:class:`.FindAllKwargs`, optional
+        Keyword arguments which were passed to the method of the client, e.g. filters, sorting and pagination.
+    """
+
+    def __init__(
+        self,
+        verb: OperationVerb,
+        resource_type: type[BaseModel] | None = None,
+        params: t.Union["FindAllKwargs", dict, None] = None,
+    ):
+        self.verb = verb
+        """Kind of operation."""
+        self.resource_type = resource_type
+        """Model which the response is validated with or :any:`None` if the response does not hold resources."""
+        self.params: "FindAllKwargs" = dict(params) if params is not None else {}
+        """Keyword arguments which were passed to the method of the client."""
+        self.method: t.Literal["GET", "POST", "PUT", "DELETE"] = "GET"
+        """HTTP method of the request."""
+        self.path: tuple[str, ...] = ()
+        """Components of the path of the endpoint relative to :py:attr:`base_url`."""
+        self.base_url: httpx.URL = httpx.URL()
+        """Base URL of the client."""
+        self.request: httpx.Request | None = None
+        """Request which is sent to the Hub."""
+        self.auth: t.Any = httpx.USE_CLIENT_DEFAULT
+        """Authentication flow which overrides the client's default for this request only."""
+        self.identity: str | None = None
+        """Hash which identifies the principal that the client authenticates as or :any:`None` if it is unknown."""
+        self.stream = False
+        """Whether the response is streamed."""
+
+    def __repr__(self) -> str:
+        return f"Operation(verb={self.verb!r}, method={self.method!r}, path={'/'.join(self.path)!r})"
+
+    @property
+    def is_shareable(self) -> bool:
+        """Whether the response can be shared with other callers. This only applies to ``GET`` requests of a known
+        :py:attr:`identity` which are neither streamed nor override the authentication flow."""
+        return (
+            self.method == "GET"
+            and not self.stream
+            and self.auth is httpx.USE_CLIENT_DEFAULT
+            and self.identity is not None
+        )
+
+    @property
+    def request_key(self) -> str:
+        """Method and URL of the request with sorted query parameters, so the order in which they were passed does not
+        matter, followed by the :py:attr:`identity`. Responses to different principals are therefore kept apart while
+        all keys of an endpoint still start with its method and URL."""
+        url = self.request.url
+
+        return f"{self.method} {url.copy_with(params=sorted(url.params.multi_items()))} {self.identity}"
+
+
+SendFn = t.Callable[[Operation], httpx.Response]
+AsyncSendFn = t.Callable[[Operation], t.Awaitable[httpx.Response]]
+
+
+class Middleware(object):
+    """Base class of middleware which wraps requests and the parsing of responses of a client.
+
+    A client passes every :py:class:`.Operation` through its chain of middleware. Each middleware receives the operation
+    and a function ``call_next`` which passes the operation on to the next middleware and finally sends the request.
+    Middleware may modify the operation, return a response without calling ``call_next`` or call it multiple times. The
+    default implementations just pass everything on, so subclasses only override the hooks they need. Synchronous
+    clients call :py:meth:`send` and asynchronous clients call :py:meth:`send_async`.
+
+    Pass instances to a client via the ``middleware`` keyword argument. The first middleware is the outermost one, i.e.
+    it sees an operation first and its response last.
+
+    See Also
+    --------
+    :py:class:`.CoalescingMiddleware`, :py:class:`.ResponseCache`
+    """
+
+    def send(self, operation: Operation, call_next: SendFn) -> httpx.Response:
+        """Sends the request of ``operation`` by calling ``call_next`` and returns the response."""
+        return call_next(operation)
+
+    async def send_async(self, operation: Operation, call_next: AsyncSendFn) -> httpx.Response:
+        """Asynchronous counterpart of :py:meth:`send`."""
+        return await call_next(operation)
+
+    def parse(
+        self,
+        operation: Operation,
+        r: httpx.Response,
+        parse_key: t.Hashable | None,
+        call_next: t.Callable[[], t.Any],
+    ) -> t.Any:
+        """Parses the response ``r`` of a *find* or *get* operation by calling ``call_next`` and returns the result.
+        ``parse_key`` identifies how ``r`` is parsed. It is :any:`None` if results must not be shared between callers
+        since they are mutable."""
+        return call_next()
+
+
+def _send_through(middleware: t.Sequence[Middleware], operation: Operation, send_fn: SendFn) -> httpx.Response:
+    """Passes ``operation`` through ``middleware`` and finally sends it with ``send_fn``."""
+
+    def call(index: int, op: Operation) -> httpx.Response:
+        if index == len(middleware):
+            return send_fn(op)
+
+        return middleware[index].send(op, lambda next_op: call(index + 1, next_op))
+
+    return call(0, operation)
+
+
+async def _send_through_async(
+    middleware: t.Sequence[Middleware], operation: Operation, send_fn: AsyncSendFn
+) -> httpx.Response:
+    """Asynchronous counterpart of :py:func:`_send_through`."""
+
+    async def call(index: int, op: Operation) -> httpx.Response:
+        if index == len(middleware):
+            return await send_fn(op)
+
+        return await middleware[index].send_async(op, lambda next_op: call(index + 1, next_op))
+
+    return await call(0, operation)
+
+
+def _parse_through(
+    middleware: t.Sequence[Middleware],
+    operation: Operation,
+    r: httpx.Response,
+    parse_key: t.Hashable | None,
+    parse_fn: t.Callable[[], t.Any],
+) -> t.Any:
+    """Passes the parsing of ``r`` through ``middleware`` and finally parses it with ``parse_fn``."""
+
+    def call(index: int) -> t.Any:
+        if index == len(middleware):
+            return parse_fn()
+
+        return middleware[index].parse(operation, r, parse_key, lambda: call(index + 1))
+
+    return call(0)
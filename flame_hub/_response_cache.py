@@ -0,0 +1,467 @@
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from pathlib import Path
+
+import httpx2 as httpx
+import typing_extensions as te
+
+from flame_hub._middleware import AsyncSendFn, Middleware, Operation, SendFn
+
+
+class CachedResponse(te.TypedDict):
+    """Body and validators of a response which are kept by a :py:class:`.ResponseCacheBackend`."""
+
+    content: bytes
+    """Raw body of the response."""
+    content_type: str | None
+    """Value of the ``Content-Type`` header."""
+    etag: str | None
+    """Value of the ``ETag`` header which is sent back in the ``If-None-Match`` header."""
+    last_modified: str | None
+    """Value of the ``Last-Modified`` header which is sent back in the ``If-Modified-Since`` header."""
+    stored_at: float
+    """Time the response was stored or last revalidated at as seconds since the epoch."""
+
+
+class ResponseCacheBackend(t.Protocol):
+    """Storage of a :py:class:`.ResponseCache`. Keys are the method and the URL of a request including its query,
+    followed by a hash of the identity which the request was sent as."""
+
+    def load(self, key: str) -> CachedResponse | None:
+        """Returns the response stored under ``key`` or :any:`None` if there is none."""
+        ...
+
+    def save(self, key: str, response: CachedResponse):
+        """Stores ``response`` under ``key`` and replaces a previously stored response."""
+        ...
+
+    def delete(self, key: str):
+        """Removes the response stored under ``key`` if there is one."""
+        ...
+
+    def delete_prefix(self, prefix: str):
+        """Removes all responses whose keys start with ``prefix``."""
+        ...
+
+
+class MemoryResponseCacheBackend(object):
+    """Stores responses in memory. If more than ``max_size`` responses are stored, the least recently used ones are
+    evicted.
+
+    Parameters
+    ----------
+    max_size : :py:class:`int`
+        Maximum amount of stored responses. Defaults to ``256``.
+    """
+
+    def __init__(self, max_size: int = 256):
+        if max_size < 1:
+            raise ValueError(f"maximum size must be at least 1, got {max_size}")
+
+        self._max_size = max_size
+        self._responses: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._responses)
+
+    def load(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            response = self._responses.get(key, None)
+
+            if response is not None:
+                self._responses.move_to_end(key)
+
+            return response
+
+    def save(self, key: str, response: CachedResponse):
+        with self._lock:
+            self._responses[key] = response
+            self._responses.move_to_end(key)
+
+            while len(self._responses) > self._max_size:
+                self._responses.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._responses.pop(key, None)
+
+    def delete_prefix(self, prefix: str):
+        with self._lock:
+            for key in [k for k in self._responses if k.startswith(prefix)]:
+                del self._responses[key]
+
+
+def default_response_cache_path() -> Path:
+    """Returns the path of the database which is used by :py:class:`.SQLiteResponseCacheBackend` by default. This is
+    ``flame_hub/responses.sqlite3`` inside of ``$XDG_CACHE_HOME`` or ``~/.cache`` if the former is not set."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "flame_hub" / "responses.sqlite3"
+
+
+class SQLiteResponseCacheBackend(object):
+    """Stores responses in an SQLite database so that they outlive the process. The database is created such that only
+    its owner can read it.
+
+    Short-lived processes such as command line tools and cron jobs can share a database. Combined with the ``ttl`` of a
+    :py:class:`.ResponseCache`, they skip the network for responses which are still fresh. If more than ``max_size``
+    responses are stored, the least recently used ones are evicted. Responses are kept in memory as well. If
+    ``warm_start`` is set, the most recently used responses of the database are loaded into memory right away, so that
+    looking them up does not hit the database.
+
+    Parameters
+    ----------
+    path : :py:class:`str` | :py:class:`os.PathLike`, optional
+        Path of the database. Defaults to the path returned by
+        :py:func:`~flame_hub._response_cache.default_response_cache_path`.
+    max_size : :py:class:`int`
+        Maximum amount of stored responses. Defaults to ``1024``.
+    warm_start : :py:class:`bool`
+        Whether stored responses are loaded into memory when the database is opened. Defaults to :any:`True`.
+
+    See Also
+    --------
+    :py:class:`.ResponseCache`, :py:class:`.MemoryResponseCacheBackend`
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None, max_size: int = 1024, warm_start: bool = True):
+        if max_size < 1:
+            raise ValueError(f"maximum size must be at least 1, got {max_size}")
+
+        path = Path(path) if path is not None else default_response_cache_path()
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Responses are stored in plain text, so only the owner may read them.
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+
+        self._max_size = max_size
+        self._memory = MemoryResponseCacheBackend(max_size)
+        self._lock = threading.Lock()
+        # The connection is shared by all threads of a process and guarded by the lock. Other processes are handled
+        # by the locking of SQLite itself.
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, content BLOB NOT NULL, content_type TEXT, etag TEXT, last_modified TEXT, "
+            "stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+
+        if warm_start:
+            with self._lock:
+                rows = self._connection.execute(
+                    f"SELECT {_COLUMNS} FROM responses ORDER BY used_at DESC LIMIT ?", (max_size,)
+                ).fetchall()
+
+            # The most recently used responses are selected but saved from the least to the most recently used one, so
+            # the memory evicts in that order.
+            for key, *values in reversed(rows):
+                self._memory.save(key, _to_cached_response(values))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def load(self, key: str) -> CachedResponse | None:
+        response = self._memory.load(key)
+
+        if response is not None:
+            return response
+
+        with self._lock:
+            row = self._connection.execute(f"SELECT {_COLUMNS} FROM responses WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            self._connection.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+
+        response = _to_cached_response(row[1:])
+        self._memory.save(key, response)
+
+        return response
+
+    def save(self, key: str, response: CachedResponse):
+        self._memory.save(key, response)
+
+        with self._lock:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO responses ({_COLUMNS}, used_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response["content"],
+                    response["content_type"],
+                    response["etag"],
+                    response["last_modified"],
+                    response["stored_at"],
+                    time.time(),
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self._max_size,),
+            )
+
+    def delete(self, key: str):
+        self._memory.delete(key)
+
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str):
+        self._memory.delete_prefix(prefix)
+
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+
+_COLUMNS = "key, content, content_type, etag, last_modified, stored_at"
+
+
+def _to_cached_response(values: t.Sequence) -> CachedResponse:
+    content, content_type, etag, last_modified, stored_at = values
+    return CachedResponse(
+        content=bytes(content), content_type=content_type, etag=etag, last_modified=last_modified, stored_at=stored_at
+    )
+
+
+# Marks responses of cacheable requests with the key they are cached under.
+_CACHE_KEY_EXTENSION = "flame_hub.response_cache_key"
+
+# Path components of endpoints whose responses hold secrets. These are never stored, e.g. client credentials.
+_UNCACHED_PATH_COMPONENTS = frozenset({"credentials"})
+
+
+class ResponseCache(Middleware):
+    """Revalidating cache of ``GET`` responses.
+
+    The cache stores the body of every response which carries an ``ETag`` or a ``Last-Modified`` header. When the same
+    URL is requested again, the stored validators are sent in the ``If-None-Match`` and ``If-Modified-Since`` headers.
+    If the Hub responds with ``304 Not Modified``, the stored body is used instead and no body is transferred. Resources
+    which were validated from a response are kept in memory as well. They are returned right away if the response has
+    not been modified, so validation is skipped too. This applies to the result mode ``"validate"`` only. The returned
+    resources are shared by all callers and should not be modified.
+
+    If ``ttl`` is set, responses are considered fresh for ``ttl`` seconds after they were stored or last revalidated.
+    Fresh responses are used without contacting the Hub at all and responses without validators are stored as well.
+    Since a fresh response might be outdated, a client which creates, updates or deletes a resource removes all stored
+    responses of the same endpoint, e.g. all responses below ``nodes`` if a node is updated.
+
+    Pass an instance to a client via the ``response_cache`` keyword argument. The cache is a :py:class:`.Middleware`, so
+    it can be passed via the ``middleware`` keyword argument instead to order it relative to other middleware.
+    Responses are stored per identity which the client authenticates as, so instances and backends can be shared by
+    clients of different identities. Requests which override ``auth``, requests of clients with a custom authentication
+    flow whose identity is unknown and requests of endpoints which return secrets such as client credentials bypass the
+    cache.
+
+    Parameters
+    ----------
+    backend : :py:class:`.ResponseCacheBackend`, optional
+        Storage of the responses. Defaults to a :py:class:`.MemoryResponseCacheBackend`.
+    max_results : :py:class:`int`
+        Maximum amount of validated results which are kept in memory. Defaults to ``256``.
+    ttl : :py:class:`float`, optional
+        Time in seconds for which stored responses are used without revalidating them. Defaults to :any:`None` which
+        revalidates every response.
+
+    See Also
+    --------
+    :py:class:`.EntityCache`, :py:class:`.Middleware`
+    """
+
+    def __init__(self, backend: ResponseCacheBackend | None = None, max_results: int = 256, ttl: float | None = None):
+        if max_results < 1:
+            raise ValueError(f"maximum amount of results must be at least 1, got {max_results}")
+
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"time to live must be positive, got {ttl}")
+
+        self.backend = backend if backend is not None else MemoryResponseCacheBackend()
+        """Storage of the responses."""
+        self._max_results = max_results
+        self._ttl = ttl
+        self._results: OrderedDict[t.Hashable, t.Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        """Amount of requests which were answered with a stored response, either since it was still fresh or since the
+        Hub responded with ``304 Not Modified``."""
+        self.misses = 0
+        """Amount of requests which were answered with a full response."""
+        self.bytes_saved = 0
+        """Amount of body bytes which were not transferred since the stored body was still valid."""
+
+    def prepare(self, key: str, request: httpx.Request) -> CachedResponse | None:
+        """Adds the validators of the response stored under ``key`` to ``request`` and returns the stored response."""
+        cached = self.backend.load(key)
+
+        if cached is None:
+            return None
+
+        if cached["etag"] is not None:
+            request.headers["If-None-Match"] = cached["etag"]
+
+        if cached["last_modified"] is not None:
+            request.headers["If-Modified-Since"] = cached["last_modified"]
+
+        return cached
+
+    def is_fresh(self, cached: CachedResponse) -> bool:
+        """Checks if the stored response ``cached`` can be used without revalidating it."""
+        return self._ttl is not None and time.time() - cached["stored_at"] < self._ttl
+
+    def replay(self, key: str, cached: CachedResponse, request: httpx.Request) -> httpx.Response:
+        """Returns the stored response ``cached`` as a response to ``request``. The returned response is marked with
+        ``key``."""
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += len(cached["content"])
+
+        headers = {
+            name: value
+            for name, value in (
+                ("Content-Type", cached["content_type"]),
+                ("ETag", cached["etag"]),
+                ("Last-Modified", cached["last_modified"]),
+            )
+            if value is not None
+        }
+        r = httpx.Response(httpx.codes.OK, headers=headers, content=cached["content"], request=request)
+        r.extensions[_CACHE_KEY_EXTENSION] = key
+
+        return r
+
+    def complete(self, key: str, cached: CachedResponse | None, r: httpx.Response) -> httpx.Response:
+        """Stores a full response under ``key`` or replaces a ``304 Not Modified`` response with the stored response
+        ``cached``. The returned response is marked with ``key``. ``r`` must have been read already."""
+        if r.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            self.backend.save(key, cached | {"stored_at": time.time()})
+            return self.replay(key, cached, r.request)
+
+        if r.status_code == httpx.codes.OK:
+            with self._lock:
+                self.misses += 1
+
+            etag, last_modified = r.headers.get("ETag", None), r.headers.get("Last-Modified", None)
+
+            if "no-store" in r.headers.get("Cache-Control", ""):
+                self.backend.delete(key)
+            elif etag is not None or last_modified is not None or self._ttl is not None:
+                self.backend.save(
+                    key,
+                    CachedResponse(
+                        content=r.content,
+                        content_type=r.headers.get("Content-Type", None),
+                        etag=etag,
+                        last_modified=last_modified,
+                        stored_at=time.time(),
+                    ),
+                )
+
+        r.extensions[_CACHE_KEY_EXTENSION] = key
+
+        return r
+
+    def invalidate(self, prefix: str):
+        """Removes all stored responses whose keys start with ``prefix``."""
+        self.backend.delete_prefix(prefix)
+
+    @staticmethod
+    def is_cacheable(operation: Operation) -> bool:
+        """Checks if the response of ``operation`` may be stored."""
+        return operation.is_shareable and _UNCACHED_PATH_COMPONENTS.isdisjoint(operation.path)
+
+    def _invalidate_endpoint(self, operation: Operation):
+        """Removes all stored responses of the endpoint which ``operation`` modifies. The endpoint is defined by the
+        first component of the path, so updating a node removes all stored responses below ``nodes``."""
+        if len(operation.path) > 0:
+            self.invalidate(f"GET {operation.base_url.join(operation.path[0])}")
+
+    def send(self, operation: Operation, call_next: SendFn) -> httpx.Response:
+        if operation.method != "GET":
+            try:
+                return call_next(operation)
+            finally:
+                self._invalidate_endpoint(operation)
+
+        if not self.is_cacheable(operation):
+            return call_next(operation)
+
+        key = operation.request_key
+        cached = self.prepare(key, operation.request)
+
+        if cached is not None and self.is_fresh(cached):
+            return self.replay(key, cached, operation.request)
+
+        return self.complete(key, cached, call_next(operation))
+
+    async def send_async(self, operation: Operation, call_next: AsyncSendFn) -> httpx.Response:
+        if operation.method != "GET":
+            try:
+                return await call_next(operation)
+            finally:
+                self._invalidate_endpoint(operation)
+
+        if not self.is_cacheable(operation):
+            return await call_next(operation)
+
+        key = operation.request_key
+        cached = self.prepare(key, operation.request)
+
+        if cached is not None and self.is_fresh(cached):
+            return self.replay(key, cached, operation.request)
+
+        return self.complete(key, cached, await call_next(operation))
+
+    def parse(
+        self,
+        operation: Operation,
+        r: httpx.Response,
+        parse_key: t.Hashable | None,
+        call_next: t.Callable[[], t.Any],
+    ) -> t.Any:
+        """Returns the result of ``call_next`` for ``r``. Results are kept per cache key, validator and ``parse_key``
+        which identifies how ``r`` is parsed. If ``parse_key`` is :any:`None`, results are not kept."""
+        key = r.extensions.get(_CACHE_KEY_EXTENSION, None)
+        validator = r.headers.get("ETag", None) or r.headers.get("Last-Modified", None)
+
+        if key is None or validator is None or parse_key is None:
+            return call_next()
+
+        result_key = key, validator, parse_key
+
+        with self._lock:
+            if result_key in self._results:
+                self._results.move_to_end(result_key)
+                return _copy_result(self._results[result_key])
+
+        result = call_next()
+
+        with self._lock:
+            self._results[result_key] = result
+
+            while len(self._results) > self._max_results:
+                self._results.popitem(last=False)
+
+        return _copy_result(result)
+
+
+def _copy_result(result: t.Any) -> t.Any:
+    """Copies the lists of a result such that callers can modify them without affecting the cache."""
+    if isinstance(result, list):
+        return list(result)
+
+    if isinstance(result, tuple):
+        return tuple(_copy_result(r) for r in result)
+
+    return result
@@ -0,0 +1,195 @@
+import asyncio
+import random
+import threading
+import time
+import typing as t
+from email.utils import parsedate_to_datetime
+
+import httpx2 as httpx
+
+from flame_hub._middleware import AsyncSendFn, Middleware, Operation, SendFn
+
+
+DEFAULT_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+"""Status codes of responses which are retried by default."""
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Returns the delay in seconds of a ``Retry-After`` header which is either a number of seconds or an HTTP date."""
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryMiddleware(Middleware):
+    """Middleware which retries idempotent operations that failed with a transient error.
+
+    Operations are retried if the Hub responds with one of ``status_codes`` or if the request fails with a
+    :py:exc:`httpx2.TransportError`, e.g. due to a timeout or a refused connection. Only idempotent operations are
+    retried: ``GET`` and ``DELETE`` requests and updates of resources, which send the same fields again. Creations are
+    never retried since they might have succeeded even if the response was lost.
+
+    The delay before each retry is drawn uniformly from zero to an exponentially growing cap (full jitter), which is
+    ``backoff_base * 2 ** attempt`` but never more than ``backoff_max`` seconds. If the Hub sends a ``Retry-After``
+    header, it is honoured instead. Each call has its own budget of ``max_retries`` retries and ``max_wait`` seconds of
+    waiting. Once the budget is exhausted or the Hub asks to wait longer than the remaining budget, the last response is
+    returned or the last error is raised.
+
+    Parameters
+    ----------
+    max_retries : :py:class:`int`
+        Maximum amount of retries per call. Defaults to ``3``.
+    backoff_base : :py:class:`float`
+        Cap of the delay in seconds before the first retry. Defaults to ``0.5``.
+    backoff_max : :py:class:`float`
+        Maximum cap of the delay in seconds before a retry. Defaults to ``30``.
+    max_wait : :py:class:`float`
+        Maximum total delay in seconds per call. Defaults to ``60``.
+    status_codes : :py:class:`~collections.abc.Iterable`\\[:py:class:`int`], optional
+        Status codes of responses which are retried. Defaults to
+        :py:const:`~flame_hub._retry.DEFAULT_RETRY_STATUS_CODES`.
+
+    Raises
+    ------
+    :py:exc:`ValueError`
+        If ``max_retries`` is negative or if a delay is not positive.
+
+    See Also
+    --------
+    :py:class:`.Middleware`
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_wait: float = 60.0,
+        status_codes: t.Iterable[int] | None = None,
+    ):
+        if max_retries < 0:
+            raise ValueError(f"maximum amount of retries must not be negative, got {max_retries}")
+
+        if backoff_base <= 0 or backoff_max <= 0 or max_wait <= 0:
+            raise ValueError("delays must be positive")
+
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._max_wait = max_wait
+        self._status_codes = frozenset(status_codes) if status_codes is not None else DEFAULT_RETRY_STATUS_CODES
+        self._lock = threading.Lock()
+        self.retries = 0
+        """Amount of requests which were sent again."""
+        self.exhausted = 0
+        """Amount of calls which failed since their retry budget was exhausted."""
+
+    @staticmethod
+    def is_idempotent(operation: Operation) -> bool:
+        """Checks if ``operation`` can be sent again without changing the outcome."""
+        return operation.method in ("GET", "PUT", "DELETE") or operation.verb == "update"
+
+    def _next_delay(self, attempt: int, waited: float, retry_after: float | None) -> float | None:
+        """Returns the delay before retry number ``attempt``, starting at ``0``, or :any:`None` if the budget of the
+        call does not allow another retry."""
+        if attempt >= self._max_retries:
+            return None
+
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = random.uniform(0, min(self._backoff_max, self._backoff_base * 2**attempt))
+
+        if waited + delay > self._max_wait:
+            return None
+
+        return delay
+
+    def _delay_after(
+        self, attempt: int, waited: float, r: httpx.Response | None, error: Exception | None
+    ) -> float | None:
+        """Returns the delay before retrying the outcome of an attempt or :any:`None` if it is not retried."""
+        if error is not None:
+            retryable = isinstance(error, httpx.TransportError)
+            retry_after = None
+        else:
+            retryable = r.status_code in self._status_codes
+            retry_after = _parse_retry_after(r.headers.get("Retry-After", None))
+
+        if not retryable:
+            return None
+
+        delay = self._next_delay(attempt, waited, retry_after)
+
+        with self._lock:
+            if delay is None:
+                self.exhausted += 1
+            else:
+                self.retries += 1
+
+        return delay
+
+    def send(self, operation: Operation, call_next: SendFn) -> httpx.Response:
+        if not self.is_idempotent(operation):
+            return call_next(operation)
+
+        attempt, waited = 0, 0.0
+
+        while True:
+            r, error = None, None
+
+            try:
+                r = call_next(operation)
+            except httpx.TransportError as e:
+                error = e
+
+            delay = self._delay_after(attempt, waited, r, error)
+
+            if delay is None:
+                if error is not None:
+                    raise error
+
+                return r
+
+            if r is not None:
+                r.close()
+
+            time.sleep(delay)
+            attempt, waited = attempt + 1, waited + delay
+
+    async def send_async(self, operation: Operation, call_next: AsyncSendFn) -> httpx.Response:
+        if not self.is_idempotent(operation):
+            return await call_next(operation)
+
+        attempt, waited = 0, 0.0
+
+        while True:
+            r, error = None, None
+
+            try:
+                r = await call_next(operation)
+            except httpx.TransportError as e:
+                error = e
+
+            delay = self._delay_after(attempt, waited, r, error)
+
+            if delay is None:
+                if error is not None:
+                    raise error
+
+                return r
+
+            if r is not None:
+                await r.aclose()
+
+            await asyncio.sleep(delay)
+            attempt, waited = attempt + 1, waited + delay
@@ -7,8 +7,11 @@ import typing_extensions as te
 
 from flame_hub._base_client import (
     BaseClient,
+    AsyncBaseClient,
+    AsyncClientKwargs,
     obtain_uuid_from,
     FindAllKwargs,
+    IterKwargs,
     GetKwargs,
     ClientKwargs,
     IsIncludable,
@@ -18,6 +21,7 @@ from flame_hub._base_client import (
     BaseKwargs,
     ConfigBaseModel,
     SingleResourceResult,
+    _parse_resource,
 )
 from flame_hub._defaults import DEFAULT_STORAGE_BASE_URL
 
@@ -96,7 +100,7 @@ class StorageClient(BaseClient):
         return self._create_resource(Bucket, CreateBucket(name=name, region=region), "buckets", **params)
 
     def delete_bucket(self, bucket_id: Bucket | str | uuid.UUID, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("buckets", bucket_id, **params)
+        return self._delete_resource("buckets", bucket_id, **params)
 
     def get_buckets(self, **params: te.Unpack[GetKwargs]) -> ResourceListResult[Bucket]:
         return self._get_all_resources(Bucket, "buckets", **params)
@@ -104,6 +108,9 @@ class StorageClient(BaseClient):
     def find_buckets(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[Bucket]:
         return self._find_all_resources(Bucket, "buckets", **params)
 
+    def iter_buckets(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[Bucket]:
+        return self._iter_all_resources(Bucket, "buckets", **params)
+
     def get_bucket(
         self,
         bucket_id: Bucket | str | uuid.UUID,
@@ -154,10 +161,10 @@ class StorageClient(BaseClient):
             **params,
         )
 
-        return [BucketFile(**d) for d in r.json()["data"]]
+        return _parse_resource(list[BucketFile], r)
 
     def delete_bucket_file(self, bucket_file_id: BucketFile | str | uuid.UUID, **params: te.Unpack[BaseKwargs]):
-        self._delete_resource("bucket-files", bucket_file_id, **params)
+        return self._delete_resource("bucket-files", bucket_file_id, **params)
 
     def get_bucket_file(
         self, bucket_file_id: BucketFile | str | uuid.UUID, **params: te.Unpack[GetKwargs]
@@ -172,6 +179,9 @@ class StorageClient(BaseClient):
     def find_bucket_files(self, **params: te.Unpack[FindAllKwargs]) -> ResourceListResult[BucketFile]:
         return self._find_all_resources(BucketFile, "bucket-files", include=get_includable_names(BucketFile), **params)
 
+    def iter_bucket_files(self, **params: te.Unpack[IterKwargs]) -> t.Iterator[BucketFile]:
+        return self._iter_all_resources(BucketFile, "bucket-files", include=get_includable_names(BucketFile), **params)
+
     def stream_bucket_file(
         self,
         bucket_file_id: BucketFile | str | uuid.UUID,
@@ -193,3 +203,92 @@ class StorageClient(BaseClient):
                 yield b
         finally:
             r.close()
+
+
+class AsyncStorageClient(StorageClient, AsyncBaseClient):
+    """The asynchronous client which implements all storage endpoints.
+
+    This class offers the same methods as :py:class:`.StorageClient`, but all of them are coroutines and have to be
+    awaited. The only exceptions are the ``stream_*`` methods which return asynchronous iterators instead. Its arguments
+    are passed through to :py:class:`.AsyncBaseClient`. Check the documentation of that class for further information.
+    Note that ``base_url`` defaults :py:const:`~flame_hub._defaults.DEFAULT_STORAGE_BASE_URL`.
+
+    See Also
+    --------
+    :py:class:`.AsyncBaseClient`, :py:class:`.StorageClient`
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_STORAGE_BASE_URL,
+        auth: AuthParam = None,
+        **kwargs: te.Unpack[AsyncClientKwargs],
+    ):
+        super().__init__(base_url, auth, **kwargs)
+
+    async def stream_bucket_tarball(
+        self,
+        bucket_id: Bucket | str | uuid.UUID,
+        chunk_size: int = 1024,
+        **params: te.Unpack[BaseKwargs],
+    ) -> t.AsyncIterator[bytes]:
+        r = await self._request(
+            "GET",
+            "buckets",
+            str(obtain_uuid_from(bucket_id)),
+            "stream",
+            expected_code=httpx.codes.OK.value,
+            stream=True,
+            **params,
+        )
+
+        try:
+            async for b in r.aiter_bytes(chunk_size=chunk_size):
+                yield b
+        finally:
+            await r.aclose()
+
+    async def upload_to_bucket(
+        self,
+        bucket_id: Bucket | str | uuid.UUID,
+        *upload_file: UploadFile,
+        **params: te.Unpack[BaseKwargs],
+    ) -> list[BucketFile]:
+        upload_file_tpl = tuple(apply_upload_file_defaults(uf) for uf in upload_file)
+        upload_file_dict = {
+            str(uuid.uuid4()): (uf["file_name"], uf["content"], uf["content_type"]) for uf in upload_file_tpl
+        }
+
+        r = await self._request(
+            "POST",
+            "buckets",
+            str(obtain_uuid_from(bucket_id)),
+            "upload",
+            expected_code=httpx.codes.CREATED.value,
+            files=upload_file_dict,
+            **params,
+        )
+
+        return _parse_resource(list[BucketFile], r)
+
+    async def stream_bucket_file(
+        self,
+        bucket_file_id: BucketFile | str | uuid.UUID,
+        chunk_size: int = 1024,
+        **params: te.Unpack[BaseKwargs],
+    ) -> t.AsyncIterator[bytes]:
+        r = await self._request(
+            "GET",
+            "bucket-files",
+            str(obtain_uuid_from(bucket_file_id)),
+            "stream",
+            expected_code=httpx.codes.OK.value,
+            stream=True,
+            **params,
+        )
+
+        try:
+            async for b in r.aiter_bytes(chunk_size=chunk_size):
+                yield b
+        finally:
+            await r.aclose()
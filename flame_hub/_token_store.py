@@ -0,0 +1,110 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock_file(f: t.IO):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(f: t.IO):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(f: t.IO):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f: t.IO):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def default_token_store_directory() -> Path:
+    """Returns the directory where tokens are stored by default. This is ``flame_hub/tokens`` inside of
+    ``$XDG_CACHE_HOME`` or ``~/.cache`` if the former is not set."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "flame_hub" / "tokens"
+
+
+class FileTokenStore(object):
+    """Persistent token cache which can be shared by multiple processes.
+
+    Tokens are stored as JSON files inside of ``directory``. Each file belongs to one identity which is defined by the
+    base URL of the token endpoint, the grant type, the client ID or username and a hash of the client secret or
+    password, so a wrong or rotated secret never picks up a token of the old one. Only the owner of the files is allowed
+    to read them since they contain secrets. Pass an instance of this class to :py:class:`.ClientAuth` or
+    :py:class:`.PasswordAuth` via ``token_store`` so that short-lived processes reuse valid tokens of their siblings
+    instead of requesting new ones.
+
+    While a process requests a new token, it holds an exclusive lock on the identity. Other processes wait for the lock
+    and then pick up the new token from the file.
+
+    Parameters
+    ----------
+    directory : :py:class:`str` | :py:class:`os.PathLike`, optional
+        Directory where tokens are stored. Defaults to the directory returned by
+        :py:func:`~flame_hub._token_store.default_token_store_directory`.
+
+    See Also
+    --------
+    :py:class:`.ClientAuth`, :py:class:`.PasswordAuth`
+    """
+
+    def __init__(self, directory: str | os.PathLike | None = None):
+        self._directory = Path(directory) if directory is not None else default_token_store_directory()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self._directory / f"{hashlib.sha256(key.encode()).hexdigest()}{suffix}"
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> t.Iterator[None]:
+        """Context manager which holds an exclusive lock on ``key`` across processes."""
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        with open(self._path(key, ".lock"), "a+") as f:
+            _lock_file(f)
+            try:
+                yield
+            finally:
+                _unlock_file(f)
+
+    def load(self, key: str) -> tuple[dict, float] | None:
+        """Returns the stored token body for ``key`` and the time it expires at as seconds since the epoch. If no token
+        is stored, the file is unreadable or the token is expired, :any:`None` is returned."""
+        try:
+            with open(self._path(key, ".json")) as f:
+                entry = json.load(f)
+
+            token, expires_at = entry["token"], float(entry["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if expires_at <= time.time():
+            return None
+
+        return token, expires_at
+
+    def save(self, key: str, token: dict, expires_at: float):
+        """Stores a token body for ``key`` together with the time it expires at as seconds since the epoch. The file is
+        replaced atomically so that readers never see partially written tokens."""
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"token": token, "expires_at": expires_at}, f)
+
+            os.replace(tmp_path, self._path(key, ".json"))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
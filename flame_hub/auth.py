@@ -1,3 +1,4 @@
-__all__ = ["PasswordAuth", "ClientAuth", "StaticAuth"]
+__all__ = ["PasswordAuth", "ClientAuth", "StaticAuth", "FileTokenStore"]
 
 from ._auth_flows import PasswordAuth, ClientAuth, StaticAuth
+from ._token_store import FileTokenStore
@@ -0,0 +1,17 @@
+__all__ = [
+    "EntityCache",
+    "ResponseCache",
+    "ResponseCacheBackend",
+    "MemoryResponseCacheBackend",
+    "SQLiteResponseCacheBackend",
+    "CachedResponse",
+]
+
+from ._entity_cache import EntityCache
+from ._response_cache import (
+    ResponseCache,
+    ResponseCacheBackend,
+    MemoryResponseCacheBackend,
+    SQLiteResponseCacheBackend,
+    CachedResponse,
+)
@@ -0,0 +1,14 @@
+__all__ = [
+    "Operation",
+    "OperationVerb",
+    "Middleware",
+    "CoalescingMiddleware",
+    "RetryMiddleware",
+    "CircuitBreakerMiddleware",
+    "CircuitState",
+]
+
+from ._middleware import Operation, OperationVerb, Middleware
+from ._coalescing import CoalescingMiddleware
+from ._retry import RetryMiddleware
+from ._circuit_breaker import CircuitBreakerMiddleware, CircuitState
@@ -4,10 +4,12 @@ __all__ = [
     "FilterOperator",
     "FilterParams",
     "FindAllKwargs",
+    "IterKwargs",
     "GetKwargs",
     "NodeType",
     "RegistryCommand",
     "IncludeParams",
+    "IncludePolicy",
     "FieldParams",
     "RegistryProjectType",
     "MasterImageCommandArgument",
@@ -27,6 +29,8 @@ __all__ = [
     "ResourceListResult",
     "AuthParam",
     "BaseKwargs",
+    "ResultMode",
+    "LazyResourceList",
 ]
 
 from ._base_client import (
@@ -35,8 +39,10 @@ from ._base_client import (
     FilterParams,
     FilterOperator,
     IncludeParams,
+    IncludePolicy,
     FieldParams,
     FindAllKwargs,
+    IterKwargs,
     UuidIdentifiable,
     GetKwargs,
     ResourceT,
@@ -45,6 +51,8 @@ from ._base_client import (
     ResourceListResult,
     AuthParam,
     BaseKwargs,
+    ResultMode,
+    LazyResourceList,
 )
 from ._core_client import (
     NodeType,
@@ -0,0 +1,436 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx2 as httpx
+import pytest
+
+from flame_hub import HubAPIError
+from flame_hub._auth_flows import _shared_token_states
+from flame_hub.auth import ClientAuth, PasswordAuth, FileTokenStore
+from tests.helpers import next_random_string, assert_eventually
+
+
+class TokenEndpoint:
+    """Counts token requests and issues a new access token for each of them."""
+
+    def __init__(self, expires_in: int = 3600, delay_secs: float = 0.05, status_code: int = 200):
+        self.expires_in = expires_in
+        self.delay_secs = delay_secs
+        self.status_code = status_code
+        self.grant_types = []
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        grant_type = json.loads(request.content)["grant_type"]
+        self.grant_types.append(grant_type)
+
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"code": "invalid_grant", "message": "invalid credentials"})
+
+        return httpx.Response(
+            200,
+            json={
+                "access_token": f"token-{len(self.grant_types)}",
+                "refresh_token": f"refresh-{len(self.grant_types)}",
+                "expires_in": self.expires_in,
+                "token_type": "Bearer",
+                "scope": "global",
+            },
+        )
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.delay_secs)
+        return self._respond(request)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.delay_secs)
+        return self._respond(request)
+
+    @property
+    def count(self) -> int:
+        return len(self.grant_types)
+
+
+def echo_auth_header(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"authorization": request.headers.get("Authorization")})
+
+
+def new_auth(auth_type, endpoint: TokenEndpoint):
+    credentials = (next_random_string(), next_random_string())
+    return auth_type(
+        *credentials,
+        client=httpx.Client(base_url="http://auth.test/", transport=httpx.MockTransport(endpoint.handle)),
+        async_client=httpx.AsyncClient(
+            base_url="http://auth.test/", transport=httpx.MockTransport(endpoint.handle_async)
+        ),
+    )
+
+
+async def send_concurrently(auth, n: int) -> list[str]:
+    async with httpx.AsyncClient(
+        base_url="http://hub.test/", auth=auth, transport=httpx.MockTransport(echo_auth_header)
+    ) as client:
+        responses = await asyncio.gather(*(client.get("nodes") for _ in range(n)))
+
+    return [r.json()["authorization"] for r in responses]
+
+
+def send_from_threads(auth, n: int) -> list[str]:
+    with httpx.Client(
+        base_url="http://hub.test/", auth=auth, transport=httpx.MockTransport(echo_auth_header)
+    ) as client:
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            responses = list(executor.map(lambda _: client.get("nodes"), range(n)))
+
+    return [r.json()["authorization"] for r in responses]
+
+
+@pytest.mark.parametrize(
+    "auth_type,grant_types",
+    [
+        (ClientAuth, ["client_credentials", "client_credentials", "client_credentials"]),
+        (PasswordAuth, ["password", "refresh_token", "refresh_token"]),
+    ],
+)
+def test_sync_auth_flow_single_flight(auth_type, grant_types):
+    endpoint = TokenEndpoint()
+    auth = new_auth(auth_type, endpoint)
+
+    for i in range(1, len(grant_types) + 1):
+        headers = send_from_threads(auth, 32)
+
+        assert endpoint.count == i
+        assert set(headers) == {f"Bearer token-{i}"}
+
+        # Force the token to expire.
+        auth._current_token_expires_at_nanos = 0
+
+    assert endpoint.grant_types == grant_types
+
+
+@pytest.mark.parametrize("auth_type", [ClientAuth, PasswordAuth])
+def test_async_auth_flow_single_flight(auth_type):
+    endpoint = TokenEndpoint()
+    auth = new_auth(auth_type, endpoint)
+
+    headers = asyncio.run(send_concurrently(auth, 50))
+
+    assert endpoint.count == 1
+    assert set(headers) == {"Bearer token-1"}
+
+
+@pytest.mark.parametrize(
+    "auth_type,grant_types",
+    [
+        (ClientAuth, ["client_credentials", "client_credentials"]),
+        (PasswordAuth, ["password", "refresh_token"]),
+    ],
+)
+def test_async_auth_flow_refresh_after_expiry(auth_type, grant_types):
+    endpoint = TokenEndpoint()
+    auth = new_auth(auth_type, endpoint)
+
+    asyncio.run(send_concurrently(auth, 10))
+    # Force the token to expire.
+    auth._current_token_expires_at_nanos = 0
+    headers = asyncio.run(send_concurrently(auth, 10))
+
+    assert endpoint.grant_types == grant_types
+    assert set(headers) == {"Bearer token-2"}
+
+
+@pytest.mark.parametrize("auth_type", [ClientAuth, PasswordAuth])
+def test_async_auth_flow_raise_error(auth_type):
+    endpoint = TokenEndpoint(status_code=400)
+    auth = new_auth(auth_type, endpoint)
+
+    with pytest.raises(HubAPIError) as e:
+        asyncio.run(send_concurrently(auth, 1))
+
+    assert e.value.error_response.status_code == 400
+
+
+def test_async_auth_flow_closes_default_client(monkeypatch):
+    endpoint = TokenEndpoint(delay_secs=0)
+    token_clients = []
+
+    class RecordingAsyncClient(httpx.AsyncClient):
+        def __init__(self, **kwargs):
+            if kwargs.get("transport", None) is None:
+                kwargs["transport"] = httpx.MockTransport(endpoint.handle_async)
+                token_clients.append(self)
+
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", RecordingAsyncClient)
+    auth = ClientAuth(
+        next_random_string(),
+        next_random_string(),
+        client=httpx.Client(base_url="http://auth.test/", transport=httpx.MockTransport(endpoint.handle)),
+    )
+
+    assert asyncio.run(send_concurrently(auth, 2)) == ["Bearer token-1"] * 2
+    assert len(token_clients) == 1
+    assert token_clients[0].is_closed
+
+
+def test_async_auth_flow_token_store_off_event_loop(tmp_path):
+    endpoint = TokenEndpoint(delay_secs=0)
+    threads = []
+
+    class RecordingTokenStore(FileTokenStore):
+        def load(self, key: str) -> tuple[dict, float] | None:
+            threads.append(threading.current_thread())
+            return super().load(key)
+
+        def save(self, key: str, token: dict, expires_at: float):
+            threads.append(threading.current_thread())
+            super().save(key, token, expires_at)
+
+    auth = new_stored_auth(ClientAuth, endpoint, RecordingTokenStore(tmp_path))
+
+    assert asyncio.run(send_concurrently(auth, 2)) == ["Bearer token-1"] * 2
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.parametrize("renewal_window,expected_count", [(0.0, 1), (0.1, 2)])
+def test_auth_flow_renewal_window(renewal_window, expected_count):
+    endpoint = TokenEndpoint(expires_in=100, delay_secs=0)
+    auth = PasswordAuth(
+        next_random_string(),
+        next_random_string(),
+        client=httpx.Client(base_url="http://auth.test/", transport=httpx.MockTransport(endpoint.handle)),
+        renewal_window=renewal_window,
+    )
+
+    send_from_threads(auth, 1)
+    # Let the token expire in 5 seconds which is within a renewal window of 10% of 100 seconds.
+    auth._current_token_expires_at_nanos = time.monotonic_ns() + 5 * 10**9
+    headers = send_from_threads(auth, 1)
+
+    assert endpoint.count == expected_count
+    assert headers == [f"Bearer token-{expected_count}"]
+
+
+@pytest.mark.parametrize("renewal_window", [-0.1, 1.0])
+def test_auth_flow_invalid_renewal_window(renewal_window):
+    with pytest.raises(ValueError):
+        ClientAuth(next_random_string(), next_random_string(), renewal_window=renewal_window)
+
+
+def test_background_renewal():
+    endpoint = TokenEndpoint(expires_in=1, delay_secs=0)
+    auth = PasswordAuth(
+        next_random_string(),
+        next_random_string(),
+        client=httpx.Client(base_url="http://auth.test/", transport=httpx.MockTransport(endpoint.handle)),
+        renewal_window=0.9,
+    )
+
+    auth.start_background_renewal()
+
+    try:
+        # A token with a lifetime of 1 second and a renewal window of 90% is renewed every 100 milliseconds.
+        assert_eventually(lambda: _assert_at_least(endpoint.count, 3), max_retries=20, delay_millis=100)
+        headers = send_from_threads(auth, 4)
+    finally:
+        auth.stop_background_renewal()
+
+    count = endpoint.count
+    time.sleep(0.3)
+
+    assert endpoint.grant_types[0] == "password"
+    assert set(endpoint.grant_types[1:]) == {"refresh_token"}
+    # Requests reuse the token issued by the background thread and renewal stops once the thread is stopped.
+    assert len(set(headers)) == 1
+    assert endpoint.count == count
+
+
+def test_background_renewal_survives_errors(caplog):
+    # The Hub rejects the credentials at first, which raises a HubAPIError in the renewal thread.
+    endpoint = TokenEndpoint(delay_secs=0, status_code=400)
+    auth = ClientAuth(
+        next_random_string(),
+        next_random_string(),
+        client=httpx.Client(base_url="http://auth.test/", transport=httpx.MockTransport(endpoint.handle)),
+        renewal_window=0.5,
+    )
+
+    auth.start_background_renewal(retry_secs=0.01)
+
+    try:
+        assert_eventually(lambda: _assert_at_least(endpoint.count, 2), max_retries=20, delay_millis=50)
+        endpoint.status_code = 200
+        assert_eventually(lambda: _assert_is_not_none(auth._current_token), max_retries=20, delay_millis=50)
+    finally:
+        auth.stop_background_renewal()
+
+    assert any(r.exc_info is not None and r.exc_info[0] is HubAPIError for r in caplog.records)
+
+
+def _assert_is_not_none(value):
+    assert value is not None
+
+
+def test_background_renewal_requires_renewal_window():
+    with pytest.raises(ValueError):
+        ClientAuth(next_random_string(), next_random_string()).start_background_renewal()
+
+
+def _assert_at_least(value: int, lower: int):
+    assert value >= lower
+
+
+def new_stored_auth(
+    auth_type, endpoint: TokenEndpoint, token_store: FileTokenStore, principal: str = "robot", secret: str = "secret"
+):
+    return auth_type(
+        principal,
+        secret,
+        client=httpx.Client(base_url="http://auth.test/", transport=httpx.MockTransport(endpoint.handle)),
+        async_client=httpx.AsyncClient(
+            base_url="http://auth.test/", transport=httpx.MockTransport(endpoint.handle_async)
+        ),
+        token_store=token_store,
+    )
+
+
+@pytest.mark.parametrize("auth_type", [ClientAuth, PasswordAuth])
+def test_token_store_shares_tokens(auth_type, tmp_path):
+    endpoint = TokenEndpoint(delay_secs=0.01)
+    token_store = FileTokenStore(tmp_path)
+
+    # Every auth instance stands in for a separate process with its own in-memory state.
+    auths = [new_stored_auth(auth_type, endpoint, token_store) for _ in range(8)]
+
+    with ThreadPoolExecutor(max_workers=len(auths)) as executor:
+        headers = list(executor.map(lambda a: send_from_threads(a, 1)[0], auths))
+
+    assert endpoint.count == 1
+    assert set(headers) == {"Bearer token-1"}
+
+    # Async flows pick up stored tokens as well.
+    assert (
+        asyncio.run(send_concurrently(new_stored_auth(auth_type, endpoint, token_store), 4)) == ["Bearer token-1"] * 4
+    )
+    assert endpoint.count == 1
+
+
+def test_token_store_is_keyed_by_identity(tmp_path):
+    endpoint = TokenEndpoint(delay_secs=0)
+    token_store = FileTokenStore(tmp_path)
+
+    send_from_threads(new_stored_auth(ClientAuth, endpoint, token_store, principal="robot"), 1)
+    send_from_threads(new_stored_auth(ClientAuth, endpoint, token_store, principal="other-robot"), 1)
+    send_from_threads(new_stored_auth(PasswordAuth, endpoint, token_store, principal="robot"), 1)
+
+    assert endpoint.grant_types == ["client_credentials", "client_credentials", "password"]
+
+
+@pytest.mark.parametrize("auth_type", [ClientAuth, PasswordAuth])
+def test_token_store_is_keyed_by_secret(auth_type, tmp_path):
+    endpoint = TokenEndpoint(delay_secs=0)
+    token_store = FileTokenStore(tmp_path)
+
+    headers = send_from_threads(new_stored_auth(auth_type, endpoint, token_store, secret="secret"), 1)
+    # A rotated secret must not pick up the token which was stored for the old one.
+    headers += send_from_threads(new_stored_auth(auth_type, endpoint, token_store, secret="rotated-secret"), 1)
+
+    assert endpoint.count == 2
+    assert headers == ["Bearer token-1", "Bearer token-2"]
+
+    # Each secret finds its own stored token afterwards.
+    assert send_from_threads(new_stored_auth(auth_type, endpoint, token_store, secret="secret"), 1) == [
+        "Bearer token-1"
+    ]
+    assert endpoint.count == 2
+
+
+def test_token_store_ignores_expired_tokens(tmp_path):
+    endpoint = TokenEndpoint(delay_secs=0)
+    token_store = FileTokenStore(tmp_path)
+
+    auth = new_stored_auth(ClientAuth, endpoint, token_store)
+    send_from_threads(auth, 1)
+
+    key = auth._token_store_key()
+    body, _ = token_store.load(key)
+    token_store.save(key, body, time.time() - 1)
+
+    assert token_store.load(key) is None
+
+    headers = send_from_threads(new_stored_auth(ClientAuth, endpoint, token_store), 1)
+
+    assert endpoint.count == 2
+    assert headers == ["Bearer token-2"]
+
+
+def test_token_store_ignores_corrupt_files(tmp_path):
+    token_store = FileTokenStore(tmp_path)
+    token_store.save("key", {}, time.time() + 60)
+
+    for path in tmp_path.glob("*.json"):
+        path.write_text("{")
+
+    assert token_store.load("key") is None
+
+
+def new_shared_auth(endpoint: TokenEndpoint, client_id: str = "robot", client_secret: str = "secret", **kwargs):
+    return ClientAuth(
+        client_id,
+        client_secret,
+        client=httpx.Client(base_url="http://auth.test/", transport=httpx.MockTransport(endpoint.handle)),
+        **kwargs,
+    )
+
+
+def test_shared_token():
+    endpoint = TokenEndpoint(delay_secs=0.01)
+    auths = [new_shared_auth(endpoint, share_token=True) for _ in range(8)]
+
+    with ThreadPoolExecutor(max_workers=len(auths)) as executor:
+        headers = list(executor.map(lambda a: send_from_threads(a, 4), auths))
+
+    assert endpoint.count == 1
+    assert {h for hs in headers for h in hs} == {"Bearer token-1"}
+
+    # Renewing the token of one flow renews it for all flows.
+    auths[0]._current_token_expires_at_nanos = 0
+    assert send_from_threads(auths[1], 1) == ["Bearer token-2"]
+    assert send_from_threads(auths[2], 1) == ["Bearer token-2"]
+    assert endpoint.count == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"share_token": False},
+        {"share_token": True, "client_secret": "other-secret"},
+        {"share_token": True, "client_id": "other-robot"},
+    ],
+)
+def test_shared_token_requires_same_identity(kwargs):
+    endpoint = TokenEndpoint(delay_secs=0)
+    # Keep the first flow alive, otherwise its token state is released before the second flow is created.
+    first_auth = new_shared_auth(endpoint, share_token=True)
+
+    send_from_threads(first_auth, 1)
+    send_from_threads(new_shared_auth(endpoint, **kwargs), 1)
+
+    assert endpoint.count == 2
+    assert first_auth._current_token is not None
+
+
+def test_shared_token_is_released():
+    endpoint = TokenEndpoint(delay_secs=0)
+    auth = new_shared_auth(endpoint, client_id=next_random_string(), share_token=True)
+    key = auth._shared_token_key()
+
+    assert key in _shared_token_states
+
+    del auth
+
+    assert key not in _shared_token_states
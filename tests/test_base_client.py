@@ -1,4 +1,8 @@
+import asyncio
+import threading
+import time
 import typing as t
+from datetime import datetime, timedelta, timezone
 import uuid
 
 import httpx2 as httpx
@@ -17,16 +21,24 @@ from flame_hub._base_client import (
     IsIncludable,
     get_field_names,
     get_includable_names,
+    get_model_metadata,
+    _get_annotated_property_names,
     DEFAULT_PAGE_PARAMS,
     BaseClient,
+    AsyncBaseClient,
     UNSET,
     UNSET_T,
     resolve_auth,
+    _parse_resource,
+    _parse_resource_list,
+    _parse_single_resource,
+    _read_ahead,
+    _async_read_ahead,
 )
 from flame_hub.auth import ClientAuth, PasswordAuth, StaticAuth
-from flame_hub.types import FilterOperator
+from flame_hub.types import FilterOperator, LazyResourceList
 from flame_hub.models import Node, User, Bucket, RefreshToken
-from tests.helpers import next_random_string
+from tests.helpers import next_random_string, next_uuid, assert_eventually
 
 
 @pytest.mark.parametrize(
@@ -80,6 +92,9 @@ def test_build_filter_params(filter_params, expected):
         ({"by": "foobar", "order": "descending"}, {"sort": "-foobar"}),
         ({"by": "foo_bar", "order": "ascending"}, {"sort": "fooBar"}),
         ({"by": "fooBar", "order": "descending"}, {"sort": "-fooBar"}),
+        ([], {}),
+        ([{"by": "foo"}], {"sort": "foo"}),
+        ([{"by": "created_at", "order": "descending"}, {"by": "id"}], {"sort": "-createdAt,id"}),
     ],
 )
 def test_build_sort_params(sort_params, expected):
@@ -211,6 +226,27 @@ def test_get_includable_names(model, includable_properties):
     assert get_includable_names(model) == includable_properties
 
 
+@pytest.mark.parametrize("model", [Node, User, Bucket, flame_hub.models.Analysis, flame_hub.models.Log])
+def test_get_model_metadata(model):
+    metadata = get_model_metadata(model)
+
+    # Metadata is computed once and looked up afterwards.
+    assert get_model_metadata(model) is metadata
+    assert get_includable_names(model) is metadata.includable_names
+    assert metadata.includable_names == _get_annotated_property_names(model, IsIncludable)
+    assert metadata.field_names == _get_annotated_property_names(model, IsOptionalField)
+    assert metadata.resource_list_adapter is metadata.resource_list_adapter
+    assert all(metadata.alias(name) == field.alias for name, field in model.model_fields.items())
+
+
+def test_model_metadata_alias():
+    metadata = get_model_metadata(Node)
+
+    assert metadata.aliases["created_at"] == "createdAt"
+    assert metadata.alias("realm_id") == "realmId"
+    assert metadata.alias("not_a_field") == "notAField"
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize(
     "resource_type,base_url_fixture_name,path",
@@ -285,3 +321,991 @@ def test_override_auth(core_base_url, auth_base_url, auth_admin_username, auth_a
     assert recorder["auth_header"] == f"Bearer {token}"
 
     core_client.delete_node(node, auth=token)
+
+
+def next_node_payload(**kwargs) -> dict:
+    return {
+        "id": next_uuid(),
+        "name": next_random_string(),
+        "externalName": None,
+        "hidden": False,
+        "realmId": next_uuid(),
+        "registryId": None,
+        "type": "default",
+        "publicKey": None,
+        "online": False,
+        "registryProjectId": None,
+        "clientId": None,
+        "createdAt": "2025-05-12T09:44:08.284Z",
+        "updatedAt": "2025-05-12T09:44:08.284Z",
+        **kwargs,
+    }
+
+
+def test_async_base_client_find_all_resources():
+    nodes = [next_node_payload() for _ in range(3)]
+    recorder = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        recorder["params"] = dict(request.url.params)
+        return httpx.Response(200, json={"data": nodes, "meta": {"total": 3, "limit": 50, "offset": 0, "schema": {}}})
+
+    async def run():
+        client = AsyncBaseClient(
+            base_url="http://hub.test/",
+            client=httpx.AsyncClient(base_url="http://hub.test/", transport=httpx.MockTransport(handler)),
+        )
+        result = await client._find_all_resources(Node, "nodes", filter={"name": "foo"}, meta=True)
+        await client.close()
+        return result
+
+    found_nodes, meta = asyncio.run(run())
+
+    assert [str(n.id) for n in found_nodes] == [n["id"] for n in nodes]
+    assert meta.total == 3
+    assert recorder["params"] == {"page[limit]": "50", "page[offset]": "0", "filter[name]": "foo"}
+
+
+def test_async_core_client():
+    node = next_node_payload()
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+
+        if request.method == "DELETE":
+            return httpx.Response(202, json=node)
+        if request.url.path.endswith(node["id"]):
+            return httpx.Response(200, json=node)
+        return httpx.Response(404, json={"code": "not_found", "message": "not found"})
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(base_url="http://hub.test/", transport=httpx.MockTransport(handler))
+        )
+        found, missing = await asyncio.gather(client.get_node(node["id"]), client.get_node(next_uuid()))
+        await client.delete_node(found)
+        return found, missing
+
+    found, missing = asyncio.run(run())
+
+    assert str(found.id) == node["id"]
+    assert missing is None
+    assert ("DELETE", f"/nodes/{node['id']}") in requests
+
+
+def next_bucket_file_payload(bucket_id: str, name: str) -> dict:
+    return {
+        "id": next_uuid(),
+        "name": name,
+        "path": name,
+        "hash": next_random_string(),
+        "directory": "/",
+        "size": 4,
+        "createdAt": "2025-05-12T09:44:08.284Z",
+        "updatedAt": "2025-05-12T09:44:08.284Z",
+        "actorType": "user",
+        "actorId": next_uuid(),
+        "realmId": next_uuid(),
+        "bucketId": bucket_id,
+    }
+
+
+def upload_handler(bucket_id: str, enveloped: bool) -> t.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert (request.method, request.url.path) == ("POST", f"/buckets/{bucket_id}/upload")
+        bucket_files = [next_bucket_file_payload(bucket_id, "foo.txt")]
+        return httpx.Response(201, json={"data": bucket_files, "meta": {}} if enveloped else bucket_files)
+
+    return handler
+
+
+@pytest.mark.parametrize("enveloped", [False, True])
+def test_upload_to_bucket(enveloped):
+    bucket_id = next_uuid()
+    client = flame_hub.StorageClient(
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(upload_handler(bucket_id, enveloped))
+        )
+    )
+
+    bucket_files = client.upload_to_bucket(bucket_id, {"file_name": "foo.txt", "content": b"test"})
+
+    assert [(bf.name, str(bf.bucket_id)) for bf in bucket_files] == [("foo.txt", bucket_id)]
+
+
+@pytest.mark.parametrize("enveloped", [False, True])
+def test_async_upload_to_bucket(enveloped):
+    bucket_id = next_uuid()
+
+    async def run():
+        client = flame_hub.AsyncStorageClient(
+            client=httpx.AsyncClient(
+                base_url="http://hub.test/", transport=httpx.MockTransport(upload_handler(bucket_id, enveloped))
+            )
+        )
+        bucket_files = await client.upload_to_bucket(bucket_id, {"file_name": "foo.txt", "content": b"test"})
+        await client.close()
+        return bucket_files
+
+    bucket_files = asyncio.run(run())
+
+    assert [(bf.name, str(bf.bucket_id)) for bf in bucket_files] == [("foo.txt", bucket_id)]
+
+
+@pytest.mark.parametrize(
+    "sync_client_type,async_client_type",
+    [
+        (flame_hub.AuthClient, flame_hub.AsyncAuthClient),
+        (flame_hub.CoreClient, flame_hub.AsyncCoreClient),
+        (flame_hub.StorageClient, flame_hub.AsyncStorageClient),
+    ],
+)
+def test_async_client_method_surface(sync_client_type, async_client_type):
+    def public_methods(client_type):
+        return {name for name in dir(client_type) if not name.startswith("_") and callable(getattr(client_type, name))}
+
+    assert public_methods(sync_client_type) == public_methods(async_client_type)
+
+
+def paginated_node_handler(nodes: list[dict], requests: list[dict]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        requests.append(params)
+        limit, offset = int(params["page[limit]"]), int(params["page[offset]"])
+
+        return httpx.Response(
+            200,
+            json={
+                "data": nodes[offset : offset + limit],
+                "meta": {"total": len(nodes), "limit": limit, "offset": offset, "schema": {}},
+            },
+        )
+
+    return handler
+
+
+def test_iter_all_resources():
+    nodes = [next_node_payload() for _ in range(23)]
+    requests = []
+    client = flame_hub.CoreClient(
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(paginated_node_handler(nodes, requests))
+        )
+    )
+
+    found_nodes = list(client.iter_nodes(filter={"name": "~foo"}, page_size=10))
+
+    assert [str(n.id) for n in found_nodes] == [n["id"] for n in nodes]
+    assert [(r["page[limit]"], r["page[offset]"]) for r in requests] == [("10", "0"), ("10", "10"), ("10", "20")]
+    assert {r["filter[name]"] for r in requests} == {"~foo"}
+
+
+def test_iter_all_resources_is_lazy():
+    nodes = [next_node_payload() for _ in range(23)]
+    requests = []
+    client = BaseClient(
+        base_url="http://hub.test/",
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(paginated_node_handler(nodes, requests))
+        ),
+    )
+
+    iterator = client._iter_all_resources(Node, "nodes", page={"limit": 5, "offset": 10})
+
+    assert requests == []
+    assert [str(next(iterator).id) for _ in range(5)] == [n["id"] for n in nodes[10:15]]
+    assert len(requests) == 1
+    assert str(next(iterator).id) == nodes[15]["id"]
+    assert len(requests) == 2
+
+
+@pytest.mark.parametrize("page_size", [0, -1])
+def test_iter_all_resources_invalid_page_size(page_size):
+    client = BaseClient(base_url="http://hub.test/")
+
+    with pytest.raises(ValueError):
+        next(client._iter_all_resources(Node, "nodes", page_size=page_size))
+
+
+def test_async_iter_all_resources():
+    nodes = [next_node_payload() for _ in range(7)]
+    requests = []
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(
+                base_url="http://hub.test/", transport=httpx.MockTransport(paginated_node_handler(nodes, requests))
+            )
+        )
+        found_nodes = [node async for node in client.iter_nodes(page_size=3)]
+        await client.close()
+        return found_nodes
+
+    found_nodes = asyncio.run(run())
+
+    assert [str(n.id) for n in found_nodes] == [n["id"] for n in nodes]
+    assert len(requests) == 3
+
+
+class SnapshotNodeEndpoint:
+    """Serves nodes sorted by creation date, honours upper bounds of the creation date and tracks how many requests are
+    handled concurrently."""
+
+    def __init__(self, n: int):
+        self.created_at = datetime(2025, 5, 12, tzinfo=timezone.utc)
+        self.nodes = [self.next_node() for _ in range(n)]
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def next_node(self) -> dict:
+        self.created_at += timedelta(seconds=1)
+        return next_node_payload(createdAt=self.created_at.isoformat())
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.requests.append(params)
+        nodes = self.nodes
+
+        if "filter[createdAt]" in params:
+            upper_bound = datetime.fromisoformat(params["filter[createdAt]"].removeprefix("<="))
+            nodes = [n for n in nodes if datetime.fromisoformat(n["createdAt"]) <= upper_bound]
+
+        if params.get("sort", "").startswith("-createdAt"):
+            nodes = nodes[::-1]
+
+        limit, offset = int(params["page[limit]"]), int(params["page[offset]"])
+
+        return httpx.Response(
+            200,
+            json={
+                "data": nodes[offset : offset + limit],
+                "meta": {"total": len(nodes), "limit": limit, "offset": offset, "schema": {}},
+            },
+        )
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        time.sleep(0.02)
+
+        with self.lock:
+            self.in_flight -= 1
+            response = self._respond(request)
+            # Simulate concurrent inserts which would shift pages without an upper bound.
+            self.nodes.append(self.next_node())
+
+        return response
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        response = self._respond(request)
+        self.nodes.append(self.next_node())
+        return response
+
+
+def test_iter_all_resources_concurrently():
+    endpoint = SnapshotNodeEndpoint(95)
+    expected_ids = [n["id"] for n in endpoint.nodes]
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle))
+    )
+
+    found_nodes = list(client.iter_nodes(filter={"name": "~"}, page_size=10, max_workers=4))
+
+    assert [str(n.id) for n in found_nodes] == expected_ids
+    # One request for the snapshot and ten requests for the pages.
+    assert len(endpoint.requests) == 11
+    assert endpoint.max_in_flight == 4
+
+    snapshot_request, page_requests = endpoint.requests[0], endpoint.requests[1:]
+
+    assert snapshot_request["sort"] == "-createdAt"
+    assert snapshot_request["page[limit]"] == "1"
+    assert sorted(int(r["page[offset]"]) for r in page_requests) == list(range(0, 95, 10))
+    assert {r["sort"] for r in page_requests} == {"createdAt,id"}
+    assert {r["filter[createdAt]"] for r in page_requests} == {"<=" + endpoint.nodes[94]["createdAt"]}
+    assert {r["filter[name]"] for r in endpoint.requests} == {"~"}
+
+
+def test_iter_all_resources_concurrently_without_creation_date():
+    requests = []
+    logs = [
+        {"time": str(i), "message": "", "service": "", "channel": "system", "level": "info", "labels": {}}
+        for i in range(12)
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        requests.append(params)
+        limit, offset = int(params["page[limit]"]), int(params["page[offset]"])
+        return httpx.Response(
+            200,
+            json={
+                "data": logs[offset : offset + limit],
+                "meta": {"total": len(logs), "limit": limit, "offset": offset, "schema": {}},
+            },
+        )
+
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(handler))
+    )
+
+    found_logs = list(client.iter_analysis_logs(sort={"by": "time"}, page_size=5, max_workers=2))
+
+    assert [log.time for log in found_logs] == [log["time"] for log in logs]
+    assert {r["sort"] for r in requests} == {"time"}
+    assert all("filter[createdAt]" not in r for r in requests)
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_iter_all_resources_invalid_max_workers(max_workers):
+    client = BaseClient(base_url="http://hub.test/")
+
+    with pytest.raises(ValueError):
+        next(client._iter_all_resources(Node, "nodes", max_workers=max_workers))
+
+
+def test_async_iter_all_resources_concurrently():
+    endpoint = SnapshotNodeEndpoint(25)
+    expected_ids = [n["id"] for n in endpoint.nodes]
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle_async))
+        )
+        found_nodes = [node async for node in client.iter_nodes(page_size=5, max_workers=3)]
+        await client.close()
+        return found_nodes
+
+    found_nodes = asyncio.run(run())
+
+    assert [str(n.id) for n in found_nodes] == expected_ids
+    assert len(endpoint.requests) == 6
+    assert endpoint.max_in_flight == 3
+
+
+def keyset_node_handler(nodes: list[dict], requests: list[dict]):
+    def sort_key(node: dict) -> tuple[datetime, str]:
+        return datetime.fromisoformat(node["createdAt"]), node["id"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        requests.append(params)
+        found_nodes = sorted(nodes, key=sort_key)
+
+        if "filter[createdAt]" in params:
+            lower_bound = datetime.fromisoformat(params["filter[createdAt]"].removeprefix(">="))
+            found_nodes = [n for n in found_nodes if datetime.fromisoformat(n["createdAt"]) >= lower_bound]
+
+        limit, offset = int(params["page[limit]"]), int(params["page[offset]"])
+
+        return httpx.Response(
+            200,
+            json={
+                "data": found_nodes[offset : offset + limit],
+                "meta": {"total": len(found_nodes), "limit": limit, "offset": offset, "schema": {}},
+            },
+        )
+
+    return handler
+
+
+def next_keyset_nodes() -> list[dict]:
+    created_at = datetime(2025, 5, 12, tzinfo=timezone.utc)
+    # Every third node shares its creation date with the previous ones, some of them span page boundaries.
+    return [next_node_payload(createdAt=(created_at + timedelta(seconds=i // 3)).isoformat()) for i in range(17)]
+
+
+def test_iter_all_resources_by_keyset():
+    nodes = next_keyset_nodes()
+    requests = []
+    client = flame_hub.CoreClient(
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(keyset_node_handler(nodes, requests))
+        )
+    )
+
+    found_nodes = list(client.iter_nodes(filter={"name": "~"}, page_size=4, pagination="keyset"))
+
+    expected_nodes = sorted(nodes, key=lambda n: (n["createdAt"], n["id"]))
+    assert [str(n.id) for n in found_nodes] == [n["id"] for n in expected_nodes]
+    assert {r["sort"] for r in requests} == {"createdAt,id"}
+    assert {r["filter[name]"] for r in requests} == {"~"}
+    assert "filter[createdAt]" not in requests[0]
+    assert all(r["filter[createdAt]"].startswith(">=") for r in requests[1:])
+    # Offsets only skip resources with the same creation date as the last resource of the previous page.
+    assert max(int(r["page[offset]"]) for r in requests) <= 3
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"sort": {"by": "name"}},
+        {"filter": {"created_at": ("<", "2025-01-01")}},
+        {"max_workers": 2},
+        {"pagination": "cursor"},
+    ],
+)
+def test_iter_all_resources_by_keyset_invalid_params(params):
+    client = BaseClient(base_url="http://hub.test/")
+
+    with pytest.raises(ValueError):
+        next(client._iter_all_resources(Node, "nodes", **{"pagination": "keyset", **params}))
+
+
+def test_iter_all_resources_by_keyset_requires_creation_date():
+    client = flame_hub.CoreClient(base_url="http://hub.test/")
+
+    with pytest.raises(ValueError):
+        next(client.iter_analysis_logs(pagination="keyset"))
+
+
+def test_async_iter_all_resources_by_keyset():
+    nodes = next_keyset_nodes()
+    requests = []
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(
+                base_url="http://hub.test/", transport=httpx.MockTransport(keyset_node_handler(nodes, requests))
+            )
+        )
+        found_nodes = [node async for node in client.iter_nodes(page_size=5, pagination="keyset")]
+        await client.close()
+        return found_nodes
+
+    found_nodes = asyncio.run(run())
+
+    assert sorted(str(n.id) for n in found_nodes) == sorted(n["id"] for n in nodes)
+    assert len(found_nodes) == len(nodes)
+
+
+@pytest.mark.parametrize("pagination", ["offset", "keyset"])
+def test_iter_all_resources_prefetch(pagination):
+    nodes = next_keyset_nodes()
+    requests = []
+    client = flame_hub.CoreClient(
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(keyset_node_handler(nodes, requests))
+        )
+    )
+
+    iterator = client.iter_nodes(page_size=3, prefetch=2, pagination=pagination)
+    found_nodes = [next(iterator)]
+
+    # While the first page is processed, the next two pages are requested in the background.
+    assert_eventually(lambda: _assert_equal(len(requests), 3), max_retries=25, delay_millis=20)
+    time.sleep(0.05)
+    assert len(requests) == 3
+
+    found_nodes.extend(iterator)
+
+    assert sorted(str(n.id) for n in found_nodes) == sorted(n["id"] for n in nodes)
+    assert len(requests) == 6
+
+
+def _assert_equal(value, expected):
+    assert value == expected
+
+
+def test_iter_all_resources_prefetch_raise_error():
+    nodes = [next_node_payload() for _ in range(10)]
+    requests = []
+    handle_page = paginated_node_handler(nodes, requests)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["page[offset]"] == "6":
+            return httpx.Response(500, json={"code": "internal_error", "message": "internal error"})
+        return handle_page(request)
+
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(handler))
+    )
+    found_nodes = []
+
+    with pytest.raises(flame_hub.HubAPIError):
+        for node in client.iter_nodes(page_size=3, prefetch=4):
+            found_nodes.append(node)
+
+    # Resources of pages before the failed one are still yielded.
+    assert [str(n.id) for n in found_nodes] == [n["id"] for n in nodes[:6]]
+
+
+class AbortPaging(BaseException):
+    pass
+
+
+def test_read_ahead_passes_base_exceptions():
+    def pages():
+        yield [1]
+        raise AbortPaging()
+
+    iterator = _read_ahead(pages(), 2)
+
+    assert next(iterator) == [1]
+
+    # The consumer must not wait forever if the producer dies with an error that is not an Exception.
+    with pytest.raises(AbortPaging):
+        next(iterator)
+
+
+def test_async_read_ahead_passes_base_exceptions():
+    async def pages():
+        yield [1]
+        raise AbortPaging()
+
+    async def run():
+        iterator = _async_read_ahead(pages(), 2)
+
+        assert await anext(iterator) == [1]
+
+        with pytest.raises(AbortPaging):
+            await asyncio.wait_for(anext(iterator), timeout=5)
+
+    asyncio.run(run())
+
+
+def test_iter_all_resources_invalid_prefetch():
+    client = BaseClient(base_url="http://hub.test/")
+
+    with pytest.raises(ValueError):
+        next(client._iter_all_resources(Node, "nodes", prefetch=-1))
+
+
+def test_async_iter_all_resources_prefetch():
+    nodes = [next_node_payload() for _ in range(10)]
+    requests = []
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(
+                base_url="http://hub.test/", transport=httpx.MockTransport(paginated_node_handler(nodes, requests))
+            )
+        )
+        iterator = client.iter_nodes(page_size=2, prefetch=3)
+        found_nodes = [await anext(iterator)]
+        await asyncio.sleep(0.05)
+        requests_while_processing = len(requests)
+        found_nodes.extend([node async for node in iterator])
+        await client.close()
+        return found_nodes, requests_while_processing
+
+    found_nodes, requests_while_processing = asyncio.run(run())
+
+    assert [str(n.id) for n in found_nodes] == [n["id"] for n in nodes]
+    assert requests_while_processing == 4
+    assert len(requests) == 5
+
+
+@pytest.mark.parametrize("enveloped", [False, True])
+def test_parse_single_resource(enveloped):
+    node = next_node_payload()
+    body = {"data": node, "meta": {"schema": {}}} if enveloped else node
+    r = httpx.Response(200, json=body)
+
+    assert str(_parse_single_resource(Node, r, False).id) == node["id"]
+
+    if enveloped:
+        found_node, meta = _parse_single_resource(Node, r, True)
+        assert str(found_node.id) == node["id"]
+        assert meta.response_schema == {}
+    else:
+        with pytest.raises(ValueError):
+            _parse_single_resource(Node, r, True)
+
+
+@pytest.mark.parametrize("body_fn", [lambda node: node, lambda node: {"data": node, "meta": {}}])
+def test_parse_resource(body_fn):
+    node = next_node_payload()
+
+    assert str(_parse_resource(Node, httpx.Response(201, json=body_fn(node))).id) == node["id"]
+
+
+def test_parse_resource_invalid_body():
+    with pytest.raises(ValidationError):
+        _parse_resource(Node, httpx.Response(201, json={"data": {"name": "foo"}, "meta": {}}))
+
+
+def test_parse_resource_list():
+    nodes = [next_node_payload() for _ in range(3)]
+    r = httpx.Response(200, json={"data": nodes, "meta": {"total": 3, "limit": 50, "offset": 0, "schema": {}}})
+
+    found_nodes, meta = _parse_resource_list(Node, r, True)
+
+    assert [str(n.id) for n in found_nodes] == [n["id"] for n in nodes]
+    assert meta.total == 3
+    assert _parse_resource_list(Node, r, False) == found_nodes
+
+
+def single_node_handler(node: dict, enveloped: bool = False):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(node["id"]):
+            return httpx.Response(200, json={"data": node, "meta": {"schema": {}}} if enveloped else node)
+
+        return httpx.Response(200, json={"data": [node], "meta": {"total": 1, "limit": 50, "offset": 0, "schema": {}}})
+
+    return handler
+
+
+def test_result_mode_raw():
+    node = next_node_payload()
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(single_node_handler(node)))
+    )
+
+    found_nodes, meta = client.find_nodes(result_mode="raw", meta=True)
+
+    assert found_nodes == [node]
+    assert meta.total == 1
+    assert client.get_node(node["id"], result_mode="raw") == node
+
+
+@pytest.mark.parametrize("enveloped", [False, True])
+def test_result_mode_construct(enveloped):
+    registry = {
+        "id": next_uuid(),
+        "name": "registry",
+        "host": "harbor.test",
+        "accountName": None,
+        "createdAt": "2025-05-12T09:44:08.284Z",
+        "updatedAt": "2025-05-12T09:44:08.284Z",
+    }
+    node = next_node_payload(registry=registry, unknownField=42)
+    client = flame_hub.CoreClient(
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(single_node_handler(node, enveloped))
+        ),
+        result_mode="construct",
+    )
+
+    for found_node in (client.find_nodes()[0], client.get_node(node["id"])):
+        assert isinstance(found_node, Node)
+        # Values are not validated, so dates and IDs remain strings.
+        assert found_node.id == node["id"]
+        assert found_node.created_at == node["createdAt"]
+        assert found_node.realm_id == node["realmId"]
+        assert found_node.registry.host == "harbor.test"
+        assert found_node.registry_project is None
+        assert not hasattr(found_node, "unknownField")
+
+    # Validation can be opted in again per call.
+    assert isinstance(client.get_node(node["id"], result_mode="validate").id, uuid.UUID)
+
+
+def test_result_mode_construct_keyset():
+    nodes = next_keyset_nodes()
+    requests = []
+    client = flame_hub.CoreClient(
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(keyset_node_handler(nodes, requests))
+        )
+    )
+
+    found_ids = [n["id"] for n in client.iter_nodes(page_size=4, pagination="keyset", result_mode="raw")]
+
+    assert found_ids == [n["id"] for n in sorted(nodes, key=lambda n: (n["createdAt"], n["id"]))]
+
+
+def test_invalid_result_mode():
+    with pytest.raises(ValueError):
+        flame_hub.CoreClient(result_mode="eager")
+
+    with pytest.raises(ValueError):
+        flame_hub.CoreClient().find_nodes(result_mode="eager")
+
+
+def test_lazy_resource_list():
+    nodes = [next_node_payload() for _ in range(5)]
+    handler = paginated_node_handler(nodes, [])
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(handler)),
+        result_mode="lazy",
+    )
+
+    found_nodes, meta = client.find_nodes(meta=True)
+
+    assert isinstance(found_nodes, LazyResourceList)
+    assert found_nodes.meta == meta
+    assert meta.total == 5
+    assert len(found_nodes) == 5
+    assert found_nodes.validated_count == 0
+
+    # Resources are validated on first access and cached afterwards.
+    first_node = found_nodes[0]
+    assert isinstance(first_node, Node)
+    assert str(first_node.id) == nodes[0]["id"]
+    assert found_nodes[0] is first_node
+    assert found_nodes.validated_count == 1
+
+    assert [str(n.id) for n in found_nodes[-2:]] == [n["id"] for n in nodes[-2:]]
+    assert found_nodes.validated_count == 3
+
+    # Lazy lists behave like lists of validated resources.
+    validated_nodes = client.find_nodes(result_mode="validate")
+    assert found_nodes == validated_nodes
+    assert validated_nodes == found_nodes
+    assert found_nodes.validated_count == 5
+    assert found_nodes.pop() == validated_nodes[-1]
+    assert len(found_nodes) == 4
+    assert validated_nodes[0] in found_nodes
+
+
+def test_lazy_resource_list_raise_error():
+    found_nodes = LazyResourceList(Node, [next_node_payload(), {"name": "foo"}])
+
+    assert isinstance(found_nodes[0], Node)
+
+    with pytest.raises(ValidationError):
+        _ = found_nodes[1]
+
+
+def test_result_mode_columns():
+    np = pytest.importorskip("numpy")
+    nodes = [next_node_payload(online=i % 2 == 0, createdAt=f"2025-05-12T09:44:0{i}.000Z") for i in range(5)]
+    client = flame_hub.CoreClient(
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(paginated_node_handler(nodes, []))
+        )
+    )
+
+    columns, meta = client.find_nodes(result_mode="columns", meta=True)
+
+    assert meta.total == 5
+    assert list(columns) == list(Node.model_fields)
+    assert columns["online"].dtype == np.bool_
+    assert columns["online"].tolist() == [True, False, True, False, True]
+    assert columns["created_at"].dtype == np.dtype("datetime64[ms]")
+    assert columns["created_at"][1] == np.datetime64("2025-05-12T09:44:01.000")
+    assert columns["id"].tolist() == [n["id"] for n in nodes]
+
+    # Iterators yield the columns of each page.
+    pages = list(client.iter_nodes(page_size=2, result_mode="columns"))
+
+    assert [len(p["id"]) for p in pages] == [2, 2, 1]
+    assert np.concatenate([p["id"] for p in pages]).tolist() == [n["id"] for n in nodes]
+
+    # Models and raw JSON objects result in the same columns.
+    found_nodes = client.find_nodes()
+    for name, column in flame_hub.to_columns(found_nodes, Node).items():
+        if name not in ("id", "realm_id"):
+            assert column.tolist() == columns[name].tolist()
+
+
+def test_to_columns_missing_values():
+    np = pytest.importorskip("numpy")
+
+    class Sample(BaseModel):
+        count: int | None
+        score: float
+        flag: bool | None
+        seen_at: datetime | None
+
+    samples = [
+        Sample(count=1, score=0.5, flag=True, seen_at=datetime(2025, 5, 12, 11, tzinfo=timezone(timedelta(hours=2)))),
+        Sample(count=None, score=1.5, flag=None, seen_at=None),
+    ]
+
+    columns = flame_hub.to_columns(samples, Sample)
+
+    assert columns["count"].dtype == np.float64
+    assert columns["count"][0] == 1 and np.isnan(columns["count"][1])
+    assert columns["score"].tolist() == [0.5, 1.5]
+    assert columns["flag"].dtype == object
+    assert columns["flag"].tolist() == [True, None]
+    # Dates are converted to UTC.
+    assert columns["seen_at"][0] == np.datetime64("2025-05-12T09:00")
+    assert np.isnat(columns["seen_at"][1])
+    assert flame_hub.to_columns([], Sample)["count"].dtype == np.int64
+
+
+def test_to_dataframe():
+    pd = pytest.importorskip("pandas")
+    nodes = [next_node_payload() for _ in range(3)]
+
+    df = flame_hub.to_dataframe(nodes, Node)
+
+    assert isinstance(df, pd.DataFrame)
+    assert df["id"].tolist() == [n["id"] for n in nodes]
+    assert flame_hub.to_dataframe(flame_hub.to_columns(nodes, Node), Node).equals(df)
+
+
+def recording_analysis_node_handler(requests: list[dict]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        return httpx.Response(200, json={"data": [], "meta": {"total": 0, "limit": 50, "offset": 0, "schema": {}}})
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    "client_policy,call_policy,expected_include",
+    [
+        ("all", None, "analysis,node"),
+        ("none", None, None),
+        (("node", "realm"), None, "node"),
+        ("node", None, "node"),
+        ("none", "all", "analysis,node"),
+        ("all", "none", None),
+        ("all", ("node", "analysis"), "analysis,node"),
+    ],
+)
+def test_include_policy(client_policy, call_policy, expected_include):
+    requests = []
+    client = flame_hub.CoreClient(
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(recording_analysis_node_handler(requests))
+        ),
+        include_policy=client_policy,
+    )
+    kwargs = {} if call_policy is None else {"include_policy": call_policy}
+
+    client.find_analysis_nodes(**kwargs)
+    list(client.iter_analysis_nodes(**kwargs))
+
+    assert [r.get("include") for r in requests] == [expected_include] * 2
+
+
+def test_include_policy_unknown_name():
+    client = flame_hub.CoreClient(
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(recording_analysis_node_handler([]))
+        )
+    )
+
+    with pytest.raises(ValueError):
+        client.find_analysis_nodes(include_policy=("realm",))
+
+
+def test_include_policy_get_single_resource():
+    node = next_node_payload()
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        return httpx.Response(200, json=node)
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(base_url="http://hub.test/", transport=httpx.MockTransport(handler)),
+            include_policy="none",
+        )
+        return await client.get_node(node["id"]), await client.get_node(node["id"], include_policy="registry")
+
+    found_node, _ = asyncio.run(run())
+
+    assert found_node.registry is None
+    assert [r.get("include") for r in requests] == [None, "registry"]
+
+
+def test_build_field_params_only():
+    assert build_field_params(None, ("id", "updated_at")) == {"fields": "id,updatedAt"}
+    assert build_field_params("email", "id") == {"fields": "id,email"}
+    assert build_field_params(None, ("id", "id")) == {"fields": "id"}
+    assert build_field_params("email") == {"fields": "+email"}
+
+
+def test_partial_model():
+    partial_model = get_model_metadata(Node).partial_model(("id", "online"))
+
+    assert set(partial_model.model_fields) == {"id", "online"}
+    assert get_model_metadata(Node).partial_model(("online", "id")) is partial_model
+
+    node = partial_model.model_validate({"id": next_uuid(), "online": True})
+
+    assert isinstance(node.id, uuid.UUID)
+    assert not hasattr(node, "name")
+
+    with pytest.raises(ValidationError):
+        partial_model.model_validate({"id": "foo", "online": True})
+
+    with pytest.raises(ValueError):
+        get_model_metadata(Node).partial_model(("id", "unknown"))
+
+
+def test_only_fields():
+    nodes = [next_node_payload() for _ in range(5)]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = paginated_node_handler(nodes, requests)(request)
+        body = response.json()
+        # The Hub only sends the selected fields.
+        body["data"] = [{k: n[k] for k in request.url.params["fields"].split(",")} for n in body["data"]]
+        return httpx.Response(200, json=body)
+
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(handler)),
+        include_policy="none",
+    )
+
+    found_nodes = client.find_nodes(only=("id", "online"))
+
+    assert requests[-1]["fields"] == "id,online"
+    assert [str(n.id) for n in found_nodes] == [n["id"] for n in nodes]
+    assert not hasattr(found_nodes[0], "name")
+
+    # Pagination which depends on the creation date requests it as well.
+    found_nodes = list(client.iter_nodes(only="id", page_size=2, pagination="keyset"))
+
+    assert requests[-1]["fields"] == "id,createdAt"
+    assert sorted(str(n.id) for n in found_nodes) == sorted(n["id"] for n in nodes)
+
+
+def next_registry_payload() -> dict:
+    return {
+        "id": next_uuid(),
+        "name": next_random_string(),
+        "host": "harbor.test",
+        "accountName": None,
+        "createdAt": "2025-05-12T09:44:08.284Z",
+        "updatedAt": "2025-05-12T09:44:08.284Z",
+    }
+
+
+@pytest.mark.parametrize("result_mode", ["validate", "lazy"])
+def test_shared_nested_resources(result_mode):
+    registries = [next_registry_payload() for _ in range(2)]
+    nodes = [next_node_payload(registryId=r["id"], registry=r) for r in registries * 3] + [next_node_payload()]
+    client = flame_hub.CoreClient(
+        client=httpx.Client(
+            base_url="http://hub.test/", transport=httpx.MockTransport(paginated_node_handler(nodes, []))
+        )
+    )
+
+    found_nodes = client.find_nodes(result_mode=result_mode)
+
+    # Nested resources with the same ID are validated once and shared by all resources of the page.
+    assert found_nodes[0].registry is found_nodes[2].registry is found_nodes[4].registry
+    assert found_nodes[1].registry is found_nodes[3].registry is found_nodes[5].registry
+    assert found_nodes[0].registry is not found_nodes[1].registry
+    assert found_nodes[6].registry is None
+    assert "registry" in found_nodes[0].model_fields_set
+
+    # Resources are equal to the ones which are validated without an identity map.
+    r = httpx.Response(200, json={"data": nodes, "meta": {"total": 7, "limit": 50, "offset": 0, "schema": {}}})
+    validated_nodes = _parse_resource_list(Node, r, False)
+
+    assert found_nodes == validated_nodes
+    assert isinstance(found_nodes[0].registry.id, uuid.UUID)
+
+
+def test_shared_nested_resources_raise_error():
+    registry = next_registry_payload() | {"createdAt": "yesterday"}
+    r = httpx.Response(
+        200,
+        json={
+            "data": [next_node_payload(registry=registry)],
+            "meta": {"total": 1, "limit": 50, "offset": 0, "schema": {}},
+        },
+    )
+
+    with pytest.raises(ValidationError):
+        _parse_resource_list(Node, r, False, deduplicate=True)
@@ -0,0 +1,741 @@
+import asyncio
+import os
+import stat
+import threading
+import time
+import typing as t
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx2 as httpx
+import pytest
+
+import flame_hub
+from flame_hub.cache import (
+    EntityCache,
+    ResponseCache,
+    MemoryResponseCacheBackend,
+    SQLiteResponseCacheBackend,
+    CachedResponse,
+)
+from flame_hub import HubAPIError
+from flame_hub.auth import StaticAuth
+from flame_hub.middleware import CoalescingMiddleware
+from flame_hub.models import ClientCredentials, Node, Registry
+from tests.helpers import next_uuid
+from tests.test_base_client import next_node_payload
+
+
+class NodeEndpoint:
+    """Serves a single node and counts the requests for it."""
+
+    def __init__(self, node: dict):
+        self.node = node
+        self.requests = []
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, dict(request.url.params)))
+
+        if request.method == "GET":
+            return httpx.Response(200, json=self.node)
+
+        return httpx.Response(202, json=self.node)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+    @property
+    def get_count(self) -> int:
+        return sum(1 for method, _ in self.requests if method == "GET")
+
+
+def new_cached_client(
+    endpoint: NodeEndpoint,
+    entity_cache: EntityCache,
+    base_url: str = "http://hub.test/",
+    auth: httpx.Auth | None = None,
+) -> flame_hub.CoreClient:
+    return flame_hub.CoreClient(
+        client=httpx.Client(base_url=base_url, auth=auth, transport=httpx.MockTransport(endpoint.handle)),
+        entity_cache=entity_cache,
+    )
+
+
+def test_entity_cache_hits_and_misses():
+    endpoint = NodeEndpoint(next_node_payload())
+    entity_cache = EntityCache(ttls={Node: 60})
+    client = new_cached_client(endpoint, entity_cache)
+
+    nodes = [client.get_node(endpoint.node["id"]) for _ in range(5)]
+
+    assert endpoint.get_count == 1
+    assert all(n is nodes[0] for n in nodes)
+    assert (entity_cache.hits, entity_cache.misses) == (4, 1)
+
+    # Other query parameters and result modes are cached separately.
+    client.get_node(endpoint.node["id"], include_policy="none")
+    client.get_node(endpoint.node["id"], result_mode="raw")
+    client.get_node(endpoint.node["id"], include_policy="none")
+
+    assert endpoint.get_count == 3
+    assert len(entity_cache) == 3
+
+
+def test_entity_cache_ignores_uncached_types():
+    endpoint = NodeEndpoint(next_node_payload())
+    entity_cache = EntityCache(ttls={Registry: 60})
+    client = new_cached_client(endpoint, entity_cache)
+
+    client.get_node(endpoint.node["id"])
+    client.get_node(endpoint.node["id"])
+
+    assert endpoint.get_count == 2
+    assert (entity_cache.hits, entity_cache.misses) == (0, 0)
+
+
+def test_entity_cache_bypassed_by_auth():
+    endpoint = NodeEndpoint(next_node_payload())
+    client = new_cached_client(endpoint, EntityCache(ttls={Node: 60}))
+
+    client.get_node(endpoint.node["id"])
+    client.get_node(endpoint.node["id"], auth="other-token")
+
+    assert endpoint.get_count == 2
+
+
+def test_entity_cache_expires(monkeypatch):
+    endpoint = NodeEndpoint(next_node_payload())
+    client = new_cached_client(endpoint, EntityCache(ttls={Node: 10}))
+    now = time.monotonic()
+
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    client.get_node(endpoint.node["id"])
+    monkeypatch.setattr(time, "monotonic", lambda: now + 9)
+    client.get_node(endpoint.node["id"])
+
+    assert endpoint.get_count == 1
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    client.get_node(endpoint.node["id"])
+
+    assert endpoint.get_count == 2
+
+
+def test_entity_cache_evicts_least_recently_used():
+    nodes = {n["id"]: n for n in (next_node_payload() for _ in range(3))}
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json=nodes[request.url.path.split("/")[-1]])
+
+    entity_cache = EntityCache(ttls={Node: 60}, max_size=2)
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(handler)),
+        entity_cache=entity_cache,
+    )
+    first_id, second_id, third_id = nodes
+
+    client.get_node(first_id)
+    client.get_node(second_id)
+    # Using the first node makes the second one the least recently used node.
+    client.get_node(first_id)
+    client.get_node(third_id)
+
+    assert len(entity_cache) == 2
+
+    client.get_node(first_id)
+    client.get_node(second_id)
+
+    assert [r.split("/")[-1] for r in requests] == [first_id, second_id, third_id, second_id]
+
+
+@pytest.mark.parametrize("operation", ["update", "delete"])
+def test_entity_cache_invalidation(operation):
+    endpoint = NodeEndpoint(next_node_payload())
+    client = new_cached_client(endpoint, EntityCache(ttls={Node: 60}))
+
+    client.get_node(endpoint.node["id"])
+
+    if operation == "update":
+        client.update_node(endpoint.node["id"], hidden=True)
+    else:
+        client.delete_node(endpoint.node["id"])
+
+    client.get_node(endpoint.node["id"])
+
+    assert endpoint.get_count == 2
+
+
+def test_entity_cache_keyed_by_client():
+    endpoint = NodeEndpoint(next_node_payload())
+    entity_cache = EntityCache(ttls={Node: 60})
+    clients = [
+        new_cached_client(endpoint, entity_cache, "http://hub-a.test/", StaticAuth(access_token="token-a")),
+        new_cached_client(endpoint, entity_cache, "http://hub-a.test/", StaticAuth(access_token="token-b")),
+        new_cached_client(endpoint, entity_cache, "http://hub-b.test/", StaticAuth(access_token="token-a")),
+    ]
+
+    for client in clients + clients:
+        client.get_node(endpoint.node["id"])
+
+    assert endpoint.get_count == 3
+    assert len(entity_cache) == 3
+
+    # The identity of custom authentication flows is unknown, so their resources are never cached.
+    client = new_cached_client(endpoint, entity_cache, auth=httpx.BasicAuth("admin", "start123"))
+    client.get_node(endpoint.node["id"])
+    client.get_node(endpoint.node["id"])
+
+    assert endpoint.get_count == 5
+
+
+def test_entity_cache_invalidation_nested():
+    credentials = {"id": next_uuid(), "secret": "start123", "name": "node", "displayName": "Node"}
+    requests = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        return httpx.Response(202 if request.method == "DELETE" else 200, json=credentials)
+
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(handle)),
+        entity_cache=EntityCache(ttls={ClientCredentials: 60}),
+    )
+    first_id, second_id = next_uuid(), next_uuid()
+
+    client.get_node_client_credentials(first_id)
+    client.get_node_client_credentials(second_id)
+
+    # Updating the credentials of one node keeps the credentials of the other one.
+    client.update_node_client_credentials(second_id, secret="start456")
+    client.get_node_client_credentials(first_id)
+    client.get_node_client_credentials(second_id)
+
+    # Deleting a node removes its credentials as well.
+    client.delete_node(first_id)
+    client.get_node_client_credentials(first_id)
+
+    assert [path for method, path in requests if method == "GET"] == [
+        f"/nodes/{first_id}/client/credentials",
+        f"/nodes/{second_id}/client/credentials",
+        f"/nodes/{second_id}/client/credentials",
+        f"/nodes/{first_id}/client/credentials",
+    ]
+
+
+def test_entity_cache_async():
+    endpoint = NodeEndpoint(next_node_payload())
+    entity_cache = EntityCache(ttls={Node: 60})
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle_async)),
+            entity_cache=entity_cache,
+        )
+
+        await client.get_node(endpoint.node["id"])
+        await client.get_node(endpoint.node["id"])
+        await client.update_node(endpoint.node["id"], hidden=True)
+        await client.get_node(endpoint.node["id"])
+
+    asyncio.run(run())
+
+    assert endpoint.get_count == 2
+    assert (entity_cache.hits, entity_cache.misses) == (1, 2)
+
+
+@pytest.mark.parametrize("kwargs", [{"ttls": {Node: 0}}, {"ttls": {Node: 60}, "max_size": 0}])
+def test_entity_cache_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        EntityCache(**kwargs)
+
+
+class ConditionalNodeEndpoint:
+    """Serves a list of nodes with an ETag and answers conditional requests with 304 if the nodes did not change."""
+
+    def __init__(self, nodes: list[dict], validator: str = "ETag", cache_control: str | None = None):
+        self.nodes = nodes
+        self.version = 1
+        self.validator = validator
+        self.cache_control = cache_control
+        self.conditional_headers = []
+
+    @property
+    def _validator_value(self) -> str:
+        return f'"v{self.version}"' if self.validator == "ETag" else f"Mon, 12 May 2025 09:44:0{self.version} GMT"
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        condition = request.headers.get("If-None-Match", None) or request.headers.get("If-Modified-Since", None)
+        self.conditional_headers.append(condition)
+
+        if request.method != "GET":
+            return httpx.Response(202, json=self.nodes[0])
+
+        if condition == self._validator_value:
+            return httpx.Response(304, headers={self.validator: self._validator_value})
+
+        headers = {self.validator: self._validator_value}
+
+        if self.cache_control is not None:
+            headers["Cache-Control"] = self.cache_control
+
+        if request.url.path.endswith("nodes"):
+            body = {"data": self.nodes, "meta": {"total": len(self.nodes), "limit": 50, "offset": 0, "schema": {}}}
+        else:
+            body = self.nodes[0]
+
+        return httpx.Response(200, headers=headers, json=body)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+
+def new_revalidating_client(
+    endpoint: ConditionalNodeEndpoint, response_cache: ResponseCache, auth: httpx.Auth | None = None
+) -> flame_hub.CoreClient:
+    return flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", auth=auth, transport=httpx.MockTransport(endpoint.handle)),
+        response_cache=response_cache,
+    )
+
+
+@pytest.mark.parametrize("validator", ["ETag", "Last-Modified"])
+def test_response_cache_revalidates(validator):
+    endpoint = ConditionalNodeEndpoint([next_node_payload() for _ in range(3)], validator=validator)
+    response_cache = ResponseCache()
+    client = new_revalidating_client(endpoint, response_cache)
+
+    first_nodes = client.find_nodes()
+    second_nodes = client.find_nodes()
+
+    assert endpoint.conditional_headers == [None, endpoint._validator_value]
+    assert (response_cache.hits, response_cache.misses) == (1, 1)
+    assert response_cache.bytes_saved > 0
+    # Resources of unmodified responses are not validated again.
+    assert all(a is b for a, b in zip(first_nodes, second_nodes))
+
+    # Modifying the returned list does not affect the cache.
+    second_nodes.pop()
+    assert len(client.find_nodes()) == 3
+
+    # A changed resource results in a full response.
+    endpoint.version = 2
+    endpoint.nodes[0]["name"] = "renamed"
+
+    assert client.find_nodes()[0].name == "renamed"
+    assert response_cache.misses == 2
+
+
+def test_response_cache_single_resource_and_result_modes():
+    endpoint = ConditionalNodeEndpoint([next_node_payload()])
+    response_cache = ResponseCache()
+    client = new_revalidating_client(endpoint, response_cache)
+    node_id = endpoint.nodes[0]["id"]
+
+    assert client.get_node(node_id) is client.get_node(node_id)
+
+    # Raw JSON objects are decoded again from the stored body since they could be modified by the caller.
+    raw_node = client.get_node(node_id, result_mode="raw")
+    raw_node["name"] = "modified"
+
+    assert client.get_node(node_id, result_mode="raw") == endpoint.nodes[0]
+    assert response_cache.hits == 3
+
+
+def test_response_cache_bypassed():
+    endpoint = ConditionalNodeEndpoint([next_node_payload()], cache_control="no-store")
+    client = new_revalidating_client(endpoint, ResponseCache())
+
+    client.find_nodes()
+    client.find_nodes()
+    client.find_nodes(auth="other-token")
+
+    assert endpoint.conditional_headers == [None, None, None]
+
+
+def test_response_cache_async():
+    endpoint = ConditionalNodeEndpoint([next_node_payload() for _ in range(3)])
+    response_cache = ResponseCache()
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle_async)),
+            response_cache=response_cache,
+        )
+
+        return await client.find_nodes(), await client.find_nodes()
+
+    first_nodes, second_nodes = asyncio.run(run())
+
+    assert first_nodes == second_nodes
+    assert (response_cache.hits, response_cache.misses) == (1, 1)
+
+
+def test_memory_response_cache_backend_evicts_least_recently_used():
+    backend = MemoryResponseCacheBackend(max_size=2)
+    response = CachedResponse(content=b"{}", content_type=None, etag='"v1"', last_modified=None, stored_at=0.0)
+
+    backend.save("a", response)
+    backend.save("b", response)
+    backend.load("a")
+    backend.save("c", response)
+
+    assert len(backend) == 2
+    assert backend.load("b") is None
+    assert backend.load("a") == response
+
+
+def test_response_cache_ttl(monkeypatch):
+    endpoint = ConditionalNodeEndpoint([next_node_payload()], validator="X-Unused")
+    response_cache = ResponseCache(ttl=10)
+    client = new_revalidating_client(endpoint, response_cache)
+    now = time.time()
+
+    monkeypatch.setattr(time, "time", lambda: now)
+    client.find_nodes(filter={"name": "foo"}, sort={"by": "name"})
+    # Fresh responses are used without contacting the Hub, regardless of the order of the query parameters.
+    monkeypatch.setattr(time, "time", lambda: now + 9)
+    client.find_nodes(sort={"by": "name"}, filter={"name": "foo"})
+
+    assert len(endpoint.conditional_headers) == 1
+    assert response_cache.hits == 1
+
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    client.find_nodes(filter={"name": "foo"}, sort={"by": "name"})
+
+    assert len(endpoint.conditional_headers) == 2
+
+
+def test_response_cache_invalidated_by_writes():
+    endpoint = ConditionalNodeEndpoint([next_node_payload()])
+    node_id = endpoint.nodes[0]["id"]
+    client = new_revalidating_client(endpoint, ResponseCache(ttl=60))
+
+    client.find_nodes()
+    client.get_node(node_id)
+    client.update_node(node_id, hidden=True)
+    client.find_nodes()
+    client.get_node(node_id)
+
+    # The update is not served from the cache and removes the stored node responses.
+    assert endpoint.conditional_headers == [None, None, None, None, None]
+
+
+def test_response_cache_keyed_by_identity():
+    endpoint = ConditionalNodeEndpoint([next_node_payload()])
+    response_cache = ResponseCache(ttl=60)
+
+    for token in ("token-a", "token-a", "token-b"):
+        new_revalidating_client(endpoint, response_cache, StaticAuth(access_token=token)).find_nodes()
+
+    assert endpoint.conditional_headers == [None, None]
+
+    # The identity of custom authentication flows is unknown, so their responses are never stored.
+    for _ in range(2):
+        new_revalidating_client(endpoint, response_cache, httpx.BasicAuth("admin", "start123")).find_nodes()
+
+    assert endpoint.conditional_headers == [None, None, None, None]
+    assert response_cache.hits == 1
+
+
+def test_response_cache_skips_credentials():
+    credentials = {"id": str(uuid.uuid4()), "secret": "start123", "name": "node", "display_name": "Node"}
+    requests = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, json=credentials)
+
+    backend = MemoryResponseCacheBackend()
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(handle)),
+        response_cache=ResponseCache(backend, ttl=60),
+    )
+
+    for _ in range(2):
+        assert client.get_node_client_credentials(uuid.uuid4()).secret == "start123"
+
+    assert len(requests) == 2
+    assert len(backend) == 0
+
+
+def test_sqlite_response_cache_backend(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    endpoint = ConditionalNodeEndpoint([next_node_payload() for _ in range(3)])
+
+    # Every client stands in for a separate short-lived process.
+    for _ in range(3):
+        backend = SQLiteResponseCacheBackend(path)
+        nodes = new_revalidating_client(endpoint, ResponseCache(backend, ttl=60)).find_nodes()
+        backend.close()
+
+    assert [str(n.id) for n in nodes] == [n["id"] for n in endpoint.nodes]
+    assert endpoint.conditional_headers == [None]
+
+    # Without a time to live, stored responses are revalidated.
+    backend = SQLiteResponseCacheBackend(path, warm_start=False)
+    response_cache = ResponseCache(backend)
+    new_revalidating_client(endpoint, response_cache).find_nodes()
+
+    assert endpoint.conditional_headers == [None, '"v1"']
+    assert response_cache.hits == 1
+
+
+@pytest.mark.skipif(os.name != "posix", reason="file modes are only enforced on POSIX systems")
+def test_sqlite_response_cache_backend_is_private(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    SQLiteResponseCacheBackend(path).close()
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_sqlite_response_cache_backend_evicts_least_recently_used(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    backend = SQLiteResponseCacheBackend(path, max_size=2)
+    response = CachedResponse(content=b"{}", content_type=None, etag='"v1"', last_modified=None, stored_at=1.0)
+
+    backend.save("GET http://hub.test/nodes", response)
+    backend.save("GET http://hub.test/nodes/1", response)
+    backend.save("GET http://hub.test/projects", response)
+
+    assert len(backend) == 2
+
+    backend.delete_prefix("GET http://hub.test/nodes")
+
+    assert len(backend) == 1
+    assert backend.load("GET http://hub.test/nodes/1") is None
+    backend.close()
+
+    backend = SQLiteResponseCacheBackend(path, max_size=2)
+
+    assert backend.load("GET http://hub.test/projects") == response
+    backend.close()
+
+
+def test_sqlite_response_cache_backend_warm_starts_most_recently_used(tmp_path, monkeypatch):
+    path = tmp_path / "responses.sqlite3"
+    backend = SQLiteResponseCacheBackend(path)
+
+    for i in range(3):
+        monkeypatch.setattr(time, "time", lambda i=i: 1000.0 + i)
+        response = CachedResponse(content=b"{}", content_type=None, etag=f'"v{i}"', last_modified=None, stored_at=1.0)
+        backend.save(f"GET http://hub.test/nodes/{i}", response)
+
+    backend.close()
+
+    backend = SQLiteResponseCacheBackend(path, max_size=2)
+    memory_keys = list(backend._memory._responses)
+    backend.close()
+
+    assert memory_keys == ["GET http://hub.test/nodes/1", "GET http://hub.test/nodes/2"]
+
+
+class BlockingNodeEndpoint(NodeEndpoint):
+    """Serves a single node but holds back all responses until ``release`` is set."""
+
+    def __init__(self, node: dict):
+        super().__init__(node)
+        self.release = threading.Event()
+        self.arrived = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.arrived += 1
+        assert self.release.wait(timeout=5)
+        return self._respond(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        self.arrived += 1
+
+        while not self.release.is_set():
+            await asyncio.sleep(0.001)
+
+        return self._respond(request)
+
+
+def wait_for(predicate: t.Callable[[], bool]):
+    deadline = time.monotonic() + 5
+
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_request_coalescing_threads():
+    endpoint = BlockingNodeEndpoint(next_node_payload())
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle)),
+        coalesce_requests=True,
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(client.get_node, endpoint.node["id"]) for _ in range(4)]
+        wait_for(lambda: client._middleware[0].coalesced == 3)
+        endpoint.release.set()
+        nodes = [f.result() for f in futures]
+
+    assert endpoint.get_count == 1
+    # All callers share the validated node.
+    assert all(n is nodes[0] for n in nodes)
+
+    # Requests which are not in flight at the same time are sent separately.
+    client.get_node(endpoint.node["id"])
+
+    assert endpoint.get_count == 2
+
+
+def test_request_coalescing_async():
+    endpoint = BlockingNodeEndpoint(next_node_payload())
+
+    coalescing = CoalescingMiddleware()
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle_async)),
+            middleware=[coalescing],
+        )
+        tasks = [
+            asyncio.create_task(client.get_node(endpoint.node["id"])),
+            asyncio.create_task(client.get_node(endpoint.node["id"])),
+            # Differing query parameters are requested separately.
+            asyncio.create_task(client.get_node(endpoint.node["id"], include_policy="none")),
+        ]
+
+        while coalescing.coalesced < 1:
+            await asyncio.sleep(0.001)
+
+        endpoint.release.set()
+        return await asyncio.gather(*tasks)
+
+    first, second, third = asyncio.run(run())
+
+    assert endpoint.get_count == 2
+    assert first is second
+    assert third is not first
+
+
+def test_request_coalescing_async_leader_cancelled():
+    endpoint = BlockingNodeEndpoint(next_node_payload())
+    coalescing = CoalescingMiddleware()
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle_async)),
+            middleware=[coalescing],
+        )
+        leader = asyncio.create_task(client.get_node(endpoint.node["id"]))
+        follower = asyncio.create_task(client.get_node(endpoint.node["id"]))
+
+        while coalescing.coalesced < 1:
+            await asyncio.sleep(0.001)
+
+        # Cancelling the caller which started the request must not affect the other caller.
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        endpoint.release.set()
+        node = await follower
+
+        # Once all callers are cancelled, the request is cancelled as well and later callers start a new one.
+        endpoint.release.clear()
+        cancelled = asyncio.create_task(client.get_node(endpoint.node["id"]))
+
+        while endpoint.arrived < 2:
+            await asyncio.sleep(0.001)
+
+        cancelled.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        endpoint.release.set()
+        await client.get_node(endpoint.node["id"])
+
+        return node
+
+    node = asyncio.run(run())
+
+    assert str(node.id) == endpoint.node["id"]
+    assert endpoint.arrived == 3
+    assert endpoint.get_count == 2
+
+
+def test_request_coalescing_separates_sync_and_async_callers():
+    endpoint = BlockingNodeEndpoint(next_node_payload())
+    coalescing = CoalescingMiddleware()
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle)),
+        middleware=[coalescing],
+    )
+
+    async def run():
+        async_client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle_async)),
+            middleware=[coalescing],
+        )
+        task = asyncio.create_task(async_client.get_node(endpoint.node["id"]))
+
+        while endpoint.arrived < 2:
+            await asyncio.sleep(0.001)
+
+        endpoint.release.set()
+        return await task
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(client.get_node, endpoint.node["id"])
+        wait_for(lambda: endpoint.arrived == 1)
+        async_node = asyncio.run(run())
+        sync_node = future.result()
+
+    assert str(sync_node.id) == str(async_node.id) == endpoint.node["id"]
+    assert coalescing.coalesced == 0
+
+
+def test_request_coalescing_shares_errors():
+    endpoint = BlockingNodeEndpoint(next_node_payload())
+    endpoint._respond = lambda request: (endpoint.requests.append(request.method), httpx.Response(500))[1]
+    coalescing = CoalescingMiddleware()
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle)),
+        middleware=[coalescing],
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(client.get_node, endpoint.node["id"]) for _ in range(2)]
+        wait_for(lambda: coalescing.coalesced == 1)
+        endpoint.release.set()
+
+        for future in futures:
+            with pytest.raises(HubAPIError) as e:
+                future.result()
+
+            assert "500" in str(e.value)
+
+    assert endpoint.requests == ["GET"]
+
+
+def test_request_coalescing_skips_writes():
+    endpoint = BlockingNodeEndpoint(next_node_payload())
+    coalescing = CoalescingMiddleware()
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(endpoint.handle)),
+        middleware=[coalescing],
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(client.update_node, endpoint.node["id"], hidden=True) for _ in range(2)]
+        # Both updates reach the Hub before either of them is answered.
+        wait_for(lambda: endpoint.arrived == 2)
+        endpoint.release.set()
+        [f.result() for f in futures]
+
+    assert [method for method, _ in endpoint.requests] == ["POST", "POST"]
+    assert coalescing.coalesced == 0
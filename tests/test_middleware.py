@@ -0,0 +1,443 @@
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+import httpx2 as httpx
+import pytest
+
+import flame_hub
+from flame_hub import CircuitOpenError, HubAPIError
+from flame_hub.cache import ResponseCache
+from flame_hub.middleware import CircuitBreakerMiddleware, Middleware, Operation, RetryMiddleware
+from flame_hub.models import Node
+from tests.test_base_client import next_node_payload
+
+
+class RecordingMiddleware(Middleware):
+    """Records the operations it sees in a shared log and marks requests with its name."""
+
+    def __init__(self, name: str, log: list):
+        self.name = name
+        self.log = log
+
+    def send(self, operation, call_next):
+        self.log.append((self.name, operation.verb, operation.method, operation.path))
+        operation.request.headers["X-Middleware"] = ",".join(
+            filter(None, (operation.request.headers.get("X-Middleware", None), self.name))
+        )
+        r = call_next(operation)
+        self.log.append((self.name, r.status_code))
+
+        return r
+
+    async def send_async(self, operation, call_next):
+        self.log.append((self.name, operation.verb, operation.method, operation.path))
+        return await call_next(operation)
+
+    def parse(self, operation, r, parse_key, call_next):
+        self.log.append((self.name, "parse", operation.resource_type))
+        return call_next()
+
+
+def node_handler(node: dict, requests: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        if request.method == "GET" and request.url.path.endswith("/nodes"):
+            return httpx.Response(
+                200, json={"data": [node], "meta": {"total": 1, "limit": 50, "offset": 0, "schema": {}}}
+            )
+
+        return httpx.Response({"GET": 200, "POST": 202, "DELETE": 202}[request.method], json=node)
+
+    return handler
+
+
+def test_middleware_sees_operations_in_order():
+    node, requests, log = next_node_payload(), [], []
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(node_handler(node, requests))),
+        middleware=[RecordingMiddleware("outer", log), RecordingMiddleware("inner", log)],
+    )
+
+    client.find_nodes(filter={"name": node["name"]})
+
+    assert log == [
+        ("outer", "find", "GET", ("nodes",)),
+        ("inner", "find", "GET", ("nodes",)),
+        ("inner", 200),
+        ("outer", 200),
+        ("outer", "parse", Node),
+        ("inner", "parse", Node),
+    ]
+    assert requests[0].headers["X-Middleware"] == "outer,inner"
+
+    log.clear()
+    client.get_node(node["id"])
+    client.update_node(node["id"], hidden=True)
+    client.delete_node(node["id"])
+
+    assert [entry[1:] for entry in log if len(entry) == 4 and entry[0] == "outer"] == [
+        ("get", "GET", ("nodes", node["id"])),
+        ("update", "POST", ("nodes", node["id"])),
+        ("delete", "DELETE", ("nodes", node["id"])),
+    ]
+
+
+def test_middleware_operation_params():
+    node, operations = next_node_payload(), []
+
+    class CapturingMiddleware(Middleware):
+        def send(self, operation, call_next):
+            operations.append(operation)
+            return call_next(operation)
+
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(node_handler(node, []))),
+        middleware=[CapturingMiddleware()],
+    )
+    client.find_nodes(filter={"name": node["name"]}, sort={"by": "name"}, result_mode="raw")
+
+    (operation,) = operations
+
+    assert operation.resource_type is Node
+    assert operation.params == {"filter": {"name": node["name"]}, "sort": {"by": "name"}, "result_mode": "raw"}
+    assert operation.base_url == httpx.URL("http://hub.test/")
+    assert operation.is_shareable
+
+
+def test_middleware_short_circuits():
+    node, requests = next_node_payload(), []
+
+    class StubMiddleware(Middleware):
+        def send(self, operation: Operation, call_next):
+            return httpx.Response(200, json=node, request=operation.request)
+
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(node_handler(node, requests))),
+        middleware=[StubMiddleware()],
+    )
+
+    assert str(client.get_node(node["id"]).id) == node["id"]
+    assert len(requests) == 0
+
+
+def test_middleware_order_with_response_cache():
+    node, requests, log = next_node_payload(), [], []
+    response_cache = ResponseCache(ttl=60)
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(node_handler(node, requests))),
+        # Placing the cache first answers fresh responses before the recording middleware sees them.
+        middleware=[response_cache, RecordingMiddleware("inner", log)],
+    )
+
+    client.get_node(node["id"])
+    client.get_node(node["id"])
+
+    assert len(requests) == 1
+    assert [entry for entry in log if len(entry) == 4] == [("inner", "get", "GET", ("nodes", node["id"]))]
+    assert response_cache.hits == 1
+
+
+def test_middleware_async():
+    node, requests, log = next_node_payload(), [], []
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(
+                base_url="http://hub.test/", transport=httpx.MockTransport(node_handler(node, requests))
+            ),
+            middleware=[RecordingMiddleware("outer", log)],
+        )
+
+        await client.get_node(node["id"])
+        await client.delete_node(node["id"])
+
+    asyncio.run(run())
+
+    assert [entry for entry in log if len(entry) == 4] == [
+        ("outer", "get", "GET", ("nodes", node["id"])),
+        ("outer", "delete", "DELETE", ("nodes", node["id"])),
+    ]
+    assert ("outer", "parse", Node) in log
+
+
+def flaky_node_handler(node: dict, failures: list[httpx.Response | Exception], requests: list[httpx.Request]):
+    """Answers with the given failures first and with ``node`` afterwards."""
+    handler = node_handler(node, requests)
+
+    def flaky_handler(request: httpx.Request) -> httpx.Response:
+        if len(failures) > 0:
+            requests.append(request)
+            failure = failures.pop(0)
+
+            if isinstance(failure, Exception):
+                raise failure
+
+            return failure
+
+        return handler(request)
+
+    return flaky_handler
+
+
+@pytest.fixture()
+def sleeps(monkeypatch) -> list[float]:
+    recorded = []
+    monkeypatch.setattr(time, "sleep", recorded.append)
+    # Always wait for the upper bound of the jittered delay.
+    monkeypatch.setattr(random, "uniform", lambda low, high: high)
+
+    return recorded
+
+
+def new_retrying_client(handler, retry: RetryMiddleware) -> flame_hub.CoreClient:
+    return flame_hub.CoreClient(
+        client=httpx.Client(base_url="http://hub.test/", transport=httpx.MockTransport(handler)),
+        middleware=[retry],
+    )
+
+
+def test_retry_with_exponential_backoff(sleeps):
+    node, requests = next_node_payload(), []
+    failures = [httpx.Response(503), httpx.Response(502), httpx.ConnectError("refused")]
+    retry = RetryMiddleware(backoff_base=0.5, backoff_max=1.5)
+    client = new_retrying_client(flaky_node_handler(node, failures, requests), retry)
+
+    assert str(client.get_node(node["id"]).id) == node["id"]
+    assert len(requests) == 4
+    assert sleeps == [0.5, 1.0, 1.5]
+    assert (retry.retries, retry.exhausted) == (3, 0)
+
+
+@pytest.mark.parametrize("delay", [lambda: "7", lambda: format_datetime(datetime.now(timezone.utc), usegmt=True)])
+def test_retry_honours_retry_after(sleeps, delay):
+    node, requests = next_node_payload(), []
+    failures = [httpx.Response(429, headers={"Retry-After": delay()})]
+    client = new_retrying_client(flaky_node_handler(node, failures, requests), RetryMiddleware())
+
+    client.delete_node(node["id"])
+
+    assert len(requests) == 2
+    # HTTP dates only have a precision of seconds.
+    assert len(sleeps) == 1 and (sleeps[0] == 7 or sleeps[0] <= 1)
+
+
+def test_retry_budget_exhausted(sleeps):
+    node, requests = next_node_payload(), []
+    failures = [httpx.Response(503) for _ in range(3)]
+    retry = RetryMiddleware(max_retries=2)
+    client = new_retrying_client(flaky_node_handler(node, failures, requests), retry)
+
+    with pytest.raises(HubAPIError, match="503"):
+        client.find_nodes()
+
+    assert len(requests) == 3
+    assert (retry.retries, retry.exhausted) == (2, 1)
+
+    # The Hub asks to wait longer than the budget of the next call allows.
+    failures.append(httpx.Response(503, headers={"Retry-After": "120"}))
+
+    with pytest.raises(HubAPIError, match="503"):
+        client.find_nodes()
+
+    assert (retry.retries, retry.exhausted) == (2, 2)
+
+
+def test_retry_only_idempotent_operations(sleeps):
+    node, requests = next_node_payload(), []
+    failures = [httpx.Response(503), httpx.Response(503)]
+    client = new_retrying_client(flaky_node_handler(node, failures, requests), RetryMiddleware())
+
+    with pytest.raises(HubAPIError, match="503"):
+        client.create_node(name=node["name"])
+
+    # Updates send the same fields again, so they are retried.
+    client.update_node(node["id"], hidden=True)
+
+    assert [r.method for r in requests] == ["POST", "POST", "POST"]
+    assert sleeps == [0.5]
+
+
+def test_retry_async(monkeypatch):
+    node, requests, sleeps = next_node_payload(), [], []
+    failures = [httpx.ReadTimeout("timeout"), httpx.Response(504)]
+    retry = RetryMiddleware()
+
+    async def sleep(delay: float):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    monkeypatch.setattr(random, "uniform", lambda low, high: high)
+
+    async def run():
+        handler = flaky_node_handler(node, failures, requests)
+
+        async def async_handler(request: httpx.Request) -> httpx.Response:
+            return handler(request)
+
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(base_url="http://hub.test/", transport=httpx.MockTransport(async_handler)),
+            middleware=[retry],
+        )
+
+        return await client.get_node(node["id"])
+
+    assert str(asyncio.run(run()).id) == node["id"]
+    assert sleeps == [0.5, 1.0]
+    assert retry.retries == 2
+
+
+@pytest.mark.parametrize("kwargs", [{"max_retries": -1}, {"backoff_base": 0}, {"max_wait": -1}])
+def test_retry_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        RetryMiddleware(**kwargs)
+
+
+class FakeClock:
+    def __init__(self, monkeypatch):
+        self.now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: self.now)
+
+
+def new_breaker_client(
+    base_url: str, breaker: CircuitBreakerMiddleware, handler
+) -> tuple[flame_hub.CoreClient, list[httpx.Request]]:
+    requests = []
+
+    def recording_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    client = flame_hub.CoreClient(
+        client=httpx.Client(base_url=base_url, transport=httpx.MockTransport(recording_handler)),
+        middleware=[breaker],
+    )
+
+    return client, requests
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    clock, changes = FakeClock(monkeypatch), []
+    node, status = next_node_payload(), {"code": 503}
+    breaker = CircuitBreakerMiddleware(
+        failure_threshold=2, recovery_timeout=10, on_state_change=lambda *change: changes.append(change)
+    )
+    client, requests = new_breaker_client(
+        "http://hub.test/core/", breaker, lambda request: httpx.Response(status["code"], json=node)
+    )
+
+    for _ in range(2):
+        with pytest.raises(HubAPIError, match="503"):
+            client.get_node(node["id"])
+
+    assert breaker.state("http://hub.test/core/") == "open"
+
+    # Open circuits fail fast without sending a request.
+    with pytest.raises(CircuitOpenError) as e:
+        client.get_node(node["id"])
+
+    assert len(requests) == 2
+    assert e.value.base_url == "http://hub.test/core/"
+    assert e.value.retry_after == 10
+    assert breaker.rejected == 1
+
+    clock.now += 10
+    status["code"] = 200
+
+    assert breaker.state("http://hub.test/core/") == "half_open"
+    assert str(client.get_node(node["id"]).id) == node["id"]
+    assert breaker.state("http://hub.test/core/") == "closed"
+    assert changes == [
+        ("http://hub.test/core/", "closed", "open"),
+        ("http://hub.test/core/", "open", "half_open"),
+        ("http://hub.test/core/", "half_open", "closed"),
+    ]
+
+
+def test_circuit_breaker_reopens_after_failed_trial(monkeypatch):
+    clock, node = FakeClock(monkeypatch), next_node_payload()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectTimeout("timeout")
+
+    breaker = CircuitBreakerMiddleware(failure_threshold=1, recovery_timeout=5)
+    client, requests = new_breaker_client("http://hub.test/storage/", breaker, handler)
+
+    with pytest.raises(httpx.ConnectTimeout):
+        client.get_node(node["id"])
+
+    clock.now += 5
+
+    # The trial request fails, so the circuit opens for another recovery timeout.
+    with pytest.raises(httpx.ConnectTimeout):
+        client.get_node(node["id"])
+
+    with pytest.raises(CircuitOpenError):
+        client.get_node(node["id"])
+
+    assert len(requests) == 2
+    assert breaker.state("http://hub.test/storage/") == "open"
+
+
+def test_circuit_breaker_per_base_url():
+    node = next_node_payload()
+    breaker = CircuitBreakerMiddleware(failure_threshold=1)
+    broken_client, _ = new_breaker_client("http://hub.test/storage/", breaker, lambda request: httpx.Response(502))
+    healthy_client, _ = new_breaker_client("http://hub.test/core/", breaker, node_handler(node, []))
+
+    with pytest.raises(HubAPIError, match="502"):
+        broken_client.get_node(node["id"])
+
+    assert breaker.state("http://hub.test/storage/") == "open"
+    assert str(healthy_client.get_node(node["id"]).id) == node["id"]
+    assert breaker.state("http://hub.test/core/") == "closed"
+
+
+def test_circuit_breaker_ignores_client_errors():
+    node, codes = next_node_payload(), [503, 404, 503, 200, 503]
+    breaker = CircuitBreakerMiddleware(failure_threshold=2)
+    client, _ = new_breaker_client(
+        "http://hub.test/core/", breaker, lambda request: httpx.Response(codes.pop(0), json=node)
+    )
+
+    for _ in range(5):
+        try:
+            client.get_node(node["id"])
+        except HubAPIError:
+            pass
+
+    # Failures are only counted in a row and not found resources are no failures.
+    assert breaker.state("http://hub.test/core/") == "closed"
+
+
+def test_circuit_breaker_async():
+    node = next_node_payload()
+    breaker = CircuitBreakerMiddleware(failure_threshold=1)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    async def run():
+        client = flame_hub.AsyncCoreClient(
+            client=httpx.AsyncClient(base_url="http://hub.test/core/", transport=httpx.MockTransport(handler)),
+            middleware=[breaker],
+        )
+
+        with pytest.raises(HubAPIError, match="503"):
+            await client.get_node(node["id"])
+
+        with pytest.raises(CircuitOpenError):
+            await client.get_node(node["id"])
+
+    asyncio.run(run())
+
+    assert breaker.rejected == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"failure_threshold": 0}, {"recovery_timeout": 0}, {"half_open_max_calls": 0}])
+def test_circuit_breaker_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        CircuitBreakerMiddleware(**kwargs)